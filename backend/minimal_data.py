@@ -1,63 +0,0 @@
-# Create file: backend/minimal_data.py
-# Run with: python manage.py shell < minimal_data.py
-
-print("🚀 Creating minimal working data...")
-
-from django.utils import timezone
-from projects.models import *
-from portfolio_backend.core.models import *
-from portfolio_backend.blog.models import *
-
-# Just check if your site is already working
-try:
-    # Test basic data creation with minimal requirements
-    print("✅ Site configuration already exists" if SiteConfiguration.objects.exists() else "✅ Site config created")
-    print("✅ Career highlights already exist" if CareerHighlight.objects.exists() else "✅ Career highlights created")
-    
-    # Create only what's absolutely necessary
-    if not Project.objects.exists():
-        try:
-            # Create a simple project without tech categories to avoid the error
-            project = Project.objects.create(
-                title="Portfolio Website",
-                slug="portfolio-website",
-                tagline="Modern portfolio built with Django and Next.js",
-                is_featured=True,
-                is_published=True
-            )
-            print("✅ Created basic project")
-        except Exception as e:
-            print(f"⚠️  Project creation issue: {e}")
-    
-    # Create a simple blog post
-    if not BlogPost.objects.exists():
-        try:
-            BlogPost.objects.create(
-                title="Welcome to My Portfolio",
-                slug="welcome-to-my-portfolio",
-                excerpt="An introduction to my work and experience in AI engineering.",
-                content="# Welcome\n\nI'm an Applied AI Engineer passionate about building production systems.",
-                category="career",
-                is_published=True
-            )
-            print("✅ Created basic blog post")
-        except Exception as e:
-            print(f"⚠️  Blog post creation issue: {e}")
-    
-    print("\n🎉 Minimal data setup complete!")
-    print("🔗 Start your servers:")
-    print("   Backend: python manage.py runserver")
-    print("   Frontend: cd ../frontend && npm run dev")
-    print("🔗 Test: http://localhost:3000")
-    
-except Exception as e:
-    print(f"⚠️  Issue during setup: {e}")
-    print("📝 Your portfolio should still work with existing data")
-    print("🔗 Just start the servers and test!")
-    
-print("\n🚀 READY FOR PRODUCTION!")
-print("📋 Next Steps:")
-print("1. Start backend: python manage.py runserver")
-print("2. Start frontend: cd ../frontend && npm run dev")
-print("3. Check http://localhost:3000")
-print("4. Add content via admin: http://127.0.0.1:8000/admin")
\ No newline at end of file
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+class BlogConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'portfolio_backend.blog'
+    label = 'blog'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,49 @@
+# backend/portfolio_backend/blog/async_views.py
+from asgiref.sync import sync_to_async
+
+from portfolio_backend.core.async_views import json_response, not_found, paginate, sparse_fields
+from portfolio_backend.core.conditional import conditional
+from portfolio_backend.core.response_cache import cache_response
+from . import view_counter
+from .views import (
+    POST_DETAIL_FIELDS,
+    POST_LIST_FIELDS,
+    filtered_posts,
+    post_detail_data,
+    post_detail_validators,
+    post_list_data,
+    post_list_validators,
+    published_post,
+)
+
+
+@conditional(post_list_validators)
+@cache_response('blog')
+@sparse_fields(POST_LIST_FIELDS)
+async def blog_posts_list(request, selection=None):
+    """Get published blog posts, one keyset page at a time"""
+    # Search reads the in-process index (or builds a lazy queryset on postgres)
+    posts, pagination_class = await sync_to_async(filtered_posts)(request.GET, selection)
+    data = await paginate(request, posts, lambda page: [post_list_data(post, selection) for post in page], pagination_class)
+    if data is None:
+        return not_found(pagination_class.invalid_cursor_message)
+    return json_response(data)
+
+
+@sync_to_async
+def pending_views(post_id):
+    # A network round trip with the cache-backed counter
+    return view_counter.pending_views(post_id)
+
+
+@conditional(post_detail_validators)
+@sparse_fields(POST_DETAIL_FIELDS)
+async def blog_post_detail(request, slug, selection=None):
+    """Get detailed blog post"""
+    post = await published_post(slug, selection).afirst()
+    if post is None:
+        return json_response({'error': 'Blog post not found'}, status=404)
+
+    # The view was recorded (buffered) by post_detail_validators
+    pending = await pending_views(post['id'])
+    return json_response(post_detail_data(post, post['views'] + pending, selection))
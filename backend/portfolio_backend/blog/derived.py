@@ -0,0 +1,46 @@
+# backend/portfolio_backend/blog/derived.py
+"""
+Fields derived from a post's content: word count, reading time and the
+rendered HTML (see core.markup). Used by BlogPost.save and by the
+recompute_derived command's worker processes, so this module must not import
+models or anything that needs Django set up.
+"""
+import math
+import re
+
+from portfolio_backend.core import markup
+
+WORDS = re.compile(r'\w+')
+WORDS_PER_MINUTE = 200
+
+COUNT_FIELDS = ['word_count', 'reading_time']
+RENDERED_FIELDS = ['content_html', 'content_toc', 'content_hash']
+
+
+def post_fields(content, content_hash=''):
+    """
+    Derived column values for `content`. The rendered fields are only included
+    when the content no longer matches `content_hash`.
+    """
+    words = len(WORDS.findall(content))
+    fields = {'word_count': words, 'reading_time': max(1, math.ceil(words / WORDS_PER_MINUTE))}
+    digest = markup.content_hash(content)
+    if digest != content_hash:
+        fields['content_html'], fields['content_toc'] = markup.render_markdown(content)
+        fields['content_hash'] = digest
+    return fields
+
+
+def recompute_rows(rows):
+    """
+    [(pk, content, content_hash, word_count, reading_time)] -> [(pk, changed fields)]
+    for the rows whose derived values differ from the stored ones
+    """
+    changed = []
+    for pk, content, content_hash, word_count, reading_time in rows:
+        fields = post_fields(content, content_hash)
+        if (fields['word_count'], fields['reading_time']) == (word_count, reading_time):
+            del fields['word_count'], fields['reading_time']
+        if fields:
+            changed.append((pk, fields))
+    return changed
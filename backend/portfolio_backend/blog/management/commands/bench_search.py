@@ -0,0 +1,90 @@
+# backend/portfolio_backend/blog/management/commands/bench_search.py
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from portfolio_backend.blog import search
+from portfolio_backend.blog.models import BlogPost
+
+TOPIC_WORDS = (
+    "model agent vector retrieval latency python django postgres index cache "
+    "embedding prompt pipeline inference gpu batch token context graph query "
+    "deploy cloud serverless throughput monitoring evaluation dataset training"
+).split()
+FILLER_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare ranked full-text search with the old icontains filter on "
+        "synthetic posts. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000])
+        parser.add_argument('--queries', nargs='+', default=['retrieval latency', 'postgres', 'gpu inference'])
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--words', type=int, default=600, help="Words of content per post")
+
+    def handle(self, *args, **options):
+        for size in options['sizes']:
+            with transaction.atomic():
+                self.seed(size, options['words'])
+                self.report(size, options['queries'], options['repeat'])
+                transaction.set_rollback(True)
+            search._index = None
+
+    def seed(self, size, words):
+        rng = random.Random(size)
+        search._index = None
+        # Zipf-like vocabulary: a long tail of filler words plus topic words
+        # that each appear in only a fraction of posts, so queries are selective.
+        vocabulary = [f"w{i}" for i in range(FILLER_SIZE)] + TOPIC_WORDS
+        weights = [1 / (rank + 1) for rank in range(FILLER_SIZE)] + [0.0005] * len(TOPIC_WORDS)
+
+        def text(n):
+            return " ".join(rng.choices(vocabulary, weights, k=n))
+
+        start = time.perf_counter()
+        BlogPost.objects.bulk_create(
+            (
+                BlogPost(
+                    title=text(6), slug=f"bench-{i}", excerpt=text(30), content=text(words),
+                    category='technical', reading_time=3, is_published=True,
+                )
+                for i in range(size)
+            ),
+            batch_size=2000,
+        )
+        search.refresh_search_vectors(BlogPost.objects.filter(slug__startswith='bench-'))
+        self.stdout.write(f"\n{size} posts seeded in {time.perf_counter() - start:.1f}s")
+
+        if not search.uses_postgres():
+            start = time.perf_counter()
+            search.get_index()
+            self.stdout.write(f"In-process index built in {time.perf_counter() - start:.1f}s")
+
+    def time_ms(self, fn, repeat):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+    def report(self, size, queries, repeat):
+        published = BlogPost.objects.filter(is_published=True, slug__startswith='bench-')
+        backend = 'tsvector+GIN' if search.uses_postgres() else 'inverted index'
+        self.stdout.write(f"{'query':<22}{'icontains ms':>14}{backend + ' ms':>22}{'hits':>10}")
+        for query in queries:
+            icontains = published.filter(
+                Q(title__icontains=query) | Q(excerpt__icontains=query) | Q(content__icontains=query)
+            ).order_by('-published_date')
+            old_ms = self.time_ms(lambda: list(icontains.all()), repeat)
+            new_ms = self.time_ms(lambda: list(search.search_posts(published, query)), repeat)
+            hits = len(list(search.search_posts(published, query)))
+            self.stdout.write(f"{query:<22}{old_ms:>14.1f}{new_ms:>22.1f}{hits:>10}")
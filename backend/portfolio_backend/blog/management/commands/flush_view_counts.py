@@ -0,0 +1,20 @@
+# backend/portfolio_backend/blog/management/commands/flush_view_counts.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_backend.blog import view_counter
+
+
+class Command(BaseCommand):
+    help = "Write every worker's buffered blog post view counts to the database (cache backend only)"
+
+    def handle(self, *args, **options):
+        if settings.BLOG_VIEW_COUNTER_BACKEND != 'cache':
+            # The local backend buffers in each worker's memory, which this
+            # process cannot reach; the workers' own timers flush those
+            raise CommandError(
+                "flush_view_counts needs BLOG_VIEW_COUNTER_BACKEND=cache (the default when "
+                "REDIS_URL is set); with the local backend each worker flushes its own views"
+            )
+        flushed = view_counter.flush(scan_all=True)
+        self.stdout.write(self.style.SUCCESS(f"Flushed {flushed} buffered view(s)"))
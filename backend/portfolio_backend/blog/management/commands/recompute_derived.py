@@ -0,0 +1,113 @@
+# backend/portfolio_backend/blog/management/commands/recompute_derived.py
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from portfolio_backend.blog import derived
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.core import response_cache
+
+COLUMNS = ('pk', 'content', 'content_hash', 'word_count', 'reading_time')
+DEFAULT_CHECKPOINT = os.path.join(tempfile.gettempdir(), 'recompute_derived.json')
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute word count, reading time and rendered HTML for every blog post. "
+        "Streams posts in primary key order, computes in a process pool and writes "
+        "back with bulk_update; --resume continues after the last committed chunk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help="Posts per read, task and bulk_update")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Worker processes (0 computes in this process)")
+        parser.add_argument('--force', action='store_true',
+                            help="Re-render HTML even where the content hash matches")
+        parser.add_argument('--resume', action='store_true', help="Continue from the checkpoint file")
+        parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT,
+                            help="Where the last committed primary key is kept")
+
+    def handle(self, *args, **options):
+        start_after = self.read_checkpoint(options['checkpoint']) if options['resume'] else 0
+        posts = BlogPost.objects.filter(pk__gt=start_after).order_by('pk')
+        total = posts.count()
+        if start_after:
+            self.stdout.write(f"Resuming after post {start_after}, {total} left")
+
+        rows = posts.values_list(*COLUMNS).iterator(chunk_size=options['chunk_size'])
+        if options['force']:
+            rows = ((pk, content, '', *rest) for pk, content, _, *rest in rows)
+        chunks = iter(lambda: list(islice(rows, options['chunk_size'])), [])
+
+        done = updated = 0
+        started = last_report = time.perf_counter()
+        for chunk, changed in self.compute(chunks, options['workers']):
+            with transaction.atomic():
+                updated += self.write(changed)
+            # Only after the chunk is committed
+            self.write_checkpoint(options['checkpoint'], chunk[-1][0])
+            done += len(chunk)
+            if time.perf_counter() - last_report >= 1 or done == total:
+                last_report = time.perf_counter()
+                self.stdout.write(
+                    f"  {done}/{total} posts ({done / (last_report - started):.0f}/s), {updated} updated"
+                )
+
+        if updated:
+            # bulk_update sends no signals
+            response_cache.invalidate('blog')
+        if os.path.exists(options['checkpoint']):
+            os.remove(options['checkpoint'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomputed {done} post(s) in {time.perf_counter() - started:.1f}s, {updated} updated"
+        ))
+
+    def compute(self, chunks, workers):
+        """Yield (chunk, changed rows) in order, with at most two chunks per worker in flight"""
+        if workers < 1:
+            for chunk in chunks:
+                yield chunk, derived.recompute_rows(chunk)
+            return
+
+        # spawn: workers start clean instead of inheriting this process's database connections
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, pool.submit(derived.recompute_rows, chunk)))
+                if len(pending) >= workers * 2:
+                    chunk, future = pending.popleft()
+                    yield chunk, future.result()
+            while pending:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+
+    def write(self, changed):
+        # Rows differ in which fields changed; bulk_update needs one field list per call
+        by_fields = defaultdict(list)
+        for pk, fields in changed:
+            by_fields[tuple(sorted(fields))].append(BlogPost(pk=pk, **fields))
+        for fields, posts in by_fields.items():
+            BlogPost.objects.bulk_update(posts, fields)
+        return len(changed)
+
+    def read_checkpoint(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)['last_pk']
+        except FileNotFoundError:
+            self.stdout.write(f"No checkpoint at {path}; starting from the beginning")
+            return 0
+
+    def write_checkpoint(self, path, last_pk):
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'last_pk': last_pk}, f)
+        os.replace(path + '.tmp', path)
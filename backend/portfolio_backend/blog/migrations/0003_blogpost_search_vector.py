@@ -0,0 +1,38 @@
+# Generated by Django 5.0 on 2026-10-18 10:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def populate_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from django.contrib.postgres.search import SearchVector
+
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    BlogPost.objects.update(search_vector=(
+        SearchVector('title', weight='A', config='english')
+        + SearchVector('excerpt', weight='B', config='english')
+        + SearchVector('content', weight='C', config='english')
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_contactsubmission_blogpost_is_featured_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blog_post_search_gin'),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_blogpost_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-published_date', 'id'], name='blog_post_keyset_idx'),
+        ),
+    ]
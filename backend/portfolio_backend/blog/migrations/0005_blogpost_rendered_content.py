@@ -0,0 +1,41 @@
+# Generated by Django 5.0 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+def render_existing_posts(apps, schema_editor):
+    from portfolio_backend.core import markup
+
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    posts = []
+    for post in BlogPost.objects.only('content').iterator(chunk_size=500):
+        post.content_html, post.content_toc = markup.render_markdown(post.content)
+        post.content_hash = markup.content_hash(post.content)
+        posts.append(post)
+    BlogPost.objects.bulk_update(posts, ['content_html', 'content_toc', 'content_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_blogpost_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_toc',
+            field=models.JSONField(default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_blogpost_rendered_content'),
+    ]
+
+    # Existing rows are filled by `manage.py recompute_derived`
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+    ]
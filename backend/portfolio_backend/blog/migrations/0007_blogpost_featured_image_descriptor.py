@@ -0,0 +1,30 @@
+# Generated by Django 5.0 on 2026-10-18 17:30
+
+from django.db import migrations, models
+
+
+def build_descriptors(apps, schema_editor):
+    from portfolio_backend.core.images import build_descriptor
+
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    posts = []
+    for post in BlogPost.objects.exclude(featured_image='').exclude(featured_image__isnull=True):
+        post.featured_image_descriptor = build_descriptor(post.featured_image)
+        posts.append(post)
+    BlogPost.objects.bulk_update(posts, ['featured_image_descriptor'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_blogpost_word_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='featured_image_descriptor',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(build_descriptors, migrations.RunPython.noop),
+    ]
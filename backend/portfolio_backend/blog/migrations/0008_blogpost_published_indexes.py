@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_blogpost_featured_image_descriptor'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='blog_post_keyset_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-published_date', 'id'], name='blog_post_published_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['category', '-published_date', 'id'], name='blog_post_category_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['updated_date'], name='blog_post_published_upd_idx'),
+        ),
+    ]
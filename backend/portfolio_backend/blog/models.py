@@ -1,9 +1,16 @@
 # backend/portfolio_backend/blog/models.py
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.utils.text import slugify
 from cloudinary.models import CloudinaryField
-import re
-import math
+from portfolio_backend.core import images, response_cache
+
+from . import derived
+
+CATEGORY_COUNTS_CACHE_KEY = 'blog:category-counts:{version}'
 
 
 class BlogPost(models.Model):
@@ -21,24 +28,67 @@ class BlogPost(models.Model):
     content = models.TextField(help_text="Markdown supported")
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     featured_image = CloudinaryField('image', blank=True)
+    # URL + srcset of featured_image, rebuilt in save() when it changes (core.images)
+    featured_image_descriptor = models.JSONField(null=True, blank=True, editable=False)
     reading_time = models.IntegerField(editable=False)  # Auto-calculated
+    word_count = models.IntegerField(default=0, editable=False)
     published_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
+    is_featured = models.BooleanField(default=False)
     views = models.IntegerField(default=0)
     
+    # SEO (added in migration 0002)
+    meta_description = models.CharField(max_length=160, blank=True)
+    meta_keywords = models.CharField(max_length=500, blank=True)
+    
+    # Rendered from `content` in save(), see core.markup
+    content_html = models.TextField(blank=True, editable=False)
+    content_toc = models.JSONField(default=list, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    
+    # Weighted title/excerpt/content tsvector, maintained in save() (PostgreSQL only)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    SEARCH_FIELDS = {'title', 'excerpt', 'content'}
+    
     class Meta:
         ordering = ['-published_date']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='blog_post_search_gin'),
+            # Partial indexes over published posts, for the public queries:
+            # keyset pagination order (PostPagination), with and without ?category=
+            # (also serves the per-category counts) ...
+            models.Index(fields=['-published_date', 'id'], name='blog_post_published_keyset_idx',
+                         condition=models.Q(is_published=True)),
+            models.Index(fields=['category', '-published_date', 'id'], name='blog_post_category_keyset_idx',
+                         condition=models.Q(is_published=True)),
+            # ... and the list ETag probe, Max(updated_date)
+            models.Index(fields=['updated_date'], name='blog_post_published_upd_idx',
+                         condition=models.Q(is_published=True)),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
         
-        # Calculate reading time (average 200 words per minute)
-        word_count = len(re.findall(r'\w+', self.content))
-        self.reading_time = max(1, math.ceil(word_count / 200))
+        # Word count, reading time and rendered HTML (skipped if the content is unchanged)
+        fields = derived.post_fields(self.content, self.content_hash)
+        for name, value in fields.items():
+            setattr(self, name, value)
+        if kwargs.get('update_fields') is not None and 'content' in kwargs['update_fields']:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *fields}
+        
+        changed = images.refresh_descriptors(self, {'featured_image': 'featured_image_descriptor'})
+        if changed and kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *changed}
         
         super().save(*args, **kwargs)
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or self.SEARCH_FIELDS.intersection(update_fields):
+            from .search import refresh_search_vectors
+            refresh_search_vectors(BlogPost.objects.filter(pk=self.pk))
     
     def __str__(self):
         return self.title
@@ -63,4 +113,27 @@ class BlogCategory(models.Model):
     
     @property
     def post_count(self):
-        return BlogPost.objects.filter(category=self.slug, is_published=True).count()
\ No newline at end of file
+        return published_category_counts().get(self.slug, 0)
+
+
+def published_category_counts():
+    """
+    {category: published post count} from one GROUP BY.
+
+    Cached under the ``blog`` response-cache version, so a post saved in this
+    process starts a new entry, and for BLOG_CATEGORY_COUNTS_TIMEOUT seconds at
+    most, which bounds how long a change made through another worker (whose
+    signals never reach this one's local-memory cache) goes unseen.
+    """
+    version, = response_cache.group_versions(['blog'])
+    key = CATEGORY_COUNTS_CACHE_KEY.format(version=version)
+    counts = cache.get(key)
+    if counts is None:
+        counts = dict(
+            BlogPost.objects.filter(is_published=True)
+            .order_by()
+            .values_list('category')
+            .annotate(count=models.Count('id'))
+        )
+        cache.set(key, counts, settings.BLOG_CATEGORY_COUNTS_TIMEOUT)
+    return counts
\ No newline at end of file
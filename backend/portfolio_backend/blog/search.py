@@ -0,0 +1,166 @@
+# backend/portfolio_backend/blog/search.py
+"""
+Full-text search for blog posts.
+
+On PostgreSQL, posts carry a weighted ``search_vector`` (title A, excerpt B,
+content C) backed by a GIN index and kept current by ``BlogPost.save``; queries
+are matched with ``websearch_to_tsquery`` and ordered by ``ts_rank``.
+
+Other databases (SQLite in tests and local dev) use an in-process inverted
+index with the same weights and the same API, built lazily on first search and
+updated from post_save/post_delete signals.
+"""
+import re
+import threading
+from collections import Counter, defaultdict
+
+from django.db import connection
+from django.db.models.query import ModelIterable
+
+# Same relative weights PostgreSQL's ts_rank uses for A/B/C labels
+FIELD_WEIGHTS = {'title': 1.0, 'excerpt': 0.4, 'content': 0.2}
+SEARCH_CONFIG = 'english'
+
+
+def uses_postgres():
+    return connection.vendor == 'postgresql'
+
+
+def weighted_search_vector():
+    from django.contrib.postgres.search import SearchVector
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('excerpt', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('content', weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def refresh_search_vectors(queryset):
+    """Recompute search_vector in the database for every post in `queryset`"""
+    if uses_postgres():
+        queryset.update(search_vector=weighted_search_vector())
+
+
+def tokenize(text):
+    return re.findall(r'\w+', text.lower())
+
+
+class InvertedIndex:
+    """Term -> {post_id: weighted term frequency}, for databases without tsvector"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = defaultdict(dict)
+        self._terms_by_post = {}
+
+    def _scores(self, fields):
+        scores = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(fields.get(field) or ''):
+                scores[term] += weight
+        return scores
+
+    def add(self, post_id, **fields):
+        scores = self._scores(fields)
+        with self._lock:
+            self._remove(post_id)
+            for term, score in scores.items():
+                self._postings[term][post_id] = score
+            self._terms_by_post[post_id] = set(scores)
+
+    def remove(self, post_id):
+        with self._lock:
+            self._remove(post_id)
+
+    def _remove(self, post_id):
+        for term in self._terms_by_post.pop(post_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(post_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def search(self, query):
+        """Return [(post_id, rank)] for posts containing every query term, best first"""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        with self._lock:
+            postings = [self._postings.get(term, {}) for term in terms]
+            postings.sort(key=len)
+            matches = set(postings[0])
+            for posting in postings[1:]:
+                matches &= posting.keys()
+            ranked = [(pk, sum(p[pk] for p in postings)) for pk in matches]
+        ranked.sort(key=lambda item: (-item[1], -item[0]))
+        return ranked
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    global _index
+    if _index is None:
+        from .models import BlogPost
+        with _index_lock:
+            if _index is None:
+                index = InvertedIndex()
+                rows = BlogPost.objects.values_list('pk', 'title', 'excerpt', 'content')
+                for pk, title, excerpt, content in rows.iterator(chunk_size=2000):
+                    index.add(pk, title=title, excerpt=excerpt, content=content)
+                _index = index
+    return _index
+
+
+def index_post(post):
+    if _index is not None and not uses_postgres():
+        _index.add(post.pk, title=post.title, excerpt=post.excerpt, content=post.content)
+
+
+def unindex_post(post_id):
+    if _index is not None:
+        _index.remove(post_id)
+
+
+def search_posts(queryset, query):
+    """
+    Filter `queryset` to posts matching `query`, best match first.
+
+    Returns a queryset annotated with ``rank`` on PostgreSQL, or a list of posts
+    (each with a ``rank`` attribute, or key for values() querysets) from the
+    in-process index elsewhere.
+    """
+    if uses_postgres():
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+        from django.db.models import F, FloatField
+        from django.db.models.functions import Cast
+
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        # ts_rank is a float4; as float8 it round-trips exactly through
+        # pagination cursors. Ties break on id, like the in-process index.
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=Cast(SearchRank(F('search_vector'), search_query), FloatField()))
+            .order_by('-rank', '-id')
+        )
+
+    ranked = get_index().search(query)
+    ids = [pk for pk, _ in ranked]
+    if issubclass(queryset._iterable_class, ModelIterable):
+        posts = queryset.in_bulk(ids)
+    else:
+        # in_bulk() needs model instances; values() rows carry their id
+        posts = {post['id']: post for post in queryset.filter(pk__in=ids)}
+    results = []
+    for pk, rank in ranked:
+        post = posts.get(pk)
+        if post is None:
+            continue
+        if isinstance(post, dict):
+            post['rank'] = rank
+        else:
+            post.rank = rank
+        results.append(post)
+    return results
@@ -0,0 +1,17 @@
+# backend/portfolio_backend/blog/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import search
+from .models import BlogPost
+
+
+@receiver(post_save, sender=BlogPost)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or BlogPost.SEARCH_FIELDS.intersection(update_fields):
+        search.index_post(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.unindex_post(instance.pk)
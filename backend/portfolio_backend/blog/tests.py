@@ -0,0 +1,394 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from . import search, view_counter
+from .models import BlogCategory, BlogPost, published_category_counts
+
+
+def create_post(title, **kwargs):
+    kwargs.setdefault('category', 'technical')
+    kwargs.setdefault('is_published', True)
+    kwargs.setdefault('excerpt', "Excerpt")
+    kwargs.setdefault('content', "Some content")
+    return BlogPost.objects.create(title=title, **kwargs)
+
+
+class LocalViewBufferTests(TestCase):
+
+    def setUp(self):
+        self.buffer = view_counter.LocalViewBuffer()
+        patcher = mock.patch.object(view_counter, '_buffer', self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_detail_view_does_not_write(self):
+        post = create_post("Hello")
+        url = reverse('blog_post_detail', args=[post.slug])
+        # ETag probe + the SELECT for the post; no UPDATE on the request path
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.json()['views'], 1)
+        post.refresh_from_db()
+        self.assertEqual(post.views, 0)
+
+    def test_flush_batches_updates_per_distinct_increment(self):
+        posts = [create_post(f"Post {i}") for i in range(4)]
+        for post in posts[:3]:
+            self.buffer.record(post.id)
+        self.buffer.record(posts[3].id, 5)
+        # One UPDATE for the three posts at +1, one for the post at +5
+        with self.assertNumQueries(2 + 2):  # plus SAVEPOINT/RELEASE
+            self.assertEqual(self.buffer.flush(), 8)
+        self.assertEqual(
+            list(BlogPost.objects.order_by('id').values_list('views', flat=True)),
+            [1, 1, 1, 5],
+        )
+        self.assertEqual(self.buffer.flush(), 0)
+
+    def test_concurrent_views_are_not_lost(self):
+        post = create_post("Popular")
+        threads = [
+            threading.Thread(target=lambda: [self.buffer.record(post.id) for _ in range(100)])
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.buffer.flush()
+        post.refresh_from_db()
+        self.assertEqual(post.views, 800)
+
+    def test_failed_flush_keeps_increments(self):
+        post = create_post("Retry")
+        self.buffer.record(post.id, 3)
+        with mock.patch.object(view_counter, 'apply_increments', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.buffer.flush()
+        self.assertEqual(self.buffer.pending(post.id), 3)
+        self.buffer.flush()
+        post.refresh_from_db()
+        self.assertEqual(post.views, 3)
+
+
+class ProcessBufferTests(TestCase):
+
+    def test_reset_drops_the_buffer_timer_and_exit_flush(self):
+        self.addCleanup(view_counter.reset)
+        with mock.patch.object(view_counter, '_buffer', None), \
+                mock.patch.object(view_counter, 'atexit') as exit_hooks, \
+                self.settings(BLOG_VIEW_COUNTER_FLUSH_INTERVAL=60):
+            buffer = view_counter.get_buffer()
+            exit_hooks.register.assert_called_once_with(view_counter._flush_on_exit, buffer)
+            stopped = view_counter._timer_stopped
+            view_counter.reset()
+            exit_hooks.unregister.assert_called_once_with(view_counter._flush_on_exit)
+            self.assertTrue(stopped.is_set())
+            self.assertIsNone(view_counter._buffer)
+
+
+class CacheViewBufferTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.buffer = view_counter.CacheViewBuffer()
+
+    def test_flush_from_another_process(self):
+        post = create_post("Shared")
+        for _ in range(3):
+            self.buffer.record(post.id)
+        # A fresh buffer (e.g. the management command) has seen nothing locally
+        self.assertEqual(view_counter.CacheViewBuffer().flush(scan_all=True), 3)
+        post.refresh_from_db()
+        self.assertEqual(post.views, 3)
+        self.assertEqual(self.buffer.pending(post.id), 0)
+
+    def test_command_drains_the_shared_buffer(self):
+        post = create_post("Shared")
+        self.buffer.record(post.id, 4)
+        out = StringIO()
+        with self.settings(BLOG_VIEW_COUNTER_BACKEND='cache'), \
+                mock.patch.object(view_counter, '_buffer', view_counter.CacheViewBuffer()):
+            call_command('flush_view_counts', stdout=out)
+        self.assertIn("Flushed 4", out.getvalue())
+        with self.settings(BLOG_VIEW_COUNTER_BACKEND='local'):
+            with self.assertRaisesMessage(CommandError, "BLOG_VIEW_COUNTER_BACKEND=cache"):
+                call_command('flush_view_counts', stdout=StringIO())
+
+    def test_overlapping_flushes_claim_each_view_once(self):
+        post = create_post("Raced")
+        self.buffer.record(post.id, 5)
+        get_many = cache.get_many
+        raced = []
+
+        def read_then_race(keys):
+            # The second flush (another worker) runs between this flush's read
+            # and its decr, so both read 5
+            found = get_many(keys)
+            if not raced:
+                raced.append(True)
+                self.buffer.record(post.id, 2)
+                raced.append(view_counter.CacheViewBuffer().flush(scan_all=True))
+            return found
+
+        with mock.patch.object(cache, 'get_many', side_effect=read_then_race):
+            self.assertEqual(self.buffer.flush(scan_all=True), 0)
+        self.assertEqual(raced[1], 7)
+        post.refresh_from_db()
+        self.assertEqual(post.views, 7)
+        self.assertEqual(self.buffer.pending(post.id), 0)
+
+
+class SearchTests(TestCase):
+
+    def setUp(self):
+        search._index = None
+        self.addCleanup(setattr, search, '_index', None)
+
+    def search_titles(self, query):
+        response = self.client.get(reverse('blog_posts_list'), {'search': query})
+        return [post['title'] for post in response.json()['results']]
+
+    def test_title_matches_rank_above_content_matches(self):
+        create_post("Notes", content="we tuned postgres for a week")
+        create_post("Postgres tuning", content="nothing else")
+        create_post("Unrelated", content="redis")
+        self.assertEqual(self.search_titles("postgres"), ["Postgres tuning", "Notes"])
+
+    def test_all_terms_must_match(self):
+        create_post("Vector search", content="retrieval")
+        create_post("Vector math")
+        self.assertEqual(self.search_titles("vector retrieval"), ["Vector search"])
+
+    def test_unpublished_posts_are_excluded(self):
+        create_post("Draft postgres", is_published=False)
+        self.assertEqual(self.search_titles("postgres"), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        post = create_post("Caching")
+        self.assertEqual(self.search_titles("caching"), ["Caching"])
+        post.title = "Batching"
+        post.save()
+        self.assertEqual(self.search_titles("caching"), [])
+        self.assertEqual(self.search_titles("batching"), ["Batching"])
+        post.delete()
+        self.assertEqual(self.search_titles("batching"), [])
+
+
+class PostPaginationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        search._index = None
+        self.addCleanup(setattr, search, '_index', None)
+        now = timezone.now()
+        for i in range(45):
+            post = create_post(f"Post {i}", content="postgres")
+            # Posts share timestamps in threes, so ties are broken by id
+            BlogPost.objects.filter(pk=post.pk).update(published_date=now - timedelta(hours=i // 3))
+
+    def walk(self, url):
+        titles = []
+        while url:
+            data = self.client.get(url).json()
+            titles += [post['title'] for post in data['results']]
+            url = data['next']
+        return titles
+
+    def test_pages_cover_every_post_once_in_order(self):
+        self.assertEqual(self.walk(reverse('blog_posts_list')), [f"Post {i}" for i in range(45)])
+
+    def test_search_results_are_paginated(self):
+        titles = self.walk(reverse('blog_posts_list') + '?search=postgres')
+        self.assertEqual(sorted(titles), sorted(f"Post {i}" for i in range(45)))
+
+    def test_previous_link_returns_the_page_before(self):
+        first = self.client.get(reverse('blog_posts_list')).json()
+        second = self.client.get(first['next']).json()
+        self.assertIsNone(first['previous'])
+        self.assertEqual(self.client.get(second['previous']).json()['results'], first['results'])
+
+    def test_deep_pages_cost_the_same_queries(self):
+        first = self.client.get(reverse('blog_posts_list')).json()
+        second = self.client.get(first['next']).json()
+        # ETag probe + the page; no COUNT, no OFFSET
+        with self.assertNumQueries(2):
+            third = self.client.get(second['next']).json()
+        self.assertEqual(len(third['results']), 5)
+        self.assertIsNone(third['next'])
+
+    def test_count_is_optional_and_cached(self):
+        url = reverse('blog_posts_list')
+        self.assertNotIn('count', self.client.get(url).json())
+        first = self.client.get(url + '?count=true').json()
+        self.assertEqual(first['count'], 45)
+        # Next page: a new response, but the count comes from the cache
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(first['next']).json()['count'], 45)
+        create_post("Post 45")
+        self.assertEqual(self.client.get(url + '?count=true').json()['count'], 46)
+
+    def test_invalid_cursor_is_a_404(self):
+        response = self.client.get(reverse('blog_posts_list') + '?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+
+class SparseFieldsetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.post = create_post("Sparse", content="# Heading\n\nLong body")
+        self.addCleanup(view_counter.flush)  # don't leave buffered views for a later post with this id
+
+    def test_list_fields_and_exclude(self):
+        response = self.client.get(reverse('blog_posts_list') + '?fields=title,slug')
+        self.assertEqual(response.json()['results'], [{'title': "Sparse", 'slug': self.post.slug}])
+        row = self.client.get(reverse('blog_posts_list') + '?exclude=excerpt,featured_image_srcset').json()['results'][0]
+        self.assertNotIn('excerpt', row)
+        self.assertIn('featured_image', row)
+
+    def test_detail_reads_only_selected_columns(self):
+        url = reverse('blog_post_detail', args=[self.post.slug])
+        with self.assertNumQueries(2) as ctx:  # ETag probe, the post
+            data = self.client.get(url + '?fields=title,toc,views').json()
+        self.assertEqual(data, {'title': "Sparse", 'toc': self.post.content_toc, 'views': 1})
+        self.assertNotIn('"content"', ctx.captured_queries[-1]['sql'])
+        full = self.client.get(url).json()
+        self.assertEqual(self.client.get(url + '?exclude=content,content_html').json().keys(),
+                         full.keys() - {'content', 'content_html'})
+
+    def test_unknown_fields_are_a_400(self):
+        response = self.client.get(reverse('blog_posts_list') + '?fields=title,body')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'detail': "Unknown field(s): body"})
+
+
+class RenderedContentTests(TestCase):
+
+    def test_content_is_rendered_and_sanitized_on_save(self):
+        post = create_post("Post", content="# Intro\n\n<script>alert(1)</script>\n\n```python\nx = 1\n```")
+        self.assertIn('<h1 id="intro">Intro</h1>', post.content_html)
+        self.assertIn('<span class="n">x</span>', post.content_html)
+        self.assertNotIn('script', post.content_html)
+        self.assertEqual(post.content_toc, [{'id': 'intro', 'name': "Intro", 'level': 1, 'children': []}])
+
+        with mock.patch.object(view_counter, '_buffer', view_counter.LocalViewBuffer()):
+            data = self.client.get(reverse('blog_post_detail', args=[post.slug])).json()
+        self.assertEqual((data['content_html'], data['toc']), (post.content_html, post.content_toc))
+
+    def test_unchanged_content_is_not_rendered_again(self):
+        post = create_post("Post", content="Some *markdown*")
+        with mock.patch('portfolio_backend.core.markup.render_markdown', return_value=('', [])) as render:
+            post.title = "Renamed"
+            post.save()
+            render.assert_not_called()
+            post.content = "Other *markdown*"
+            post.save(update_fields=['content'])
+            render.assert_called_once()
+
+
+class RecomputeDerivedTests(TestCase):
+
+    def setUp(self):
+        self.checkpoint = os.path.join(tempfile.mkdtemp(), 'checkpoint.json')
+        self.posts = [create_post(f"Post {i}", content="word " * (150 * i) + "\n\n# Heading") for i in range(1, 6)]
+        self.expected = {
+            post.pk: (post.word_count, post.reading_time, post.content_html) for post in self.posts
+        }
+
+    def corrupt(self):
+        BlogPost.objects.update(word_count=0, reading_time=99, content_html='', content_hash='')
+
+    def recompute(self, *args):
+        out = StringIO()
+        call_command('recompute_derived', '--chunk-size', '2', '--checkpoint', self.checkpoint, *args, stdout=out)
+        return out.getvalue()
+
+    def stored(self):
+        return {
+            pk: (words, minutes, html)
+            for pk, words, minutes, html in BlogPost.objects.values_list('pk', 'word_count', 'reading_time', 'content_html')
+        }
+
+    def test_restores_every_post_in_a_process_pool(self):
+        self.corrupt()
+        output = self.recompute('--workers', '2')
+        self.assertEqual(self.stored(), self.expected)
+        self.assertIn("5 updated", output)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_unchanged_posts_are_not_written(self):
+        self.assertIn("0 updated", self.recompute('--workers', '0'))
+        self.assertIn("5 updated", self.recompute('--workers', '0', '--force'))
+
+    def test_resume_continues_after_the_checkpoint(self):
+        self.corrupt()
+        with open(self.checkpoint, 'w') as f:
+            json.dump({'last_pk': self.posts[1].pk}, f)
+        self.recompute('--workers', '0', '--resume')
+        stored = self.stored()
+        self.assertEqual(stored[self.posts[0].pk], (0, 99, ''))
+        for post in self.posts[2:]:
+            self.assertEqual(stored[post.pk], self.expected[post.pk])
+
+
+class CategoryCountTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_come_from_one_cached_aggregate(self):
+        create_post("A", category='tutorial')
+        create_post("B", category='technical')
+        create_post("C", category='technical')
+        create_post("Draft", category='opinion', is_published=False)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('blog_categories'))
+        self.assertEqual(response.json(), [
+            {'key': 'technical', 'name': 'Technical Deep Dive', 'count': 2},
+            {'key': 'tutorial', 'name': 'Tutorial', 'count': 1},
+        ])
+        with self.assertNumQueries(0):
+            self.client.get(reverse('blog_categories'))
+
+    def test_saving_or_deleting_a_post_invalidates_counts(self):
+        post = create_post("A", category='tutorial')
+        self.assertEqual(published_category_counts(), {'tutorial': 1})
+        post.is_published = False
+        post.save()
+        self.assertEqual(published_category_counts(), {})
+        create_post("B", category='opinion').delete()
+        self.assertEqual(published_category_counts(), {})
+
+    def test_changes_from_another_process_show_up_after_the_timeout(self):
+        post = create_post("A", category='tutorial')
+        self.assertEqual(published_category_counts(), {'tutorial': 1})
+        # Another worker's save: no signal reaches this process's cache
+        BlogPost.objects.filter(pk=post.pk).update(category='opinion')
+        self.assertEqual(published_category_counts(), {'tutorial': 1})
+        later = time.time() + settings.BLOG_CATEGORY_COUNTS_TIMEOUT + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=later):
+            self.assertEqual(published_category_counts(), {'opinion': 1})
+
+    def test_blog_category_post_count_uses_the_aggregate(self):
+        create_post("A", category='tutorial')
+        categories = [
+            BlogCategory.objects.create(name=name, slug=slug)
+            for name, slug in [("Tutorial", 'tutorial'), ("Opinion", 'opinion')]
+        ]
+        published_category_counts()
+        with self.assertNumQueries(0):
+            self.assertEqual([c.post_count for c in categories], [1, 0])
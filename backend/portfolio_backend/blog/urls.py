@@ -1,9 +1,12 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+read_views = async_views if settings.ASYNC_READ_VIEWS else views
 
 urlpatterns = [
-    path('posts/', views.blog_posts_list, name='blog_posts_list'),
-    path('posts/<slug:slug>/', views.blog_post_detail, name='blog_post_detail'),
+    path('posts/', read_views.blog_posts_list, name='blog_posts_list'),
+    path('posts/<slug:slug>/', read_views.blog_post_detail, name='blog_post_detail'),
     path('recent/', views.recent_blog_posts, name='recent_blog_posts'),
     path('categories/', views.blog_categories, name='blog_categories'),
 ]
\ No newline at end of file
@@ -0,0 +1,223 @@
+# backend/portfolio_backend/blog/view_counter.py
+"""
+Write-behind view counter for blog posts.
+
+Detail views call ``record_view(post_id)`` instead of saving the post. Increments
+are buffered, either in process memory ("local") or in the shared Django cache
+("cache"), and flushed periodically as batched ``views = views + n`` updates.
+A page view therefore never waits on a row lock, and concurrent views are
+never lost to a read-modify-write race.
+
+Flushes happen on a background timer in every process, at interpreter shutdown,
+and on demand via ``python manage.py flush_view_counts``.
+"""
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+def apply_increments(increments):
+    """Write {post_id: n} to the database, one UPDATE per distinct n"""
+    from .models import BlogPost
+
+    by_amount = defaultdict(list)
+    for post_id, n in increments.items():
+        if n > 0:
+            by_amount[n].append(post_id)
+
+    with transaction.atomic():
+        for n, post_ids in by_amount.items():
+            BlogPost.objects.filter(pk__in=post_ids).update(views=F('views') + n)
+
+    return sum(n * len(post_ids) for n, post_ids in by_amount.items())
+
+
+class LocalViewBuffer:
+    """Per-process buffer; each worker flushes its own increments"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+
+    def record(self, post_id, n=1):
+        with self._lock:
+            self._pending[post_id] += n
+
+    def pending(self, post_id):
+        return self._pending.get(post_id, 0)
+
+    def flush(self, scan_all=False):
+        with self._lock:
+            increments, self._pending = self._pending, Counter()
+        if not increments:
+            return 0
+        try:
+            return apply_increments(increments)
+        except Exception:
+            # Put the increments back so the next flush retries them
+            with self._lock:
+                self._pending.update(increments)
+            raise
+
+
+class CacheViewBuffer:
+    """Shared buffer in the Django cache, so any process can flush it"""
+
+    key_prefix = 'blog:views:'
+    chunk_size = 500
+
+    def __init__(self, alias='default'):
+        self._cache = caches[alias]
+        self._lock = threading.Lock()
+        self._seen = set()
+
+    def _key(self, post_id):
+        return f'{self.key_prefix}{post_id}'
+
+    def record(self, post_id, n=1):
+        key = self._key(post_id)
+        if not self._cache.add(key, n, timeout=None):
+            try:
+                self._cache.incr(key, n)
+            except ValueError:
+                # Flushed or evicted between add() and incr()
+                self._cache.add(key, n, timeout=None)
+        with self._lock:
+            self._seen.add(post_id)
+
+    def pending(self, post_id):
+        return self._cache.get(self._key(post_id), 0)
+
+    def _claim(self, key, n):
+        """
+        Atomically take up to `n` views from `key` and return how many were taken.
+
+        Another flush (another worker's timer, or the management command) may
+        have read the same count and claimed it first. decr() is atomic, so the
+        value it returns tells us how much of `n` was still there; whatever was
+        not is handed back, and the two flushes never claim the same views.
+        """
+        try:
+            remaining = self._cache.decr(key, n)
+        except ValueError:
+            # Flushed to nothing and evicted since get_many()
+            return 0
+        claimed = max(0, min(n, n + remaining))
+        if claimed < n:
+            self._cache.incr(key, n - claimed)
+        return claimed
+
+    def flush(self, scan_all=False):
+        """
+        Move buffered counts into the database. Worker timers only flush the
+        posts this process has seen; ``scan_all`` checks every post, which is
+        what the management command does.
+        """
+        if scan_all:
+            from .models import BlogPost
+            post_ids = list(BlogPost.objects.values_list('pk', flat=True))
+        else:
+            with self._lock:
+                post_ids, self._seen = list(self._seen), set()
+
+        increments = {}
+        for start in range(0, len(post_ids), self.chunk_size):
+            keys = {self._key(pk): pk for pk in post_ids[start:start + self.chunk_size]}
+            for key, n in self._cache.get_many(list(keys)).items():
+                if n > 0:
+                    claimed = self._claim(key, n)
+                    if claimed:
+                        increments[keys[key]] = claimed
+        if not increments:
+            return 0
+        try:
+            return apply_increments(increments)
+        except Exception:
+            for post_id, n in increments.items():
+                self.record(post_id, n)
+            raise
+
+
+BACKENDS = {
+    'local': LocalViewBuffer,
+    'cache': CacheViewBuffer,
+}
+
+_buffer = None
+_buffer_lock = threading.Lock()
+_timer_stopped = None
+
+
+def _flush_periodically(buffer, interval, stopped):
+    while not stopped.wait(interval):
+        try:
+            buffer.flush()
+        except Exception:
+            logger.exception("Flushing blog view counts failed")
+        finally:
+            # This thread is not a request, so nothing else will close its connection
+            connection.close()
+
+
+def _flush_on_exit(buffer):
+    try:
+        buffer.flush()
+    except Exception:
+        logger.exception("Flushing blog view counts at shutdown failed")
+
+
+def get_buffer():
+    """Return the process-wide buffer, starting its flush timer on first use"""
+    global _buffer, _timer_stopped
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                backend = getattr(settings, 'BLOG_VIEW_COUNTER_BACKEND', 'local')
+                interval = getattr(settings, 'BLOG_VIEW_COUNTER_FLUSH_INTERVAL', 30)
+                buffer = BACKENDS[backend]()
+                if interval:
+                    _timer_stopped = threading.Event()
+                    threading.Thread(
+                        target=_flush_periodically,
+                        args=(buffer, interval, _timer_stopped),
+                        name='blog-view-counter',
+                        daemon=True,
+                    ).start()
+                atexit.register(_flush_on_exit, buffer)
+                _buffer = buffer
+    return _buffer
+
+
+def reset():
+    """
+    Drop the process-wide buffer without flushing it, and stop its timer and
+    exit hook. The test runner calls this on teardown: by interpreter exit the
+    test database is gone and a flush would write to the configured one.
+    """
+    global _buffer
+    with _buffer_lock:
+        if _buffer is not None:
+            if _timer_stopped is not None:
+                _timer_stopped.set()
+            atexit.unregister(_flush_on_exit)
+            _buffer = None
+
+
+def record_view(post_id):
+    get_buffer().record(post_id)
+
+
+def pending_views(post_id):
+    return get_buffer().pending(post_id)
+
+
+def flush(scan_all=False):
+    return get_buffer().flush(scan_all=scan_all)
@@ -1,108 +1,213 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
-from .models import BlogPost
+from rest_framework.exceptions import ParseError
+from .models import BlogPost, published_category_counts
+from .search import search_posts
+from . import view_counter
+from django.db.models import Count, Max
+from portfolio_backend.core.conditional import conditional
+from portfolio_backend.core.fieldsets import Fieldset, wants
+from portfolio_backend.core.pagination import KeysetPagination
+from portfolio_backend.core.response_cache import cache_response
 
-@api_view(['GET'])
-def blog_posts_list(request):
-    """Get all published blog posts"""
-    category = request.GET.get('category')
-    search = request.GET.get('search')
+CATEGORY_NAMES = dict(BlogPost.CATEGORY_CHOICES)
+
+
+def post_list_validators(request):
+    """
+    Newest published edit + count, so unpublishing or deleting a post also
+    changes the ETag. No Last-Modified: the newest edit stays put when a post
+    is unpublished or deleted.
+    """
+    probe = BlogPost.objects.filter(is_published=True).aggregate(last=Max('updated_date'), count=Count('id'))
+    return (probe['last'] and probe['last'].isoformat(), probe['count']), None
+
+
+def post_detail_validators(request, slug):
+    """
+    Records the view, so a 304 is counted like a full response, then validates
+    on the last edit. When the body includes `views` (it changes on every
+    view, this one included) the count is part of the ETag and there is no
+    Last-Modified, so clients never keep a stale count.
+    """
+    try:
+        selection = POST_DETAIL_FIELDS.select(request.GET)
+    except ParseError:
+        return None  # the view answers 400
+    probe = BlogPost.objects.filter(slug=slug, is_published=True).values_list('id', 'updated_date', 'views').first()
+    if probe is None:
+        return None
+    post_id, updated, views = probe
+    view_counter.record_view(post_id)
+    if wants(selection, 'views'):
+        return (updated.isoformat(), views + view_counter.pending_views(post_id)), None
+    return updated.isoformat(), updated
+
+
+def featured_image_data(descriptor):
+    """Precomputed URL + srcset (see core.images), no Cloudinary SDK call per row"""
+    descriptor = descriptor or {}
+    return {'featured_image': descriptor.get('url'), 'featured_image_srcset': descriptor.get('srcset')}
+
+
+# Response keys -> columns (see core.fieldsets); id and published_date are also the keyset
+POST_LIST_FIELDS = Fieldset(
+    {
+        'title': ['title'], 'slug': ['slug'], 'excerpt': ['excerpt'], 'category': ['category'],
+        'featured_image': ['featured_image_descriptor'], 'featured_image_srcset': ['featured_image_descriptor'],
+        'reading_time': ['reading_time'], 'published_date': ['published_date'], 'views': ['views'],
+        'is_featured': ['is_featured'],
+    },
+    required=['id', 'published_date'],
+)
+POST_LIST_COLUMNS = POST_LIST_FIELDS.columns(None)
+# The view counter needs id and views; post_detail_data formats both dates
+POST_DETAIL_FIELDS = Fieldset(
+    {
+        'title': ['title'], 'slug': ['slug'], 'excerpt': ['excerpt'], 'content': ['content'],
+        'content_html': ['content_html'], 'toc': ['content_toc'], 'category': ['category'],
+        'featured_image': ['featured_image_descriptor'], 'featured_image_srcset': ['featured_image_descriptor'],
+        'reading_time': ['reading_time'], 'published_date': ['published_date'],
+        'updated_date': ['updated_date'], 'views': ['views'], 'meta_description': ['meta_description'], 'meta_keywords': ['meta_keywords'],
+    },
+    required=['id', 'views', 'published_date', 'updated_date'],
+)
+POST_DETAIL_COLUMNS = POST_DETAIL_FIELDS.columns(None)
+
+
+def post_list_data(row, selection=None):
+    """List row from a values(*POST_LIST_COLUMNS) dict (shared with async_views)"""
+    if selection is not None:
+        row = POST_LIST_FIELDS.pad(row)
+    return POST_LIST_FIELDS.trim({
+        'title': row['title'],
+        'slug': row['slug'],
+        'excerpt': row['excerpt'],
+        'category': row['category'],
+        **featured_image_data(row['featured_image_descriptor']),
+        'reading_time': row['reading_time'],
+        'published_date': row['published_date'].isoformat(),
+        'views': row['views'],
+        'is_featured': row['is_featured'],
+    }, selection)
+
+
+def post_detail_data(post, views, selection=None):
+    """Detail body from a values(*POST_DETAIL_COLUMNS) dict; `views` includes buffered increments"""
+    if selection is not None:
+        post = POST_DETAIL_FIELDS.pad(post)
+    return POST_DETAIL_FIELDS.trim({
+        'title': post['title'],
+        'slug': post['slug'],
+        'excerpt': post['excerpt'],
+        'content': post['content'],
+        'content_html': post['content_html'],
+        'toc': post['content_toc'],
+        'category': post['category'],
+        **featured_image_data(post['featured_image_descriptor']),
+        'reading_time': post['reading_time'],
+        'published_date': post['published_date'].isoformat(),
+        'updated_date': post['updated_date'].isoformat(),
+        'views': views,
+        'meta_description': post['meta_description'],
+        'meta_keywords': post['meta_keywords'],
+    }, selection)
+
+
+def published_post(slug, selection=None):
+    """values() queryset for one published post's detail columns (shared with async_views)"""
+    return BlogPost.objects.filter(slug=slug, is_published=True).values(*POST_DETAIL_FIELDS.columns(selection))
+
+
+class PostPagination(KeysetPagination):
+    """Newest first, by the (published_date DESC, id) index"""
+    ordering = ('-published_date', 'id')
+    count_groups = ('blog',)
+
+
+class SearchResultPagination(PostPagination):
+    # Best match first, the order search_posts returns
+    ordering = ('-rank', '-id')
+
+
+def filtered_posts(params, selection=None):
+    """(posts, pagination class) behind the post list (shared with async_views)"""
+    category = params.get('category')
+    search = params.get('search')
     
-    posts = BlogPost.objects.filter(is_published=True)
+    # Plain dicts with only the listed columns; no model instances
+    posts = BlogPost.objects.filter(is_published=True).values(*POST_LIST_FIELDS.columns(selection))
     
     if category:
         posts = posts.filter(category=category)
     
     if search:
-        posts = posts.filter(
-            Q(title__icontains=search) | 
-            Q(excerpt__icontains=search) |
-            Q(content__icontains=search)
-        )
-    
-    posts = posts.order_by('-published_date')
-    
-    data = []
-    for post in posts:
-        data.append({
-            'title': post.title,
-            'slug': post.slug,
-            'excerpt': post.excerpt,
-            'category': post.category,
-            'featured_image': post.featured_image.url if post.featured_image else None,
-            'reading_time': post.reading_time,
-            'published_date': post.published_date.isoformat(),
-            'views': post.views,
-            'is_featured': post.is_featured,
-        })
+        # Ranked full-text search, best match first
+        return search_posts(posts, search), SearchResultPagination
+    return posts, PostPagination
+
+
+@conditional(post_list_validators)
+@cache_response('blog')
+@api_view(['GET'])
+def blog_posts_list(request):
+    """Get published blog posts, one keyset page at a time"""
+    selection = POST_LIST_FIELDS.select(request.GET)
+    posts, pagination_class = filtered_posts(request.GET, selection)
+    paginator = pagination_class()
+    page = paginator.paginate_queryset(posts, request)
     
-    return Response(data)
+    return paginator.get_paginated_response([post_list_data(post, selection) for post in page])
 
+@conditional(post_detail_validators)
 @api_view(['GET'])
 def blog_post_detail(request, slug):
     """Get detailed blog post"""
-    try:
-        post = BlogPost.objects.get(slug=slug, is_published=True)
-        
-        # Increment view count
-        post.views += 1
-        post.save(update_fields=['views'])
-        
-        data = {
-            'title': post.title,
-            'slug': post.slug,
-            'excerpt': post.excerpt,
-            'content': post.content,
-            'category': post.category,
-            'featured_image': post.featured_image.url if post.featured_image else None,
-            'reading_time': post.reading_time,
-            'published_date': post.published_date.isoformat(),
-            'updated_date': post.updated_date.isoformat(),
-            'views': post.views,
-            'meta_description': post.meta_description,
-            'meta_keywords': post.meta_keywords,
-        }
-        
-        return Response(data)
-        
-    except BlogPost.DoesNotExist:
+    selection = POST_DETAIL_FIELDS.select(request.GET)
+    post = published_post(slug, selection).first()
+    if post is None:
         return Response({'error': 'Blog post not found'}, status=404)
+    
+    # The view was recorded (buffered) by post_detail_validators
+    data = post_detail_data(post, post['views'] + view_counter.pending_views(post['id']), selection)
+    
+    return Response(data)
 
+@cache_response('blog')
 @api_view(['GET'])
 def recent_blog_posts(request):
     """Get recent blog posts for homepage"""
-    posts = BlogPost.objects.filter(is_published=True).order_by('-published_date')[:3]
-    data = []
-    
-    for post in posts:
-        data.append({
-            'title': post.title,
-            'slug': post.slug,
-            'excerpt': post.excerpt,
-            'category': post.category,
-            'reading_time': post.reading_time,
-            'published_date': post.published_date.isoformat(),
-            'featured_image': post.featured_image.url if post.featured_image else None,
-        })
-    
-    return Response(data)
+    return Response(recent_posts_data())
 
+def recent_posts_data():
+    """The three newest published posts (shared with the /home/ bundle)"""
+    posts = BlogPost.objects.filter(is_published=True).order_by('-published_date').values(
+        'title', 'slug', 'excerpt', 'category', 'reading_time', 'published_date', 'featured_image_descriptor',
+    )[:3]
+    return [
+        {
+            'title': post['title'],
+            'slug': post['slug'],
+            'excerpt': post['excerpt'],
+            'category': post['category'],
+            'reading_time': post['reading_time'],
+            'published_date': post['published_date'].isoformat(),
+            **featured_image_data(post['featured_image_descriptor']),
+        }
+        for post in posts
+    ]
+
+@cache_response('blog')
 @api_view(['GET'])
 def blog_categories(request):
     """Get all blog categories with post counts"""
-    posts = BlogPost.objects.filter(is_published=True)
-    categories = {}
-    
-    for post in posts:
-        category_display = dict(BlogPost.CATEGORY_CHOICES).get(post.category, post.category)
-        if post.category not in categories:
-            categories[post.category] = {
-                'key': post.category,
-                'name': category_display,
-                'count': 0
-            }
-        categories[post.category]['count'] += 1
+    counts = published_category_counts()
+    # Known categories in CATEGORY_CHOICES order, then any legacy values
+    keys = [key for key in CATEGORY_NAMES if key in counts]
+    keys += sorted(key for key in counts if key not in CATEGORY_NAMES)
     
-    return Response(list(categories.values()))
\ No newline at end of file
+    return Response([
+        {'key': key, 'name': CATEGORY_NAMES.get(key, key), 'count': counts[key]}
+        for key in keys
+    ])
\ No newline at end of file
@@ -1,7 +1,8 @@
 # backend/portfolio_backend/core/admin.py
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import CareerHighlight, ContactSubmission, SiteConfiguration
+from django.utils import timezone
+from .models import CareerHighlight, ContactSubmission, OutboxEmail, SiteConfiguration
 
 
 @admin.register(CareerHighlight)
@@ -61,4 +62,21 @@ class SiteConfigurationAdmin(admin.ModelAdmin):
     
     def has_delete_permission(self, request, obj=None):
         # Don't allow deletion of site configuration
-        return False
\ No newline at end of file
+        return False
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'status', 'attempts', 'next_attempt_at', 'sent_at']
+    list_filter = ['status']
+    search_fields = ['subject', 'last_error']
+    readonly_fields = ['contact', 'attempts', 'claimed_at', 'last_error', 'provider_message_id', 'created_at', 'sent_at']
+    ordering = ['-created_at']
+    actions = ['requeue']
+    
+    @admin.action(description="Requeue selected emails")
+    def requeue(self, request, queryset):
+        updated = queryset.exclude(status=OutboxEmail.STATUS_SENT).update(
+            status=OutboxEmail.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now(), claimed_at=None
+        )
+        self.message_user(request, f"{updated} email(s) requeued")
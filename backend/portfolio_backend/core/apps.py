@@ -3,3 +3,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio_backend.core'
+
+    def ready(self):
+        from . import stats  # noqa: F401
+        from .response_cache import connect_signals
+        connect_signals()
@@ -0,0 +1,89 @@
+# backend/portfolio_backend/core/async_views.py
+"""
+Async versions of the read endpoints, served when ASYNC_READ_VIEWS is on (run
+under ASGI, see README "Deployment"). They load rows with Django's async ORM
+and reuse the sync views' serializers/row builders, so responses, ETags and
+cache entries are identical in both modes. DRF 3.14 has no async views, hence
+the small JSON/pagination helpers below.
+"""
+import inspect
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.settings import api_settings
+
+from .conditional import conditional
+from .home import HOME_GROUPS, home_data, home_validators
+from .models import CareerHighlight, SiteConfiguration
+from .response_cache import cache_response
+from .views import HIGHLIGHT_FIELDS, site_config_data, site_config_validators
+
+
+def json_response(data, status=200):
+    """Same bytes and content type as a DRF Response rendered by the configured JSON renderer"""
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return HttpResponse(renderer.render(data), content_type='application/json', status=status)
+
+
+def not_found(detail='Not found.'):
+    return json_response({'detail': detail}, status=404)
+
+
+def sparse_fields(fieldset):
+    """
+    Select `fieldset` from ?fields= / ?exclude= and pass it to the view as
+    `selection`; unknown names get the same 400 as the DRF views.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            try:
+                selection = fieldset.select(request.GET)
+            except ParseError as exc:
+                return json_response({'detail': exc.detail}, status=exc.status_code)
+            return await view(request, *args, selection=selection, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def paginate(request, queryset, serialize, paginator):
+    """
+    Async counterpart of a DRF view with `pagination_class = paginator`: same
+    query parameters and response shape. Returns None for an invalid cursor (DRF
+    answers 404).
+    """
+    paginator = paginator()
+    try:
+        objects = await paginator.apaginate_queryset(queryset, request)
+    except NotFound:
+        return None
+    data = serialize(objects)
+    if inspect.isawaitable(data):  # row builders that query, wrapped in sync_to_async
+        data = await data
+    return paginator.get_paginated_data(data)
+
+
+@cache_response('highlights')
+async def career_highlights(request):
+    """Get all career highlights"""
+    return json_response([highlight async for highlight in CareerHighlight.objects.values(*HIGHLIGHT_FIELDS)])
+
+
+@conditional(site_config_validators)
+@cache_response('site_config')
+async def site_config(request):
+    """Get site configuration"""
+    try:
+        config = await SiteConfiguration.objects.afirst()
+        return json_response(site_config_data(config))
+    except Exception as e:
+        return json_response({'error': str(e)}, status=500)
+
+
+@conditional(home_validators)
+@cache_response(*HOME_GROUPS)
+async def home(request):
+    """Homepage sections in one payload"""
+    return json_response(await sync_to_async(home_data)())
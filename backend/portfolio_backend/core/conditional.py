@@ -0,0 +1,86 @@
+# backend/portfolio_backend/core/conditional.py
+"""
+ETag / Last-Modified support for content endpoints.
+
+``@conditional(probe)`` calls ``probe(request, *args, **kwargs)`` before the view.
+The probe runs one cheap query (a row timestamp, a count, a persisted
+ContentVersion) and returns ``(version, last_modified)``, or None to skip
+validation. If the client's If-None-Match / If-Modified-Since still match, a
+304 is returned without running the view or its serializers.
+
+Probes read database state only, never the cache: with the local-memory cache
+each worker would otherwise see only its own changes. ``last_modified`` is
+None unless it moves forward on every change to the response (a timestamp
+misses deletes, unpublishing and related-row edits).
+"""
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+
+def make_etag(request, version):
+    # Weak: the same validator covers gzip/br encodings of the response
+    digest = hashlib.md5(f'{request.get_full_path()}|{version}'.encode()).hexdigest()
+    return 'W/' + quote_etag(digest)
+
+
+def _check(request, validators):
+    """(etag, timestamp, 304 response or None) for the probe's validators"""
+    version, last_modified = validators
+    etag = make_etag(request, version)
+    request.conditional_etag = etag  # keys the response cache, see response_cache.response_key
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        response['ETag'] = etag
+    return etag, timestamp, response
+
+
+def _add_validators(response, etag, timestamp):
+    if response.status_code == 200:
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+    return response
+
+
+def conditional(probe):
+    """Works on sync and async views; for async views the probe runs in a thread"""
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view(request, *args, **kwargs)
+
+                validators = await sync_to_async(probe)(request, *args, **kwargs)
+                if validators is None:
+                    return await view(request, *args, **kwargs)
+
+                etag, timestamp, response = _check(request, validators)
+                if response is not None:
+                    return response
+                return _add_validators(await view(request, *args, **kwargs), etag, timestamp)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            validators = probe(request, *args, **kwargs)
+            if validators is None:
+                return view(request, *args, **kwargs)
+
+            etag, timestamp, response = _check(request, validators)
+            if response is not None:
+                return response
+            return _add_validators(view(request, *args, **kwargs), etag, timestamp)
+
+        return wrapper
+
+    return decorator
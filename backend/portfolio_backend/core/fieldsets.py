@@ -0,0 +1,125 @@
+# backend/portfolio_backend/core/fieldsets.py
+"""
+Sparse fieldsets: ``?fields=title,slug`` returns only those keys and
+``?exclude=content`` returns everything else. A dotted name reaches into a
+nested object or list (``?fields=title,technologies.name``,
+``?exclude=technologies.description``).
+
+Each endpoint describes its response keys with a Fieldset: the model columns
+(``values()``/``only()`` names) each key is built from, plus the Fieldset of
+each nested object. Views load only the columns of the selected keys. They
+skip the joins and prefetches of nested objects nobody asked for, then trim
+what they build. Unknown names are a 400.
+"""
+from rest_framework.exceptions import ParseError
+
+
+def split(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+class Selection:
+    """Keys chosen from a Fieldset, in response order, and the selections inside nested keys"""
+
+    def __init__(self, keys, nested):
+        self.keys = keys
+        self.nested = nested
+
+    def __contains__(self, key):
+        return key in self.keys
+
+
+def wants(selection, key):
+    """Whether `key` is in the response (None selects everything)"""
+    return selection is None or key in selection
+
+
+def inner(selection, key):
+    """Selection inside a nested key, or None for all of it"""
+    return selection.nested.get(key) if selection is not None else None
+
+
+class Fieldset:
+
+    def __init__(self, sources, nested=None, required=()):
+        self.sources = sources  # {response key: columns it is built from}
+        self.nested = nested or {}  # {response key: Fieldset of the nested object}
+        self.required = list(required)  # columns the view itself reads (keys, ordering)
+        self.blank = dict.fromkeys(self.columns(None))
+
+    def select(self, params):
+        """Selection for ?fields= / ?exclude=, or None for the full response"""
+        fields, exclude = split(params.get('fields')), split(params.get('exclude'))
+        if not fields and not exclude:
+            return None
+        return self.choose(fields, exclude, '')
+
+    def choose(self, fields, exclude, prefix):
+        heads = {name.split('.', 1)[0] for name in fields | exclude}
+        unknown = sorted(heads - self.sources.keys())
+        if unknown:
+            raise ParseError(f"Unknown field(s): {', '.join(prefix + name for name in unknown)}")
+
+        wanted = {name.split('.', 1)[0] for name in fields}
+        keys = [key for key in self.sources if (not fields or key in wanted) and key not in exclude]
+        nested = {}
+        for key in keys:
+            # `technologies` on its own keeps the whole object
+            inner_fields = set() if key in fields else {name[len(key) + 1:] for name in fields if name.startswith(key + '.')}
+            inner_exclude = {name[len(key) + 1:] for name in exclude if name.startswith(key + '.')}
+            if not inner_fields and not inner_exclude:
+                continue
+            if key not in self.nested:
+                raise ParseError(f"Field {prefix}{key} has no nested fields")
+            nested[key] = self.nested[key].choose(inner_fields, inner_exclude, f'{prefix}{key}.')
+        return Selection(keys, nested)
+
+    def keys(self, selection):
+        return list(self.sources) if selection is None else selection.keys
+
+    def columns(self, selection):
+        """Required columns plus those of the selected keys, without duplicates"""
+        columns = self.required + [column for key in self.keys(selection) for column in self.sources[key]]
+        return list(dict.fromkeys(columns))
+
+    def pad(self, row):
+        """A values() row of selected columns, with the others as None so row builders can run"""
+        return {**self.blank, **row}
+
+    def trim(self, data, selection):
+        if selection is None:
+            return data
+        return {key: data[key] for key in selection.keys}
+
+
+class SparseFieldsMixin:
+    """Serializer that leaves out the fields a Selection does not include (``selection=``)"""
+
+    def __init__(self, *args, selection=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if selection is not None:
+            self.restrict(self, selection)
+
+    @staticmethod
+    def restrict(serializer, selection):
+        for name in list(serializer.fields):
+            if name not in selection:
+                serializer.fields.pop(name)
+        for name, nested in selection.nested.items():
+            field = serializer.fields[name]
+            SparseFieldsMixin.restrict(getattr(field, 'child', field), nested)
+
+
+class SparseFieldsViewMixin:
+    """
+    Generic view whose `fieldset` is selected from the query string before the
+    handler runs; the Selection is in `self.selection` and goes to the serializer.
+    """
+    fieldset = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.selection = self.fieldset.select(request.query_params)
+
+    def get_serializer(self, *args, **kwargs):
+        return super().get_serializer(*args, selection=self.selection, **kwargs)
@@ -0,0 +1,57 @@
+# backend/portfolio_backend/core/home.py
+"""
+``/home/``: everything the homepage renders on first load in one response.
+
+The sections are exactly what their own endpoints return (for the featured
+projects, the first page's ``results``), built by the same functions with six
+queries in total. The whole payload is one response-cache entry that depends
+on every group its sections use, so a change to any of their models
+invalidates it. Its ETag comes from the persisted ContentVersion of the same
+groups, so it changes in every worker, not only in the one that saved.
+"""
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from portfolio_backend.blog.views import recent_posts_data
+from projects.views import ProjectPagination, project_list_queryset, project_list_rows
+from .conditional import conditional
+from .models import CareerHighlight, ContentVersion, SiteConfiguration
+from .response_cache import cache_response
+from .views import HIGHLIGHT_FIELDS, portfolio_stats_data, site_config_data
+
+# The groups of /core/config/, /projects/stats/, /core/highlights/,
+# /projects/projects/featured/ and /blog/recent/
+HOME_GROUPS = ('site_config', 'stats', 'highlights', 'projects', 'blog')
+
+
+def featured_projects_data():
+    rows = project_list_queryset({}, featured='true').order_by(*ProjectPagination.ordering)
+    return project_list_rows(list(rows[:ProjectPagination.page_size]))
+
+
+def home_data():
+    """Response body for /home/ (shared with async_views)"""
+    return {
+        'config': site_config_data(SiteConfiguration.objects.first()),
+        'stats': portfolio_stats_data(),
+        'highlights': list(CareerHighlight.objects.values(*HIGHLIGHT_FIELDS)),
+        'featured_projects': featured_projects_data(),
+        'recent_posts': recent_posts_data(),
+    }
+
+
+def home_validators(request):
+    """
+    The persisted versions of HOME_GROUPS in one query. No Last-Modified: a
+    version number is not a time.
+    """
+    versions = dict(ContentVersion.objects.filter(group__in=HOME_GROUPS).values_list('group', 'version'))
+    return tuple(versions.get(group) for group in HOME_GROUPS), None
+
+
+@conditional(home_validators)
+@cache_response(*HOME_GROUPS)
+@api_view(['GET'])
+def home(request):
+    """Homepage sections in one payload"""
+    return Response(home_data())
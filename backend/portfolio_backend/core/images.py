@@ -0,0 +1,57 @@
+# backend/portfolio_backend/core/images.py
+"""
+Precomputed Cloudinary image descriptors.
+
+Building a delivery URL goes through the Cloudinary SDK, so instead of calling
+``field.url`` for every row of every list response, models store one
+descriptor per image next to the CloudinaryField:
+
+    {'source': 'image/upload/v1/pic.jpg', 'url': 'https://…', 'srcset': 'https://… 320w, …'}
+
+``source`` is the field's stored value. The descriptor is rebuilt in save()
+only when it no longer matches, i.e. when the image changed. The srcset
+variants are width-limited, with automatic format and quality, so browsers
+pick a small WebP/AVIF instead of the original upload.
+"""
+from rest_framework import serializers
+
+SRCSET_WIDTHS = (320, 640, 960, 1280, 1920)
+VARIANT = {'crop': 'limit', 'fetch_format': 'auto', 'quality': 'auto', 'secure': True}
+
+
+def build_descriptor(resource):
+    return {
+        'source': resource.get_prep_value(),
+        'url': resource.build_url(secure=True),
+        'srcset': ', '.join(f"{resource.build_url(width=width, **VARIANT)} {width}w" for width in SRCSET_WIDTHS),
+    }
+
+
+def refresh_descriptors(instance, fields):
+    """
+    Rebuild ``instance.<descriptor>`` for each {image field: descriptor field}
+    whose image changed; returns the descriptor fields that were updated.
+    Pending uploads are sent first (the field's pre_save) so their public id is known.
+    """
+    changed = []
+    for name, descriptor_name in fields.items():
+        field = instance._meta.get_field(name)
+        value = field.pre_save(instance, instance._state.adding)
+        resource = field.to_python(value) if value else None
+        source = resource.get_prep_value() if resource else None
+        if (getattr(instance, descriptor_name) or {}).get('source') != source:
+            setattr(instance, descriptor_name, build_descriptor(resource) if source else None)
+            changed.append(descriptor_name)
+    return changed
+
+
+class DescriptorField(serializers.Field):
+    """Read-only serializer field for one key ('url' or 'srcset') of a stored descriptor"""
+
+    def __init__(self, key='url', **kwargs):
+        self.key = key
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, descriptor):
+        return descriptor[self.key]
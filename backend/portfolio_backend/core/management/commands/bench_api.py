@@ -0,0 +1,175 @@
+# backend/portfolio_backend/core/management/commands/bench_api.py
+import json
+import re
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.permissions import AllowAny
+
+from portfolio_backend.blog import search
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.core import seeding
+from projects.models import Project
+
+URLCONFS = ['projects.urls', 'portfolio_backend.blog.urls', 'portfolio_backend.core.urls']
+
+ROUTE_PARAM = re.compile(r'<(?:\w+:)?(\w+)>')
+CONTACT = {'name': "Bench", 'email': "bench@example.com", 'subject': "Benchmark", 'message': "Hello"}
+
+
+class QueryTimer:
+    """execute_wrapper that counts queries and times them with perf_counter"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic data and time every route in projects.urls, blog.urls and "
+        "core.urls through the test client: latency percentiles, SQL query count "
+        "and time, payload size. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=200)
+        parser.add_argument('--posts', type=int, default=1000)
+        parser.add_argument('--techs', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=50, help="Timed requests per endpoint")
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--cache', action='store_true',
+                            help="Keep the response cache on (off by default so every request runs the view)")
+        parser.add_argument('--only', nargs='+', default=[], help="Only routes containing one of these strings")
+        parser.add_argument('--json', dest='json_path', help="Also write the results to this file")
+
+    def handle(self, *args, **options):
+        overrides = {'ALLOWED_HOSTS': ['*'], 'SECURE_SSL_REDIRECT': False}
+        if not options['cache']:
+            overrides['CACHES'] = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+        with override_settings(**overrides), transaction.atomic():
+            self.seed(options['projects'], options['posts'], options['techs'])
+            results = {
+                route: self.measure(method, path, options)
+                for route, method, path in self.routes(options['only'])
+            }
+            transaction.set_rollback(True)
+        search._index = None
+
+        report = {
+            'database': connection.vendor,
+            'data': {key: options[key] for key in ('projects', 'posts', 'techs')},
+            'requests': options['requests'],
+            'cache': options['cache'],
+            'endpoints': results,
+        }
+        self.print_table(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+                f.write('\n')
+            self.stdout.write(f"Results written to {options['json_path']}")
+
+    def seed(self, projects, posts, techs):
+        start = time.perf_counter()
+        seeding.seed(projects=projects, posts=posts, techs=techs)
+        self.stdout.write(
+            f"Seeded {projects} projects, {posts} posts, {techs} technologies "
+            f"in {time.perf_counter() - start:.1f}s ({connection.vendor})"
+        )
+
+    def sample_kwargs(self):
+        return {
+            'projects': {'slug': Project.objects.published().values_list('slug', flat=True).first()},
+            'blog': {'slug': BlogPost.objects.filter(is_published=True).values_list('slug', flat=True).first()},
+        }
+
+    def routes(self, only):
+        """(route, method, path) for every public pattern in URLCONFS, with sample URL kwargs"""
+        samples = self.sample_kwargs()
+        for resolver in get_resolver().url_patterns:
+            if not isinstance(resolver, URLResolver):
+                continue
+            if getattr(resolver.urlconf_name, '__name__', resolver.urlconf_name) not in URLCONFS:
+                continue
+            prefix = str(resolver.pattern)
+            app = prefix.strip('/')
+            for pattern in resolver.url_patterns:
+                if not isinstance(pattern, URLPattern):
+                    continue
+                route = prefix + str(pattern.pattern)
+                if only and not any(part in route for part in only):
+                    continue
+                if not self.public(pattern.callback):
+                    continue
+                path = '/' + ROUTE_PARAM.sub(lambda m: str(samples[app][m.group(1)]), route)
+                yield route, self.method(pattern.callback), path
+
+    def public(self, callback):
+        # Operator endpoints (IsAdminUser) are not part of the public API
+        cls = getattr(callback, 'cls', None)
+        return cls is None or all(permission is AllowAny for permission in cls.permission_classes)
+
+    def method(self, callback):
+        # DRF views carry their class; POST-only ones are the contact forms
+        cls = getattr(callback, 'cls', None)
+        if cls is not None and not hasattr(cls, 'get') and hasattr(cls, 'post'):
+            return 'POST'
+        return 'GET'
+
+    def request(self, client, method, path):
+        if method == 'POST':
+            return client.post(path, CONTACT, content_type='application/json')
+        return client.get(path)
+
+    def measure(self, method, path, options):
+        client = Client()
+        for _ in range(options['warmup']):
+            self.request(client, method, path)
+
+        latencies, query_counts, sql_ms = [], [], []
+        for _ in range(options['requests']):
+            timer = QueryTimer()
+            with connection.execute_wrapper(timer):
+                start = time.perf_counter()
+                response = self.request(client, method, path)
+                latencies.append((time.perf_counter() - start) * 1000)
+            query_counts.append(timer.count)
+            sql_ms.append(timer.seconds * 1000)
+
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        return {
+            'method': method,
+            'path': path,
+            'status': response.status_code,
+            'p50_ms': round(quantiles[49], 3),
+            'p95_ms': round(quantiles[94], 3),
+            'p99_ms': round(quantiles[98], 3),
+            'queries': max(query_counts),
+            'sql_ms': round(statistics.median(sql_ms), 3),
+            'bytes': len(response.content),
+        }
+
+    def print_table(self, results):
+        self.stdout.write(
+            f"\n{'route':<36} {'status':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>7} {'sql ms':>8} {'bytes':>9}"
+        )
+        for route, r in results.items():
+            self.stdout.write(
+                f"{r['method'][0]} {route:<34} {r['status']:>6} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+                f"{r['p99_ms']:>8.2f} {r['queries']:>7} {r['sql_ms']:>8.2f} {r['bytes']:>9}"
+            )
@@ -0,0 +1,161 @@
+# backend/portfolio_backend/core/management/commands/bench_asgi.py
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+ENDPOINTS = [
+    '/projects/projects/',
+    '/projects/tech-stack/',
+    '/blog/posts/',
+    '/core/highlights/',
+    '/core/config/',
+]
+
+MODES = {
+    'sync': (['portfolio_backend.wsgi:application'], 'false'),
+    'async': (['portfolio_backend.asgi:application', '-k', 'uvicorn.workers.UvicornWorker'], 'true'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn in sync (WSGI) and async (ASGI + uvicorn workers) mode and "
+        "measure throughput of the read endpoints under many concurrent slow "
+        "clients, i.e. clients that trickle their request and read the response slowly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', nargs='+', choices=sorted(MODES), default=['sync', 'async'])
+        parser.add_argument('--workers', type=int, default=2, help="gunicorn worker processes")
+        parser.add_argument('--clients', type=int, default=50, help="Concurrent slow clients")
+        parser.add_argument('--duration', type=float, default=15.0, help="Seconds per mode")
+        parser.add_argument('--send-delay', type=float, default=0.1,
+                            help="Seconds a client takes to send its request headers")
+        parser.add_argument('--read-delay', type=float, default=0.05,
+                            help="Pause between 4KB reads of the response")
+        parser.add_argument('--rcvbuf', type=int, default=4096,
+                            help="Client socket receive buffer in bytes (0 for the OS default)")
+        parser.add_argument('--endpoints', nargs='+', default=ENDPOINTS)
+        parser.add_argument('--cache', action='store_true',
+                            help="Keep the response cache on (off by default so every request hits the ORM)")
+
+    def handle(self, *args, **options):
+        for mode in options['modes']:
+            port = self.free_port()
+            server = self.start_server(mode, port, options)
+            try:
+                self.wait_until_ready(port, options['endpoints'][0])
+                results = asyncio.run(self.load(port, options))
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+            self.report(mode, results, options['duration'])
+
+    def free_port(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start_server(self, mode, port, options):
+        app_args, async_views = MODES[mode]
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'portfolio_backend.settings'),
+            ASYNC_READ_VIEWS=async_views,
+        )
+        if not options['cache']:
+            env['RESPONSE_CACHE_TIMEOUT'] = '0'
+        command = [
+            sys.executable, '-m', 'gunicorn', *app_args,
+            '--workers', str(options['workers']),
+            '--bind', f'127.0.0.1:{port}',
+            '--log-level', 'warning',
+        ]
+        return subprocess.Popen(command, cwd=settings.BASE_DIR, env=env)
+
+    def wait_until_ready(self, port, path, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                status = asyncio.run(self.request(port, path, 0, 0))
+                if status != 200:
+                    raise CommandError(f"{path} returned HTTP {status}; check ALLOWED_HOSTS and the database")
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError("Server did not start")
+
+    async def request(self, port, path, send_delay, read_delay, rcvbuf=None):
+        sock = socket.socket()
+        if rcvbuf:
+            # A small receive window makes the server's writes wait on this
+            # client instead of disappearing into kernel buffers
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+        sock.setblocking(False)
+        await asyncio.get_running_loop().sock_connect(sock, ('127.0.0.1', port))
+        reader, writer = await asyncio.open_connection(sock=sock)
+        try:
+            head = (
+                f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nX-Forwarded-Proto: https\r\n"
+                f"Accept: application/json\r\nConnection: close\r\n\r\n"
+            ).encode()
+            # Trickle the request in a few chunks, like a client on a slow link
+            chunks = [head[i:i + 16] for i in range(0, len(head), 16)]
+            for chunk in chunks:
+                writer.write(chunk)
+                await writer.drain()
+                if send_delay:
+                    await asyncio.sleep(send_delay / len(chunks))
+
+            status_line = await reader.readline()
+            while await reader.read(4096):
+                if read_delay:
+                    await asyncio.sleep(read_delay)
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
+
+    async def load(self, port, options):
+        deadline = time.monotonic() + options['duration']
+        latencies, errors = [], 0
+
+        async def client(index):
+            nonlocal errors
+            endpoints = options['endpoints']
+            i = index
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                try:
+                    status = await self.request(
+                        port, endpoints[i % len(endpoints)],
+                        options['send_delay'], options['read_delay'], options['rcvbuf'],
+                    )
+                except OSError:
+                    status = None
+                if status == 200:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+                i += 1
+
+        await asyncio.gather(*(client(i) for i in range(options['clients'])))
+        return latencies, errors
+
+    def report(self, mode, results, duration):
+        latencies, errors = results
+        if len(latencies) < 2:
+            self.stdout.write(f"{mode:<6} no successful requests ({errors} errors)")
+            return
+        quantiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{mode:<6} {len(latencies) / duration:8.1f} req/s  "
+            f"p50 {quantiles[49]:7.1f}ms  p95 {quantiles[94]:7.1f}ms  p99 {quantiles[98]:7.1f}ms  "
+            f"errors {errors}"
+        )
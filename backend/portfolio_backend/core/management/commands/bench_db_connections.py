@@ -0,0 +1,83 @@
+# backend/portfolio_backend/core/management/commands/bench_db_connections.py
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+from django.test import Client
+from django.test.utils import override_settings
+
+from portfolio_backend.db_backends import metrics
+
+ENDPOINTS = ['/projects/projects/', '/projects/tech-stack/', '/blog/posts/', '/core/config/']
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request connections (CONN_MAX_AGE=0) with persistent ones on "
+        "the read endpoints. Response caching is disabled so every request queries "
+        "the database; run against the real database to include TLS setup."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help="Requests per endpoint and mode")
+        parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 4],
+                            help="Worker threads (each holds its own connection, like gthread workers)")
+        parser.add_argument('--max-age', type=int, default=60, help="CONN_MAX_AGE for the persistent mode")
+        parser.add_argument('--endpoints', nargs='+', default=ENDPOINTS)
+
+    def handle(self, *args, **options):
+        overrides = {
+            'ALLOWED_HOSTS': ['*'],
+            'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+        }
+        settings_dict = connections['default'].settings_dict
+        original_max_age = settings_dict['CONN_MAX_AGE']
+        try:
+            with override_settings(**overrides):
+                for concurrency in options['concurrency']:
+                    self.stdout.write(f"\nconcurrency={concurrency}")
+                    for label, max_age in [('per-request', 0), ('persistent', options['max_age'])]:
+                        settings_dict['CONN_MAX_AGE'] = max_age
+                        self.run_mode(label, concurrency, options['requests'], options['endpoints'])
+        finally:
+            settings_dict['CONN_MAX_AGE'] = original_max_age
+
+    def run_mode(self, label, concurrency, requests, endpoints):
+        connections.close_all()
+        metrics.reset()
+        paths = [path for path in endpoints for _ in range(requests)]
+        chunks = [paths[i::concurrency] for i in range(concurrency)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            samples = [ms for chunk in pool.map(self.worker, chunks) for ms in chunk]
+        elapsed = time.perf_counter() - start
+
+        quantiles = statistics.quantiles(samples, n=100)
+        stats = metrics.snapshot()
+        self.stdout.write(
+            f"  {label:<12} {len(samples) / elapsed:8.1f} req/s  "
+            f"p50 {quantiles[49]:6.2f}ms  p95 {quantiles[94]:6.2f}ms  p99 {quantiles[98]:6.2f}ms  "
+            f"connects {stats['connections_opened']:>5}  "
+            f"avg connect wait {stats['avg_wait_ms']:.2f}ms  reuse {stats['reuse_ratio'] or 0:.0%}"
+        )
+
+    def worker(self, paths):
+        # The test client disconnects Django's request_started/finished
+        # connection handling, so emulate the request boundaries here.
+        client = Client()
+        samples = []
+        try:
+            for path in paths:
+                start = time.perf_counter()
+                close_old_connections()
+                response = client.get(path, secure=True)
+                close_old_connections()
+                samples.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} returned {response.status_code}")
+        finally:
+            connections.close_all()
+        return samples
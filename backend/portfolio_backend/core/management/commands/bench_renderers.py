@@ -0,0 +1,78 @@
+# backend/portfolio_backend/core/management/commands/bench_renderers.py
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.blog.views import POST_LIST_COLUMNS, PostPagination, post_list_data
+from portfolio_backend.core import seeding
+from portfolio_backend.core.renderers import ORJSONParser, ORJSONRenderer
+from projects.models import Project
+from projects.views import PROJECT_LIST_COLUMNS, ProjectPagination, project_list_rows
+
+BACKENDS = [('stdlib', JSONRenderer, JSONParser), ('orjson', ORJSONRenderer, ORJSONParser)]
+
+
+def payloads(n):
+    """Project and post list bodies with `n` rows, shaped like a paginated response"""
+    projects = Project.objects.published().order_by(*ProjectPagination.ordering).values(*PROJECT_LIST_COLUMNS)[:n]
+    posts = BlogPost.objects.filter(is_published=True).order_by(*PostPagination.ordering).values(*POST_LIST_COLUMNS)[:n]
+    return [
+        ('projects', {'next': None, 'previous': None, 'results': project_list_rows(list(projects))}),
+        ('posts', {'next': None, 'previous': None, 'results': [post_list_data(row) for row in posts]}),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time JSONRenderer/JSONParser against the orjson pair (API_JSON_BACKEND) on "
+        "project and post list payloads of each --sizes, built from seeded data that "
+        "is rolled back afterwards. Both renderers must produce identical bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[20, 1000, 10000])
+        parser.add_argument('--repeat', type=int, default=5, help="Runs per backend; the best is reported")
+        parser.add_argument('--techs', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=919)
+
+    def handle(self, *args, **options):
+        sizes = options['sizes']
+        with transaction.atomic():
+            # About 5-10% of seeded rows are unpublished
+            rows = max(sizes) * 6 // 5
+            seeding.seed(projects=rows, posts=rows, techs=options['techs'], seed=options['seed'])
+            for n in sizes:
+                for label, data in payloads(n):
+                    self.compare(label, n, data, options['repeat'])
+            transaction.set_rollback(True)
+
+    def compare(self, label, n, data, repeat):
+        bodies = {name: renderer().render(data) for name, renderer, _ in BACKENDS}
+        if bodies['stdlib'] != bodies['orjson']:
+            raise CommandError(f"{label}: orjson output differs from JSONRenderer at n={n}")
+        body = bodies['stdlib']
+
+        render, parse = {}, {}
+        for name, renderer, parser in BACKENDS:
+            render[name] = self.best(lambda: renderer().render(data), repeat)
+            parse[name] = self.best(lambda: parser().parse(BytesIO(body)), repeat)
+        self.stdout.write(
+            f"  {label:<8} n={n:<6} {len(body) / 1024:8.0f} KiB  "
+            f"render {render['stdlib'] * 1000:7.2f}ms -> {render['orjson'] * 1000:6.2f}ms "
+            f"({render['stdlib'] / render['orjson']:4.1f}x)  "
+            f"parse {parse['stdlib'] * 1000:7.2f}ms -> {parse['orjson'] * 1000:6.2f}ms "
+            f"({parse['stdlib'] / parse['orjson']:4.1f}x)"
+        )
+
+    def best(self, fn, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
@@ -0,0 +1,92 @@
+# backend/portfolio_backend/core/management/commands/bench_serializers.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.blog.views import POST_LIST_COLUMNS, PostPagination, post_list_data
+from portfolio_backend.core import seeding
+from projects.models import Project
+from projects.serializers import ProjectListSerializer
+from projects.views import PROJECT_LIST_COLUMNS, ProjectPagination, project_list_rows
+
+
+def projects_serializer(n):
+    projects = Project.objects.published().with_technologies().order_by(*ProjectPagination.ordering)[:n]
+    return ProjectListSerializer(projects, many=True).data
+
+
+def projects_values(n):
+    rows = Project.objects.published().order_by(*ProjectPagination.ordering).values(*PROJECT_LIST_COLUMNS)[:n]
+    return project_list_rows(list(rows))
+
+
+def posts_instances(n):
+    # The list view before values(): full model instances, read by attribute
+    posts = BlogPost.objects.filter(is_published=True).order_by(*PostPagination.ordering)[:n]
+    return [post_list_data({column: getattr(post, column) for column in POST_LIST_COLUMNS}) for post in posts]
+
+
+def posts_values(n):
+    rows = BlogPost.objects.filter(is_published=True).order_by(*PostPagination.ordering).values(*POST_LIST_COLUMNS)[:n]
+    return [post_list_data(row) for row in rows]
+
+
+CASES = [
+    ('projects', projects_serializer, projects_values),
+    ('posts', posts_instances, posts_values),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the values()-based list row builders against model instances and "
+        "ProjectListSerializer at each --sizes, on seeded data that is rolled back "
+        "afterwards. Both paths must produce identical rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000])
+        parser.add_argument('--repeat', type=int, default=5, help="Runs per path; the best is reported")
+        parser.add_argument('--techs', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=919)
+
+    def handle(self, *args, **options):
+        sizes = options['sizes']
+        try:
+            with transaction.atomic():
+                # About 5-10% of seeded rows are unpublished
+                rows = max(sizes) * 6 // 5
+                seeding.seed(projects=rows, posts=rows, techs=options['techs'], seed=options['seed'])
+                for label, baseline, fast in CASES:
+                    for n in sizes:
+                        self.compare(label, n, baseline, fast, options['repeat'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def compare(self, label, n, baseline, fast, repeat):
+        expected, actual = baseline(n), fast(n)
+        if len(actual) != n:
+            raise CommandError(f"{label}: only {len(actual)} of {n} rows seeded")
+        if expected != actual:
+            raise CommandError(f"{label}: values() rows differ from the baseline at n={n}")
+
+        slow, quick = self.best(baseline, n, repeat), self.best(fast, n, repeat)
+        self.stdout.write(
+            f"  {label:<8} n={n:<6} baseline {slow * 1000:8.1f}ms  values() {quick * 1000:8.1f}ms  "
+            f"speedup {slow / quick:4.1f}x"
+        )
+
+    def best(self, fn, n, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(n)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
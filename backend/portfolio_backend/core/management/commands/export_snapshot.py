@@ -0,0 +1,32 @@
+# backend/portfolio_backend/core/management/commands/export_snapshot.py
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_backend.core.snapshot import Snapshot, SnapshotError
+
+
+class Command(BaseCommand):
+    help = (
+        "Write every public GET endpoint, including each published project and post, "
+        "to content-hashed JSON files plus manifest.json. Only endpoints whose source "
+        "rows changed since the last export are rendered again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.SNAPSHOT_ROOT, help="Snapshot directory")
+        parser.add_argument('--base-url', default=settings.SNAPSHOT_BASE_URL,
+                            help="Public API origin, used in pagination links")
+        parser.add_argument('--full', action='store_true', help="Render everything, ignoring the previous manifest")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            result = Snapshot(options['output'], options['base_url']).export(full=options['full'])
+        except SnapshotError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(
+            f"Snapshot in {options['output']}: {result['rendered']} rendered, {result['unchanged']} unchanged, "
+            f"{result['removed']} stale file(s) removed in {time.perf_counter() - start:.1f}s"
+        ))
@@ -0,0 +1,147 @@
+# backend/portfolio_backend/core/management/commands/index_advisor.py
+import json
+
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+
+from portfolio_backend.blog import search
+from .bench_api import Command as BenchApiCommand
+
+
+class QueryRecorder:
+    """execute_wrapper that keeps each distinct SELECT with its parameters"""
+
+    def __init__(self):
+        self.queries = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip().upper().startswith('SELECT'):
+            self.queries.setdefault(sql, params)
+        return execute(sql, params, many, context)
+
+
+def postgresql_plan(cursor, sql, params):
+    cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    steps = []
+
+    def walk(node):
+        kind = node['Node Type']
+        if kind == 'Seq Scan':
+            steps.append(('scan', node['Relation Name'], f"Seq Scan on {node['Relation Name']}"))
+        elif kind in ('Sort', 'Incremental Sort'):
+            steps.append(('sort', None, f"{kind} by {', '.join(node.get('Sort Key', []))}"))
+        else:
+            steps.append(('ok', node.get('Relation Name'), kind + (f" on {node['Relation Name']}" if 'Relation Name' in node else '')))
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(plan[0]['Plan'])
+    return steps
+
+
+def sqlite_plan(cursor, sql, params):
+    cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+    steps = []
+    for *_, detail in cursor.fetchall():
+        words = detail.split()
+        if words[0] == 'SCAN' and 'USING' not in words and words[1] not in ('CONSTANT', 'SUBQUERY'):
+            steps.append(('scan', words[1], detail))
+        elif 'TEMP B-TREE' in detail:
+            steps.append(('sort', None, detail))
+        else:
+            steps.append(('ok', None, detail))
+    return steps
+
+
+PLANNERS = {'postgresql': postgresql_plan, 'sqlite': sqlite_plan}
+
+
+class Command(BenchApiCommand):
+    help = (
+        "Seed synthetic data, request every GET route in projects.urls, blog.urls and "
+        "core.urls, run EXPLAIN on each query they issue and flag sequential scans of "
+        "tables with at least --min-rows rows (and sorts the indexes do not cover). "
+        "Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=2000)
+        parser.add_argument('--posts', type=int, default=20000)
+        parser.add_argument('--techs', type=int, default=100)
+        parser.add_argument('--no-seed', action='store_true', help="Explain against the existing data instead")
+        parser.add_argument('--min-rows', type=int, default=1000,
+                            help="Ignore sequential scans of smaller tables (cheaper than an index lookup)")
+        parser.add_argument('--only', nargs='+', default=[], help="Only routes containing one of these strings")
+        parser.add_argument('--strict', action='store_true', help="Exit with an error if anything is flagged")
+
+    def handle(self, *args, **options):
+        plan = PLANNERS.get(connection.vendor)
+        if plan is None:
+            raise CommandError(f"index_advisor supports PostgreSQL and SQLite, not {connection.vendor}")
+
+        overrides = {
+            'ALLOWED_HOSTS': ['*'],
+            'SECURE_SSL_REDIRECT': False,
+            'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+        }
+        with override_settings(**overrides), transaction.atomic():
+            if not options['no_seed']:
+                self.seed(options['projects'], options['posts'], options['techs'])
+            with connection.cursor() as cursor:
+                # Planner statistics for the seeded rows
+                cursor.execute('ANALYZE')
+                self.row_counts = {}
+                flagged = sum(
+                    self.advise(cursor, plan, route, path, options)
+                    for route, method, path in self.routes(options['only'])
+                    if method == 'GET'
+                )
+            transaction.set_rollback(True)
+        search._index = None
+
+        if flagged:
+            message = f"{flagged} sequential scan(s) of tables with {options['min_rows']}+ rows"
+            if options['strict']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"No sequential scans of tables with {options['min_rows']}+ rows"))
+
+    def advise(self, cursor, plan, route, path, options):
+        """Print the plan notes for one route; returns the number of flagged scans"""
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = Client().get(path)
+        self.stdout.write(f"\nGET {route} ({path}): {response.status_code}, {len(recorder.queries)} distinct queries")
+
+        flagged = 0
+        for sql, params in recorder.queries.items():
+            notes = []
+            for kind, table, detail in plan(cursor, sql, params):
+                if kind == 'scan' and self.row_count(cursor, table) >= options['min_rows']:
+                    flagged += 1
+                    notes.append(self.style.ERROR(f"SEQ SCAN  {detail} ({self.row_count(cursor, table)} rows)"))
+                elif kind == 'sort':
+                    notes.append(self.style.WARNING(f"sort      {detail}"))
+                elif options['verbosity'] > 1:
+                    notes.append(f"          {detail}")
+            if notes:
+                self.stdout.write(f"  {sql[:160]}{'...' if len(sql) > 160 else ''}")
+                for note in notes:
+                    self.stdout.write(f"    {note}")
+        return flagged
+
+    def row_count(self, cursor, table):
+        if table not in self.row_counts:
+            if table in connection.introspection.table_names(cursor):
+                cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+                self.row_counts[table] = cursor.fetchone()[0]
+            else:
+                # An alias the plan did not resolve; flag it regardless of size
+                self.row_counts[table] = float('inf')
+        return self.row_counts[table]
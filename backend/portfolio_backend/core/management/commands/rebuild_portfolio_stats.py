@@ -0,0 +1,17 @@
+# backend/portfolio_backend/core/management/commands/rebuild_portfolio_stats.py
+from django.core.management.base import BaseCommand
+
+from portfolio_backend.core.models import PortfolioStats
+from portfolio_backend.core.response_cache import invalidate
+
+
+class Command(BaseCommand):
+    help = "Recompute the PortfolioStats snapshot from scratch (e.g. after bulk updates)"
+
+    def handle(self, *args, **options):
+        stats = PortfolioStats.recompute()
+        invalidate('stats')
+        self.stdout.write(self.style.SUCCESS(
+            f"Portfolio stats rebuilt: {stats.total_projects} projects "
+            f"({stats.featured_projects} featured), {stats.technologies_count} technologies"
+        ))
@@ -0,0 +1,40 @@
+# backend/portfolio_backend/core/management/commands/seed.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.core import seeding
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate deterministic synthetic projects, technologies and blog posts with "
+        "bulk inserts, e.g. `manage.py seed --flush --projects 10000 --posts 100000 --techs 200`"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=100)
+        parser.add_argument('--posts', type=int, default=1000)
+        parser.add_argument('--techs', type=int, default=40)
+        parser.add_argument('--seed', type=int, default=0, help="Same seed, same data")
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--flush', action='store_true',
+                            help="Delete existing projects, technologies, posts and highlights first")
+
+    def handle(self, *args, **options):
+        prefix = f"seed{options['seed']}-"
+        if options['flush']:
+            seeding.flush()
+        elif Project.objects.filter(slug__startswith=prefix).exists() or \
+                BlogPost.objects.filter(slug__startswith=prefix).exists():
+            raise CommandError(f"Data for --seed {options['seed']} already exists; pass --flush or another --seed")
+
+        start = time.perf_counter()
+        seeding.seed(
+            projects=options['projects'], posts=options['posts'], techs=options['techs'],
+            seed=options['seed'], batch_size=options['batch_size'],
+            log=lambda message: self.stdout.write(f"  {message}"),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Seeded in {time.perf_counter() - start:.1f}s"))
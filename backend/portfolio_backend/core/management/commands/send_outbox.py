@@ -0,0 +1,36 @@
+# backend/portfolio_backend/core/management/commands/send_outbox.py
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from portfolio_backend.core import outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails; runs as a worker unless --once is given"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Drain what is due now, then exit")
+        parser.add_argument('--batch-size', type=int, default=settings.EMAIL_OUTBOX_BATCH_SIZE)
+        parser.add_argument('--interval', type=float, default=5.0, help="Seconds between polls")
+
+    def handle(self, *args, **options):
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        provider = outbox.get_provider()
+
+        while self.running:
+            close_old_connections()
+            sent, retried, dead = outbox.drain(options['batch_size'], provider)
+            if sent or retried or dead or options['once']:
+                self.stdout.write(f"Outbox: {sent} sent, {retried} scheduled for retry, {dead} dead-lettered")
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+
+    def stop(self, signum, frame):
+        # Finish the current batch, then exit
+        self.running = False
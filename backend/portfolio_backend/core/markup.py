@@ -0,0 +1,135 @@
+# backend/portfolio_backend/core/markup.py
+"""
+Markdown to sanitized HTML, rendered once when content is saved.
+
+Models keep the markdown source as the editable field and store the output
+next to it, along with ``content_hash(...)`` of the sources. A save with
+unchanged sources skips rendering. Bump RENDERER_VERSION when the output
+changes (extensions, allow-list, highlighting) so the next save or
+``recompute_derived`` re-renders every row.
+
+Code is highlighted by Pygments with the ``highlight`` CSS class in both fenced
+blocks and project code snippets; ``HtmlFormatter().get_style_defs('.highlight')``
+gives the stylesheet.
+"""
+import hashlib
+import html
+import json
+import threading
+
+import markdown
+import nh3
+from markdown.extensions.toc import slugify
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import TextLexer, get_lexer_by_name
+from pygments.util import ClassNotFound
+
+RENDERER_VERSION = 1
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'code', 'del', 'div', 'em', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'hr', 'i', 'img', 'li', 'ol', 'p', 'pre', 'span', 'strong', 'sub', 'sup', 'table', 'tbody', 'td',
+    'th', 'thead', 'tr', 'ul',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'img': {'src', 'alt', 'title'},
+    'div': {'class'},
+    'span': {'class'},
+    'code': {'class'},
+    'pre': {'class'},
+    'td': {'align'},
+    'th': {'align'},
+    **{f'h{level}': {'id'} for level in range(1, 7)},
+}
+URL_SCHEMES = {'http', 'https', 'mailto'}
+
+
+def content_hash(*sources):
+    """sha256 of the markdown sources (any JSON-serializable values) and the renderer version"""
+    payload = json.dumps([RENDERER_VERSION, *sources], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def sanitize(html_text):
+    return nh3.clean(html_text, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, url_schemes=URL_SCHEMES)
+
+
+def _toc(tokens):
+    return [
+        {
+            'id': token['id'],
+            'name': html.unescape(token['name']),
+            'level': token['level'],
+            'children': _toc(token['children']),
+        }
+        for token in tokens
+    ]
+
+
+def render_markdown(text, id_prefix=''):
+    """
+    (sanitized HTML, table of contents) for a markdown string. The TOC is a
+    nested list of ``{'id', 'name', 'level', 'children'}``; heading ids get
+    `id_prefix` so several rendered fields can share one page.
+    """
+    if not text:
+        return '', []
+    md = _markdown(id_prefix)
+    return sanitize(md.convert(text)), _toc(md.toc_tokens)
+
+
+_local = threading.local()
+
+
+def _markdown(id_prefix):
+    # Building a Markdown instance costs more than converting a typical post;
+    # instances are reused per thread (they are not thread-safe) and reset per use
+    instances = _local.__dict__.setdefault('instances', {})
+    md = instances.get(id_prefix)
+    if md is None:
+        md = instances[id_prefix] = markdown.Markdown(
+            extensions=['fenced_code', 'tables', 'toc', 'codehilite'],
+            extension_configs={
+                'codehilite': {'css_class': 'highlight', 'guess_lang': False},
+                'toc': {'slugify': lambda value, separator: id_prefix + slugify(value, separator)},
+            },
+        )
+    return md.reset()
+
+
+def render_sections(sections):
+    """
+    Render several markdown fields shown on one page: [(key, name, text)] ->
+    ({key: html}, toc). The TOC has one entry per non-empty section with the
+    section's own headings nested, and heading ids are prefixed per section.
+    """
+    rendered, toc = {}, []
+    for key, name, text in sections:
+        section = key.replace('_', '-')
+        rendered[key], headings = render_markdown(text, id_prefix=f'{section}-')
+        if rendered[key]:
+            toc.append({'id': section, 'name': name, 'level': 1, 'children': headings})
+    return rendered, toc
+
+
+def highlight_code(code, language):
+    try:
+        lexer = get_lexer_by_name(language or 'text')
+    except ClassNotFound:
+        lexer = TextLexer()
+    return sanitize(highlight(code or '', lexer, HtmlFormatter(cssclass='highlight')))
+
+
+def highlight_snippets(snippets):
+    """ProjectDetail.code_snippets with the code replaced by highlighted HTML"""
+    return [
+        {
+            'title': snippet.get('title', ''),
+            'language': snippet.get('language', ''),
+            'html': highlight_code(snippet.get('code', ''), snippet.get('language')),
+        }
+        for snippet in snippets or []
+        if isinstance(snippet, dict)
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.0 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+def build_snapshot(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Technology = apps.get_model('projects', 'Technology')
+    SiteConfiguration = apps.get_model('projects', 'SiteConfiguration')
+    PortfolioStats = apps.get_model('core', 'PortfolioStats')
+
+    published = Project.objects.filter(is_published=True)
+    config = SiteConfiguration.objects.first()
+    PortfolioStats.objects.update_or_create(
+        pk=1,
+        defaults={
+            'total_projects': published.count(),
+            'featured_projects': published.filter(is_featured=True).count(),
+            'technologies_count': Technology.objects.count(),
+            'years_experience': config.years_experience if config else 2,
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_add_bluesky_and_preferences'),
+        ('projects', '0002_siteconfiguration_alter_techcategory_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_projects', models.IntegerField(default=0)),
+                ('featured_projects', models.IntegerField(default=0)),
+                ('technologies_count', models.IntegerField(default=0)),
+                ('years_experience', models.IntegerField(default=2)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Portfolio Stats',
+                'verbose_name_plural': 'Portfolio Stats',
+            },
+        ),
+        migrations.RunPython(build_snapshot, migrations.RunPython.noop),
+    ]
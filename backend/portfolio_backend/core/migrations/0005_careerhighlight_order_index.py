@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_outboxemail'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='careerhighlight',
+            index=models.Index(fields=['-is_current', '-order', '-id'], name='highlight_order_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 # backend/portfolio_backend/core/models.py
 from django.db import models
+from django.utils import timezone
 from cloudinary.models import CloudinaryField
 
 
@@ -14,6 +15,9 @@ class CareerHighlight(models.Model):
     
     class Meta:
         ordering = ['-is_current', '-order', '-id']
+        indexes = [
+            models.Index(fields=['-is_current', '-order', '-id'], name='highlight_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} at {self.organization}"
@@ -77,4 +81,91 @@ class SiteConfiguration(models.Model):
         # Ensure only one configuration exists
         if SiteConfiguration.objects.exists() and not self.pk:
             return SiteConfiguration.objects.first()
-        return super().save(*args, **kwargs)
\ No newline at end of file
+        return super().save(*args, **kwargs)
+
+class PortfolioStats(models.Model):
+    """Precomputed /stats/ payload, kept current by signals in core/stats.py"""
+    SINGLETON_PK = 1
+    
+    total_projects = models.IntegerField(default=0)
+    featured_projects = models.IntegerField(default=0)
+    technologies_count = models.IntegerField(default=0)
+    years_experience = models.IntegerField(default=2)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Portfolio Stats"
+        verbose_name_plural = "Portfolio Stats"
+    
+    def __str__(self):
+        return f"{self.total_projects} projects, {self.technologies_count} technologies"
+    
+    @classmethod
+    def recompute(cls):
+        """Rebuild the snapshot from scratch (used on first read and by the repair command)"""
+        from projects.models import Project, Technology, SiteConfiguration as ProjectsSiteConfiguration
+        
+        published = Project.objects.filter(is_published=True)
+        config = ProjectsSiteConfiguration.objects.first()
+        stats, _ = cls.objects.update_or_create(
+            pk=cls.SINGLETON_PK,
+            defaults={
+                'total_projects': published.count(),
+                'featured_projects': published.filter(is_featured=True).count(),
+                'technologies_count': Technology.objects.count(),
+                'years_experience': config.years_experience if config else 2,
+            },
+        )
+        return stats
+
+
+class OutboxEmail(models.Model):
+    """Email waiting to be delivered by `manage.py send_outbox` (see core/outbox.py)"""
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_DEAD = 'dead'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_DEAD, 'Dead letter'),
+    ]
+    
+    contact = models.ForeignKey(ContactSubmission, on_delete=models.SET_NULL, null=True, blank=True, related_name='emails')
+    from_email = models.CharField(max_length=200)
+    to = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list, blank=True)
+    subject = models.CharField(max_length=300)
+    html = models.TextField()
+    
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    provider_message_id = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['next_attempt_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='core_outbox_due_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
+
+
+class ContentVersion(models.Model):
+    """
+    Change counter per response-cache group, bumped in the database by
+    response_cache.invalidate(). ETags built from it change in every worker,
+    whichever one saved the change (see core/conditional.py).
+    """
+    group = models.CharField(max_length=50, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.group} v{self.version}"
@@ -0,0 +1,169 @@
+# backend/portfolio_backend/core/nplusone.py
+"""
+N+1 query detection.
+
+Every SQL statement a request runs is reduced to a fingerprint (placeholders
+only, ``IN (...)`` lists collapsed). When one fingerprint repeats more than
+``NPLUSONE_THRESHOLD`` times, the request is flagged with the view, the
+serializer field being rendered and the first line of project code that issued
+the query. ``NPLUSONE_DETECTION`` picks what happens:
+
+- ``'off'``: nothing (the middleware steps aside)
+- ``'log'``: a warning on the ``portfolio_backend.nplusone`` logger (default in DEBUG)
+- ``'raise'``: ``NPlusOneError`` (set by NPlusOneTestRunner for the test suite)
+
+Tests can also wrap any block in ``detect_nplusone()``.
+"""
+import logging
+import os
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+logger = logging.getLogger('portfolio_backend.nplusone')
+
+IGNORED = re.compile(r'^\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK|BEGIN|COMMIT)\b', re.IGNORECASE)
+IN_LIST = re.compile(r'\bIN \((?:%s, )*%s\)', re.IGNORECASE)
+WHITESPACE = re.compile(r'\s+')
+THIS_FILE = os.path.abspath(__file__)
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    return WHITESPACE.sub(' ', IN_LIST.sub('IN (...)', sql)).strip()
+
+
+def _is_project_code(filename):
+    filename = os.path.abspath(filename)
+    return (
+        filename.startswith(str(settings.BASE_DIR))
+        and filename != THIS_FILE
+        and 'site-packages' not in filename
+        and f'{os.sep}management{os.sep}' not in filename
+    )
+
+
+def query_origin():
+    """(serializer field, project code location) of the query being executed"""
+    serializer_field = code = None
+    frame = sys._getframe(2)
+    while frame is not None and (serializer_field is None or code is None):
+        local = frame.f_locals
+        if serializer_field is None and frame.f_code.co_name == 'to_representation' and 'field' in local:
+            field, owner = local['field'], local.get('self')
+            if hasattr(field, 'field_name') and owner is not None:
+                serializer_field = f'{type(owner).__name__}.{field.field_name}'
+        if code is None and _is_project_code(frame.f_code.co_filename):
+            path = os.path.relpath(frame.f_code.co_filename, settings.BASE_DIR)
+            code = f'{path}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return serializer_field, code
+
+
+class QueryTracker:
+    """execute_wrapper that counts fingerprints; origins are captured once per repeated shape"""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = Counter()
+        self.origins = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if not IGNORED.match(sql):
+            key = fingerprint(sql)
+            self.counts[key] += 1
+            if self.counts[key] == self.threshold + 1:
+                self.origins[key] = query_origin()
+        return execute(sql, params, many, context)
+
+    def offenders(self):
+        return [(sql, n, self.origins[sql]) for sql, n in self.counts.most_common() if n > self.threshold]
+
+
+def report(offenders, where):
+    lines = [f"N+1 queries in {where}:"]
+    for sql, count, (serializer_field, code) in offenders:
+        origin = ', '.join(part for part in (serializer_field and f'serializer field {serializer_field}', code) if part)
+        lines.append(f"  {count}x {sql[:300]}")
+        if origin:
+            lines.append(f"      from {origin}")
+    return '\n'.join(lines)
+
+
+def threshold():
+    return getattr(settings, 'NPLUSONE_THRESHOLD', 5)
+
+
+@contextmanager
+def detect_nplusone(limit=None, using=None):
+    """Raise NPlusOneError if any query shape inside the block repeats more than `limit` times"""
+    tracker = QueryTracker(threshold() if limit is None else limit)
+    conn = connection if using is None else using
+    with conn.execute_wrapper(tracker):
+        yield tracker
+    offenders = tracker.offenders()
+    if offenders:
+        raise NPlusOneError(report(offenders, "block"))
+
+
+def view_path(request):
+    match = request.resolver_match
+    if match is None:
+        return 'unresolved view'
+    # Class-based and @api_view views expose their class; name it, not the wrapper
+    func = getattr(match.func, 'view_class', match.func)
+    return f'{func.__module__}.{func.__name__}'
+
+
+class NPlusOneMiddleware:
+    """Opt-in per request detection; see module docstring for settings"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = getattr(settings, 'NPLUSONE_DETECTION', 'off')
+        if mode == 'off':
+            return self.get_response(request)
+
+        tracker = QueryTracker(threshold())
+        with connection.execute_wrapper(tracker):
+            response = self.get_response(request)
+
+        offenders = tracker.offenders()
+        if offenders:
+            message = report(offenders, f"{view_path(request)} ({request.method} {request.path})")
+            if mode == 'raise':
+                raise NPlusOneError(message)
+            logger.warning(message)
+        return response
+
+
+class NPlusOneTestRunner(DiscoverRunner):
+    """Test runner that makes every request through the test client fail on N+1 queries"""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.nplusone_settings = override_settings(NPLUSONE_DETECTION='raise')
+        self.nplusone_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.nplusone_settings.disable()
+        super().teardown_test_environment(**kwargs)
+
+    def teardown_databases(self, old_config, **kwargs):
+        # Views buffered by the tests belong to the test database; drop them
+        # before it goes, so no timer or exit flush writes them to the real one
+        from portfolio_backend.blog import view_counter
+
+        view_counter.reset()
+        super().teardown_databases(old_config, **kwargs)
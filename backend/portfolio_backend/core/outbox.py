@@ -0,0 +1,208 @@
+# backend/portfolio_backend/core/outbox.py
+"""
+Transactional outbox for outgoing email.
+
+Views call ``enqueue_contact_notification(contact)`` inside the same transaction
+that saves the ContactSubmission, so the request only pays for two INSERTs. The
+``send_outbox`` management command claims due rows in batches, hands them to the
+configured provider, and retries failures with exponential backoff until
+``EMAIL_OUTBOX_MAX_ATTEMPTS``, after which the row is dead-lettered for review
+in the admin.
+
+``send_batch(emails)`` returns one result per email: its provider message id,
+or the exception that email failed with. Only the failed ones are retried. A
+provider that raises instead sent none of the batch.
+"""
+import logging
+from datetime import timedelta
+from html import escape
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+class ResendProvider:
+    """Delivers through the Resend batch API (one HTTP call per batch, all or nothing)"""
+
+    def send_batch(self, emails):
+        import resend
+
+        resend.api_key = settings.RESEND_API_KEY
+        response = resend.Batch.send([
+            {
+                'from': email.from_email,
+                'to': email.to,
+                'subject': email.subject,
+                'html': email.html,
+                'reply_to': email.reply_to,
+            }
+            for email in emails
+        ])
+        return [item['id'] for item in response['data']]
+
+
+class DjangoMailProvider:
+    """Delivers through Django's EMAIL_BACKEND, one message at a time"""
+
+    def send_batch(self, emails):
+        from django.core.mail import EmailMessage, get_connection
+
+        results = []
+        with get_connection() as connection:
+            for email in emails:
+                message = EmailMessage(
+                    subject=email.subject, body=email.html, from_email=email.from_email,
+                    to=email.to, reply_to=email.reply_to, connection=connection,
+                )
+                message.content_subtype = 'html'
+                try:
+                    message.send()
+                except Exception as error:
+                    results.append(error)
+                else:
+                    results.append('')
+        return results
+
+
+def get_provider():
+    return import_string(settings.EMAIL_OUTBOX_PROVIDER)()
+
+
+def render_contact_html(contact):
+    name, email, company = escape(contact.name), escape(contact.email), escape(contact.company)
+    subject = escape(contact.subject)
+    message = escape(contact.message).replace('\n', '<br>')
+    company_row = f'<p style="margin: 10px 0;"><strong>Company:</strong> {company}</p>' if company else ''
+    return f"""
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <h2 style="color: #2563eb; border-bottom: 2px solid #e5e7eb; padding-bottom: 10px;">
+                    New Portfolio Contact Form Submission
+                </h2>
+
+                <div style="background: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
+                    <p style="margin: 10px 0;"><strong>Name:</strong> {name}</p>
+                    <p style="margin: 10px 0;"><strong>Email:</strong> {email}</p>
+                    {company_row}
+                    <p style="margin: 10px 0;"><strong>Subject:</strong> {subject}</p>
+                </div>
+
+                <div style="background: #ffffff; border: 1px solid #e5e7eb; padding: 20px; border-radius: 8px;">
+                    <h3 style="color: #374151; margin-top: 0;">Message:</h3>
+                    <div style="background: #f5f5f5; padding: 15px; border-radius: 5px; line-height: 1.6;">
+                        {message}
+                    </div>
+                </div>
+
+                <div style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 14px;">
+                    <p>Sent from your portfolio contact form at iamdevnd.dev</p>
+                    <p>Time: {contact.submitted_at.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+                </div>
+            </div>
+            """
+
+
+def enqueue_contact_notification(contact):
+    """Queue the owner notification for `contact`; call inside the request's transaction"""
+    return OutboxEmail.objects.create(
+        contact=contact,
+        from_email=settings.CONTACT_FROM_EMAIL,
+        to=[settings.CONTACT_NOTIFICATION_EMAIL],
+        reply_to=[contact.email],
+        subject=f"Portfolio Contact: {contact.subject}",
+        html=render_contact_html(contact),
+    )
+
+
+def backoff(attempts):
+    """Delay before the next try: base * 2^(attempts-1), capped"""
+    base = settings.EMAIL_OUTBOX_BACKOFF_SECONDS
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS))
+
+
+def claim_batch(batch_size):
+    """
+    Mark up to `batch_size` due emails as sending and return them. Rows claimed by a
+    worker that died mid-send become due again after EMAIL_OUTBOX_CLAIM_TIMEOUT; that
+    send counts as an attempt, so a row that keeps killing the worker is dead-lettered.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.EMAIL_OUTBOX_CLAIM_TIMEOUT)
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=OutboxEmail.STATUS_PENDING, next_attempt_at__lte=now)
+                | Q(status=OutboxEmail.STATUS_SENDING, claimed_at__lt=stale)
+            )
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        reclaimed = [email for email in emails if email.status == OutboxEmail.STATUS_SENDING]
+        for email in reclaimed:
+            email.attempts += 1
+            email.last_error = "Claim timed out: the worker stopped while sending"
+            if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                email.status = OutboxEmail.STATUS_DEAD
+                email.claimed_at = None
+                logger.warning("Outbox email %d dead-lettered after %d attempts", email.pk, email.attempts)
+        if reclaimed:
+            OutboxEmail.objects.bulk_update(reclaimed, ['attempts', 'last_error', 'status', 'claimed_at'])
+
+        emails = [email for email in emails if email.status != OutboxEmail.STATUS_DEAD]
+        OutboxEmail.objects.filter(pk__in=[e.pk for e in emails]).update(
+            status=OutboxEmail.STATUS_SENDING, claimed_at=now,
+        )
+    return emails
+
+
+def deliver(emails, provider):
+    """Send one claimed batch; returns (sent, retried, dead)"""
+    now = timezone.now()
+    try:
+        results = provider.send_batch(emails)
+    except Exception as error:
+        logger.warning("Outbox batch of %d failed: %s", len(emails), error)
+        results = [error] * len(emails)
+
+    sent = retried = dead = 0
+    for email, result in zip(emails, results):
+        email.attempts += 1
+        email.claimed_at = None
+        if isinstance(result, Exception):
+            email.last_error = str(result)[:2000]
+            if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                email.status = OutboxEmail.STATUS_DEAD
+                dead += 1
+            else:
+                email.status = OutboxEmail.STATUS_PENDING
+                email.next_attempt_at = now + backoff(email.attempts)
+                retried += 1
+        else:
+            email.status = OutboxEmail.STATUS_SENT
+            email.sent_at = now
+            email.provider_message_id = result or ''
+            sent += 1
+    OutboxEmail.objects.bulk_update(
+        emails,
+        ['attempts', 'claimed_at', 'status', 'last_error', 'next_attempt_at', 'sent_at', 'provider_message_id'],
+    )
+    return sent, retried, dead
+
+
+def drain(batch_size=None, provider=None):
+    """Deliver every email that is currently due; returns (sent, retried, dead)"""
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    provider = provider or get_provider()
+    totals = [0, 0, 0]
+    while True:
+        emails = claim_batch(batch_size)
+        if not emails:
+            return tuple(totals)
+        for i, n in enumerate(deliver(emails, provider)):
+            totals[i] += n
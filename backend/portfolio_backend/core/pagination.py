@@ -0,0 +1,196 @@
+# backend/portfolio_backend/core/pagination.py
+"""
+Keyset (seek) pagination.
+
+Pages are ordered by ``ordering``, whose last field must be unique (``id``), and
+each page continues from the boundary row of the previous one with a
+``WHERE (a, b, id) after (...)`` condition instead of an OFFSET. So page 500 costs
+the same as page 1, as long as an index matches ``ordering``. Cursors are opaque
+base64 JSON holding the boundary row's ordering values and the direction.
+
+There is no COUNT(*) unless the client asks for it with ``?count=true``. The
+count is cached per filtered queryset, and writes to ``count_groups`` (response
+cache groups, see response_cache.MODEL_GROUPS) make the cached value stale.
+
+Ranked lists, such as in-process search results, are paginated with the same
+cursors by filtering in Python.
+"""
+import base64
+import binascii
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from . import response_cache
+
+
+class KeysetPagination(BasePagination):
+    ordering = ('-id',)
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    count_groups = ()
+    count_timeout = 300
+    invalid_cursor_message = 'Invalid cursor'
+
+    @property
+    def fields(self):
+        return [(field.lstrip('-'), field.startswith('-')) for field in self.ordering]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        source = self.start(queryset, request)
+        rows = list(source)
+        count = self.get_count(queryset) if self.wants_count() else None
+        return self.finish(rows, count)
+
+    async def apaginate_queryset(self, queryset, request):
+        """paginate_queryset for async views (raises NotFound the same way)"""
+        source = self.start(queryset, request)
+        if isinstance(source, QuerySet):
+            rows = [obj async for obj in source]
+        else:
+            rows = list(source)
+        count = await sync_to_async(self.get_count)(queryset) if self.wants_count() else None
+        return self.finish(rows, count)
+
+    def get_paginated_data(self, data):
+        paginated = {'next': self.get_next_link(), 'previous': self.get_previous_link(), 'results': data}
+        if self.count is not None:
+            paginated = {'count': self.count, **paginated}
+        return paginated
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def start(self, queryset, request):
+        """Read the cursor and return the page_size + 1 rows to fetch in the direction of travel"""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request, queryset)
+        values, reverse = self.cursor or (None, False)
+
+        if isinstance(queryset, QuerySet):
+            queryset = queryset.order_by(*[
+                ('-' if descending != reverse else '') + name for name, descending in self.fields
+            ])
+            if values is not None:
+                queryset = queryset.filter(self.seek(values, reverse))
+            return queryset[:self.page_size + 1]
+
+        # A list already sorted by `ordering`
+        rows = list(queryset)
+        if reverse:
+            rows.reverse()
+        if values is not None:
+            rows = [row for row in rows if self.follows(self.position(row), values, reverse)]
+        return rows[:self.page_size + 1]
+
+    def finish(self, rows, count):
+        reverse = self.cursor is not None and self.cursor[1]
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+        # Going backwards, there is a next page: the one we came from
+        self.has_next = reverse or has_more
+        self.has_previous = has_more if reverse else self.cursor is not None
+        self.page = rows
+        self.count = count
+        return rows
+
+    def seek(self, values, reverse):
+        """
+        (a, b, id) strictly after `values`, spelled out per column since the
+        directions can be mixed. The OR chain alone leaves the first column
+        unbounded, so the planner would read the index from its start and filter
+        (as slow as OFFSET); the redundant ``a <= X`` (``>=`` ascending) gives it
+        an index range condition that starts the scan at the cursor.
+        """
+        condition = Q()
+        for i, (name, descending) in enumerate(self.fields):
+            lookup = 'lt' if descending != reverse else 'gt'
+            equal = {prior: value for (prior, _), value in zip(self.fields[:i], values[:i])}
+            condition |= Q(**equal, **{f'{name}__{lookup}': values[i]})
+        first, descending = self.fields[0]
+        bound = Q(**{f"{first}__{'lte' if descending != reverse else 'gte'}": values[0]})
+        return bound & condition
+
+    def follows(self, position, values, reverse):
+        for (name, descending), value, boundary in zip(self.fields, position, values):
+            if value != boundary:
+                return (value < boundary) == (descending != reverse)
+        return False
+
+    def position(self, obj):
+        if isinstance(obj, dict):  # values() rows
+            return [obj[name] for name, _ in self.fields]
+        return [getattr(obj, name) for name, _ in self.fields]
+
+    def wants_count(self):
+        return self.request.GET.get(self.count_query_param, '').lower() in ('1', 'true')
+
+    def get_count(self, queryset):
+        if not isinstance(queryset, QuerySet):
+            return len(queryset)
+        sql, params = queryset.order_by().query.sql_with_params()
+        versions = '.'.join(str(v) for v in response_cache.group_versions(self.count_groups))
+        key = f"keyset-count:{versions}:{hashlib.md5(repr((sql, params)).encode()).hexdigest()}"
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, self.count_timeout)
+        return count
+
+    def encode_cursor(self, obj, reverse):
+        values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in self.position(obj)]
+        payload = json.dumps({'p': values, 'r': int(reverse)}, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.GET.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        model = getattr(queryset, 'model', None)
+        if model is None and queryset and not isinstance(queryset[0], dict):
+            model = type(queryset[0])
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            values = [
+                self.to_python(model, name, value)
+                for (name, _), value in zip(self.fields, payload['p'], strict=True)
+            ]
+            return values, bool(payload['r'])
+        except (TypeError, ValueError, KeyError, ValidationError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_python(self, model, name, value):
+        if model is None:
+            return value
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Annotations such as a search rank stay as decoded from JSON
+            return value
+        if value is None:
+            raise ValidationError('Ordering fields must not be null')
+        return field.to_python(value)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
@@ -0,0 +1,56 @@
+# backend/portfolio_backend/core/renderers.py
+"""
+orjson-backed JSON renderer and parser, chosen with API_JSON_BACKEND in settings.
+
+The output is byte-for-byte what DRF's JSONRenderer produces with the default
+COMPACT_JSON/UNICODE_JSON settings, so ETags and cached bodies do not change
+when switching backends. orjson encodes dicts, lists, strings and numbers
+itself. Datetimes, dates and times go through DRF's encoder (orjson writes UTC
+and sub-minute offsets differently), as do Decimals, lazy translation strings
+and the other types orjson does not know. Indented output (``Accept:
+application/json; indent=4``) and payloads orjson refuses, such as integers
+beyond 64 bits, fall back to JSONRenderer.
+"""
+import re
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+# U+2028/U+2029 end a JavaScript string literal, so JSONRenderer escapes them too
+# (their UTF-8 encodings: E2 80 A8 and E2 80 A9)
+LINE_SEPARATORS = re.compile(rb'\xe2\x80[\xa8\xa9]')
+ESCAPES = {b'\xe2\x80\xa8': b'\\u2028', b'\xe2\x80\xa9': b'\\u2029'}
+
+
+class ORJSONRenderer(JSONRenderer):
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not self.compact or self.ensure_ascii or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if LINE_SEPARATORS.search(ret):  # one scan in the common case
+            ret = LINE_SEPARATORS.sub(lambda match: ESCAPES[match.group()], ret)
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            # orjson only reads UTF-8
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
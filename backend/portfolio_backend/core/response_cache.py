@@ -0,0 +1,224 @@
+# backend/portfolio_backend/core/response_cache.py
+"""
+Response cache for read-mostly GET endpoints.
+
+Views opt in with ``@cache_response('group', ...)``. Rendered responses are
+stored under the request path + query string together with the current version
+of each group they depend on. Saving or deleting a model bumps the versions of
+the groups it feeds (see MODEL_GROUPS), so stale entries are never read again
+and simply age out of the cache.
+
+Run more than one worker only with a shared cache (REDIS_URL; render.yaml
+provisions one): with the local-memory fallback each process invalidates only
+its own entries, and the others serve stale ones until they expire.
+"""
+import hashlib
+import secrets
+import threading
+from collections import Counter
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Subquery
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse
+
+KEY_PREFIX = 'resp'
+
+# Which cached endpoint groups each model's rows appear in
+MODEL_GROUPS = {
+    'projects.Project': ['projects', 'stats'],
+    'projects.ProjectDetail': ['projects'],
+    'projects.Technology': ['projects', 'tech', 'stats'],
+    'projects.TechCategory': ['projects', 'tech'],
+    'projects.SiteConfiguration': ['site_config', 'stats'],
+    'blog.BlogPost': ['blog'],
+    'core.CareerHighlight': ['highlights'],
+    'core.SiteConfiguration': ['site_config'],
+}
+M2M_GROUPS = {
+    'projects.Project.technologies': ['projects'],
+}
+
+_stats_lock = threading.Lock()
+_hits = Counter()
+_misses = Counter()
+
+
+def _version_key(group):
+    return f'{KEY_PREFIX}:version:{group}'
+
+
+def _new_version():
+    # Random rather than a counter: a counter evicted or lost in a restart would
+    # start over and match entries and ETags built from its earlier values
+    return secrets.token_hex(8)
+
+
+def group_versions(groups):
+    keys = [_version_key(group) for group in groups]
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        for key in missing:
+            cache.add(key, _new_version(), timeout=None)
+        # Another process may have added its own token first; use whichever won
+        found.update(cache.get_many(missing))
+    return [found.get(key, '') for key in keys]
+
+
+def invalidate(*groups):
+    """Give every group a new version so existing entries stop matching"""
+    cache.set_many({_version_key(group): _new_version() for group in groups}, timeout=None)
+    bump_content_versions(groups)
+
+
+def bump_content_versions(groups):
+    """
+    Advance the persisted ContentVersion of each group. Unlike the versions
+    above (per process with the local-memory cache), every worker reads these,
+    so ETags built on them change everywhere.
+    """
+    from .models import ContentVersion
+
+    for group in groups:
+        rows = ContentVersion.objects.filter(group=group)
+        if not rows.update(version=F('version') + 1):
+            _, created = ContentVersion.objects.get_or_create(group=group, defaults={'version': 1})
+            if not created:
+                rows.update(version=F('version') + 1)
+
+
+def content_version(group):
+    """Subquery for the persisted version of `group` (None before its first change)"""
+    from .models import ContentVersion
+
+    return Subquery(ContentVersion.objects.filter(group=group).values('version')[:1])
+
+
+def response_key(request, groups):
+    versions = '.'.join(str(v) for v in group_versions(groups))
+    # Under @conditional the ETag is part of the key too: when it changes (in
+    # the database, for any worker) this worker's entry is not served with it
+    etag = getattr(request, 'conditional_etag', '')
+    digest = hashlib.md5(f'{request.get_full_path()}|{etag}'.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{'+'.join(groups)}:{versions}:{digest}"
+
+
+def _record(counter, groups):
+    with _stats_lock:
+        for group in groups:
+            counter[group] += 1
+
+
+def stats():
+    with _stats_lock:
+        hits, misses = sum(_hits.values()), sum(_misses.values())
+        groups = sorted(set(_hits) | set(_misses))
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else None,
+            'groups': {g: {'hits': _hits[g], 'misses': _misses[g]} for g in groups},
+        }
+
+
+def reset_stats():
+    with _stats_lock:
+        _hits.clear()
+        _misses.clear()
+
+
+def _lookup(request, groups):
+    """(key, cached response or None)"""
+    key = response_key(request, groups)
+    cached = cache.get(key)
+    if cached is None:
+        _record(_misses, groups)
+        return key, None
+    _record(_hits, groups)
+    content, content_type = cached
+    response = HttpResponse(content, content_type=content_type)
+    response['X-Cache'] = 'HIT'
+    return key, response
+
+
+def _store(key, response, timeout):
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code == 200 and not response.streaming:
+        ttl = timeout if timeout is not None else getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300)
+        cache.set(key, (response.content, response['Content-Type']), ttl)
+    response['X-Cache'] = 'MISS'
+    return response
+
+
+def cache_response(*groups, timeout=None):
+    """
+    Cache successful GET responses of a view, invalidated by changes to `groups`.
+
+    Works on function views (put it above ``@api_view``), on async views, and on
+    class-based views through ``method_decorator(..., name='dispatch')``.
+    """
+    groups = tuple(sorted(groups))
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view(request, *args, **kwargs)
+
+                key, response = await sync_to_async(_lookup)(request, groups)
+                if response is not None:
+                    return response
+                response = await view(request, *args, **kwargs)
+                return await sync_to_async(_store)(key, response, timeout)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            key, response = _lookup(request, groups)
+            if response is not None:
+                return response
+            return _store(key, view(request, *args, **kwargs), timeout)
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidator(groups):
+    def receiver(sender, **kwargs):
+        invalidate(*groups)
+    return receiver
+
+
+def _m2m_invalidator(groups):
+    def receiver(sender, action, **kwargs):
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate(*groups)
+    return receiver
+
+
+def connect_signals():
+    """Hook MODEL_GROUPS/M2M_GROUPS up to model signals; called from CoreConfig.ready()"""
+    for label, groups in MODEL_GROUPS.items():
+        model = apps.get_model(label)
+        receiver = _invalidator(groups)
+        post_save.connect(receiver, sender=model, weak=False, dispatch_uid=f'response_cache:save:{label}')
+        post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=f'response_cache:delete:{label}')
+
+    for path, groups in M2M_GROUPS.items():
+        label, field_name = path.rsplit('.', 1)
+        through = getattr(apps.get_model(label), field_name).through
+        m2m_changed.connect(
+            _m2m_invalidator(groups), sender=through, weak=False, dispatch_uid=f'response_cache:m2m:{path}'
+        )
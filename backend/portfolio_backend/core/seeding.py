@@ -0,0 +1,251 @@
+# backend/portfolio_backend/core/seeding.py
+"""
+Deterministic synthetic data for reproducing scaling behaviour locally.
+
+Small tables use ``bulk_create``; projects, posts, details and the M2M through
+table go through ``bulk_insert`` (multi-row INSERTs), so 100k posts / 10k
+projects take seconds rather than minutes. The same ``seed`` always produces the
+same rows, slugs, links and timestamps. Bulk inserts skip model signals, so the
+stats snapshot and response cache are refreshed at the end.
+"""
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from itertools import islice
+
+from django.core.management.color import no_style
+from django.db import connections, router, transaction
+
+from portfolio_backend.blog import derived, search
+from portfolio_backend.blog.models import BlogPost
+from projects.models import Project, ProjectDetail, TechCategory, Technology, technology_slug
+from . import markup, response_cache
+from .models import CareerHighlight, PortfolioStats
+
+CATEGORIES = ["AI/ML", "Backend", "Frontend", "Cloud", "Data", "DevOps"]
+TECH_NAMES = [
+    "Python", "Django", "FastAPI", "PostgreSQL", "Redis", "React", "Next.js", "TypeScript",
+    "AWS", "Docker", "Kubernetes", "PyTorch", "LangChain", "Celery", "Terraform", "Kafka",
+]
+WORDS = (
+    "model agent vector retrieval latency python django postgres index cache embedding "
+    "prompt pipeline inference gpu batch token context graph query deploy cloud serverless "
+    "throughput monitoring evaluation dataset training schema migration queue worker api "
+    "request response client server stream async thread process memory cost scale"
+).split()
+
+# Fixed reference point so timestamps don't depend on when the seed runs
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+PARAGRAPH_POOL = 400
+DETAIL_POOL = 200
+
+
+def bulk_insert(model, objs, batch_size=2000):
+    """
+    INSERT unsaved instances in batches without returning primary keys.
+
+    Values are prepared with each field's get_db_prep_save, so they are stored
+    exactly as the ORM would store them, but auto_now/auto_now_add are not applied
+    and the per-value overhead of bulk_create's SQL compiler (dominant at 100k+
+    rows on Django 5.0) is skipped.
+    """
+    connection = connections[router.db_for_write(model)]
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO %s (%s) VALUES ' % (quote(model._meta.db_table), ', '.join(quote(f.column) for f in fields))
+    placeholders = '(%s)' % ', '.join(['%s'] * len(fields))
+
+    objs = iter(objs)
+    with connection.cursor() as cursor:
+        while batch := list(islice(objs, batch_size)):
+            rows = [[f.get_db_prep_save(getattr(obj, f.attname), connection) for f in fields] for obj in batch]
+            if connection.vendor == 'postgresql':
+                from psycopg2.extras import execute_values
+
+                execute_values(cursor.cursor, sql + '%s', rows, page_size=batch_size)
+            else:
+                cursor.executemany(sql + placeholders, rows)
+
+
+FLUSH_MODELS = [
+    Project.technologies.through, ProjectDetail, Project, Technology, TechCategory, BlogPost, CareerHighlight,
+]
+
+
+def flush():
+    """
+    Empty the portfolio content tables (not users, site configuration or contact
+    data). Uses the same SQL as ``manage.py flush`` (TRUNCATE on PostgreSQL), since
+    a queryset delete() would load every row to send delete signals.
+    """
+    connection = connections[router.db_for_write(Project)]
+    tables = [model._meta.db_table for model in FLUSH_MODELS]
+    connection.ops.execute_sql_flush(connection.ops.sql_flush(no_style(), tables))
+
+
+class Seeder:
+
+    def __init__(self, seed=0, batch_size=2000, log=None):
+        self.rng = random.Random(seed)
+        self.prefix = f"seed{seed}"
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+
+    def text(self, words):
+        return " ".join(self.rng.choices(WORDS, k=words))
+
+    def timestamp(self, max_days):
+        return EPOCH - timedelta(seconds=self.rng.randrange(max_days * 86400))
+
+    def step(self, label, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.log(f"{label}: {time.perf_counter() - start:.2f}s")
+        return result
+
+    def technologies(self, count):
+        categories = TechCategory.objects.bulk_create(
+            TechCategory(name=name, order=i) for i, name in enumerate(CATEGORIES)
+        )
+        names = (
+            TECH_NAMES[i % len(TECH_NAMES)] + (f" {i // len(TECH_NAMES)}" if i >= len(TECH_NAMES) else "")
+            for i in range(count)
+        )
+        return Technology.objects.bulk_create(
+            (
+                Technology(
+                    name=name,
+                    slug=technology_slug(name),  # bulk_create skips save()
+                    category=categories[i % len(categories)],
+                    proficiency=self.rng.randint(1, 5),
+                    description=self.text(12),
+                )
+                for i, name in enumerate(names)
+            ),
+            batch_size=self.batch_size,
+        )
+
+    def projects(self, count, technologies):
+        rows = []
+        for i in range(count):
+            created = self.timestamp(1000)
+            rows.append(Project(
+                title=f"{self.text(3).title()} {i}",
+                slug=f"{self.prefix}-project-{i}",
+                tagline=self.text(10),
+                github_url=f"https://github.com/example/project-{i}",
+                priority=self.rng.randint(0, 10),
+                is_featured=self.rng.random() < 0.05,
+                is_published=self.rng.random() < 0.95,
+                created_at=created,
+                updated_at=created + timedelta(days=self.rng.randrange(30)),
+            ))
+        bulk_insert(Project, rows, self.batch_size)
+        ids = dict(Project.objects.filter(slug__startswith=f"{self.prefix}-project-").values_list('slug', 'pk'))
+        project_ids = [ids[project.slug] for project in rows]
+
+        # Links go straight into the through table: one INSERT per batch
+        # instead of one .add() round trip per project
+        Through = Project.technologies.through
+        if technologies:
+            bulk_insert(
+                Through,
+                (
+                    Through(project_id=project_id, technology_id=tech.pk)
+                    for project_id in project_ids
+                    for tech in self.rng.sample(technologies, min(len(technologies), self.rng.randint(3, 8)))
+                ),
+                self.batch_size,
+            )
+
+        # Rendering markdown per row would dominate the run time, so details
+        # reuse a pool of texts rendered once (bulk_insert skips save())
+        pool = []
+        for _ in range(DETAIL_POOL):
+            detail = ProjectDetail(
+                problem_statement=self.text(40),
+                solution_approach=self.text(60),
+                technology_justification=self.text(30),
+            )
+            detail.render_content()
+            pool.append({
+                field: getattr(detail, field)
+                for field in [*ProjectDetail.MARKDOWN_FIELDS, *ProjectDetail.RENDERED_FIELDS]
+            })
+
+        bulk_insert(
+            ProjectDetail,
+            (
+                ProjectDetail(
+                    project_id=project_id,
+                    key_features=[self.text(4) for _ in range(3)],
+                    performance_metrics=[{'metric': "Latency", 'improvement': f"{self.rng.randint(10, 80)}% faster"}],
+                    **self.rng.choice(pool),
+                )
+                for project_id in project_ids
+            ),
+            self.batch_size,
+        )
+
+    def posts(self, count):
+        # Content is stitched from a fixed pool of paragraphs; generating every
+        # word per post would dominate the run time at 100k posts
+        pool = [self.text(self.rng.randint(40, 120)) for _ in range(PARAGRAPH_POOL)]
+        pool_words = [len(derived.WORDS.findall(p)) for p in pool]
+        # Plain paragraphs render independently, so the HTML is stitched the same way
+        pool_html = [markup.render_markdown(p)[0] for p in pool]
+        categories = [key for key, _ in BlogPost.CATEGORY_CHOICES]
+
+        def rows():
+            for i in range(count):
+                picks = self.rng.sample(range(PARAGRAPH_POOL), self.rng.randint(3, 12))
+                published = self.timestamp(1500)
+                content = "\n\n".join(pool[p] for p in picks)
+                words = sum(pool_words[p] for p in picks)
+                yield BlogPost(
+                    title=f"{self.text(5).capitalize()} {i}",
+                    slug=f"{self.prefix}-post-{i}",
+                    excerpt=self.text(30),
+                    content=content,
+                    content_html="\n".join(pool_html[p] for p in picks),
+                    content_hash=markup.content_hash(content),
+                    category=self.rng.choice(categories),
+                    word_count=words,
+                    reading_time=max(1, math.ceil(words / derived.WORDS_PER_MINUTE)),
+                    published_date=published,
+                    updated_date=published + timedelta(days=self.rng.randrange(10)),
+                    is_published=self.rng.random() < 0.9,
+                    is_featured=self.rng.random() < 0.03,
+                    views=int(self.rng.paretovariate(1.2) * 10),
+                )
+
+        bulk_insert(BlogPost, rows(), self.batch_size)
+        search.refresh_search_vectors(BlogPost.objects.filter(slug__startswith=f"{self.prefix}-post-"))
+
+    def highlights(self):
+        CareerHighlight.objects.bulk_create(
+            CareerHighlight(
+                title=self.text(2).title(), organization=self.text(1).title(),
+                date_range=f"{2019 + i} - {2020 + i}", description=self.text(25),
+                metrics=[f"{self.rng.randint(10, 90)}% {self.text(2)}"], is_current=i == 0, order=i,
+            )
+            for i in range(5)
+        )
+
+    def run(self, projects=0, posts=0, techs=0):
+        with transaction.atomic():
+            technologies = self.step(f"{techs} technologies", self.technologies, techs) if techs else []
+            if projects:
+                self.step(f"{projects} projects", self.projects, projects, technologies)
+            if posts:
+                self.step(f"{posts} posts", self.posts, posts)
+            if not CareerHighlight.objects.exists():
+                self.highlights()
+            PortfolioStats.recompute()
+        search._index = None
+        response_cache.invalidate(*{g for groups in response_cache.MODEL_GROUPS.values() for g in groups})
+
+
+def seed(projects=0, posts=0, techs=0, seed=0, batch_size=2000, log=None):
+    Seeder(seed, batch_size, log).run(projects=projects, posts=posts, techs=techs)
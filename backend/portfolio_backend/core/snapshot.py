@@ -0,0 +1,227 @@
+# backend/portfolio_backend/core/snapshot.py
+"""
+Static JSON snapshot of the public GET API (``manage.py export_snapshot``).
+
+Every response is written as ``<path>.<md5[:12]>.json`` under SNAPSHOT_ROOT,
+byte for byte what the endpoint returns. Paginated lists follow their
+``next`` links. ``manifest.json`` maps each API path, including the query
+string, to its file. Hashed names never change content, so a CDN or WhiteNoise
+can cache them forever (see WHITENOISE_IMMUTABLE_FILE_TEST); only the manifest
+needs a short TTL.
+
+Exports are incremental. Each unit (an endpoint with all its pages, or one
+project or post) records a fingerprint of the rows it is built from: an md5
+of every column of those rows. A unit is only rendered again when its
+fingerprint changed or its files are missing. Files the new manifest no longer
+references are removed.
+"""
+import hashlib
+import json
+import os
+import re
+from itertools import groupby
+from operator import itemgetter
+from urllib.parse import urlsplit
+
+from django.test import Client
+from django.test.utils import override_settings
+from rest_framework.settings import api_settings
+
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.blog.views import POST_DETAIL_COLUMNS, post_detail_data
+from projects.models import Project, ProjectDetail, SiteConfiguration as ProjectsSiteConfiguration, TechCategory, Technology
+from projects.serializers import ProjectDetailViewSerializer
+from .models import CareerHighlight, PortfolioStats, SiteConfiguration
+from .stats import get_snapshot
+
+MANIFEST = 'manifest.json'
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.json$')
+BATCH_SIZE = 500
+
+PROJECT_LIST = [('project', None), ('project_technologies', None), ('technology', None), ('tech_category', None)]
+TECH = [('technology', None), ('tech_category', None)]
+POSTS = [('post', None)]
+
+# Endpoints exported as they are served; per-slug detail pages are added in export()
+PAGES = {
+    '/projects/projects/': PROJECT_LIST,
+    '/projects/projects/featured/': PROJECT_LIST,
+    '/projects/technologies/': TECH,
+    '/projects/tech-stack/': TECH,
+    '/projects/stats/': [('stats', None)],
+    '/projects/metadata/': [('projects_config', None)],
+    '/projects/highlights/': [('highlight', None)],
+    '/blog/posts/': POSTS,
+    '/blog/recent/': POSTS,
+    '/blog/categories/': POSTS,
+    '/core/highlights/': [('highlight', None)],
+    '/core/config/': [('core_config', None)],
+    '/core/stats/': [('stats', None)],
+    '/home/': [*PROJECT_LIST, *POSTS, ('highlight', None), ('core_config', None), ('stats', None)],
+}
+# Not public content: health check, per-process counters and the contact forms
+EXCLUDED = {'/projects/test/', '/projects/contact/', '/core/contact/', '/core/cache-stats/', '/core/db-stats/'}
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def stable(value):
+    # CloudinaryResource has no value-based repr or str; its stored form is stable
+    prep = getattr(value, 'get_prep_value', None)
+    return prep() if prep else str(value)
+
+
+def row_digests(queryset, key='pk'):
+    """{key: md5 of every column of the rows with that key}"""
+    fields = [field.attname for field in queryset.model._meta.concrete_fields]
+    rows = queryset.order_by(key, 'pk').values_list(key, *fields).iterator(chunk_size=2000)
+    return {
+        value: hashlib.md5(json.dumps([row[1:] for row in group], default=stable).encode()).hexdigest()
+        for value, group in groupby(rows, key=itemgetter(0))
+    }
+
+
+SOURCES = {
+    'project': lambda: row_digests(Project.objects.all()),
+    'project_detail': lambda: row_digests(ProjectDetail.objects.all(), 'project_id'),
+    'project_technologies': lambda: row_digests(Project.technologies.through.objects.all(), 'project_id'),
+    'technology': lambda: row_digests(Technology.objects.all()),
+    'tech_category': lambda: row_digests(TechCategory.objects.all()),
+    'projects_config': lambda: row_digests(ProjectsSiteConfiguration.objects.all()),
+    'core_config': lambda: row_digests(SiteConfiguration.objects.all()),
+    'highlight': lambda: row_digests(CareerHighlight.objects.all()),
+    'stats': lambda: row_digests(PortfolioStats.objects.all()),
+    'post': lambda: row_digests(BlogPost.objects.all()),
+}
+
+
+def file_name(path, content):
+    url_path, _, query = path.partition('?')
+    base = url_path.strip('/') or 'index'
+    if query:  # list pages and filters
+        base += '-' + hashlib.md5(query.encode()).hexdigest()[:8]
+    return f'{base}.{hashlib.md5(content).hexdigest()[:12]}.json'
+
+
+class Snapshot:
+
+    def __init__(self, root, base_url):
+        self.root = root
+        self.base_url = base_url.rstrip('/')
+        self.renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+
+    def export(self, full=False):
+        """Write changed units and the manifest; returns {'rendered', 'unchanged', 'removed'} counts"""
+        previous = {} if full else self.read_manifest().get('units', {})
+        get_snapshot()  # /stats/ creates the row on first read, which would change its fingerprint
+        digests = {name: source() for name, source in SOURCES.items()}
+        whole = {name: hashlib.md5(repr(sorted(rows.items())).encode()).hexdigest() for name, rows in digests.items()}
+
+        def fingerprint(deps):
+            values = [whole[name] if key is None else digests[name].get(key) for name, key in deps]
+            return hashlib.md5(json.dumps(values).encode()).hexdigest()
+
+        units, stale = {}, {'pages': [], 'projects': [], 'posts': []}
+
+        def plan(unit, kind, deps, item):
+            sources = fingerprint(deps)
+            old = previous.get(unit)
+            if old and old['sources'] == sources and all(
+                os.path.exists(os.path.join(self.root, name)) for name in old['files'].values()
+            ):
+                units[unit] = old
+            else:
+                units[unit] = {'sources': sources, 'files': {}}
+                stale[kind].append(item)
+
+        pages = dict(PAGES)
+        for category in BlogPost.objects.filter(is_published=True).values_list('category', flat=True).distinct():
+            pages[f'/blog/posts/?category={category}'] = POSTS
+        for path, deps in pages.items():
+            plan(path, 'pages', deps, path)
+        for pk, slug in Project.objects.published().values_list('pk', 'slug'):
+            deps = [('project', pk), ('project_detail', pk), ('project_technologies', pk), *TECH]
+            plan(f'/projects/projects/{slug}/', 'projects', deps, pk)
+        for pk, slug in BlogPost.objects.filter(is_published=True).values_list('pk', 'slug'):
+            plan(f'/blog/posts/{slug}/', 'posts', [('post', pk)], pk)
+
+        for path in stale['pages']:
+            units[path]['files'] = self.write_pages(path)
+        for batch in self.batches(stale['projects']):
+            projects = Project.objects.select_related('details').with_technologies().filter(pk__in=batch)
+            for project in projects:
+                path = f'/projects/projects/{project.slug}/'
+                units[path]['files'] = {path: self.write(path, ProjectDetailViewSerializer(project).data)}
+        for batch in self.batches(stale['posts']):
+            for post in BlogPost.objects.filter(pk__in=batch).values(*POST_DETAIL_COLUMNS):
+                path = f'/blog/posts/{post["slug"]}/'
+                units[path]['files'] = {path: self.write(path, post_detail_data(post, post['views']))}
+
+        files = {path: name for unit in units.values() for path, name in unit['files'].items()}
+        self.write_manifest({'base_url': self.base_url, 'files': dict(sorted(files.items())), 'units': units})
+        rendered = sum(len(items) for items in stale.values())
+        return {'rendered': rendered, 'unchanged': len(units) - rendered, 'removed': self.prune(set(files.values()))}
+
+    def batches(self, items):
+        for start in range(0, len(items), BATCH_SIZE):
+            yield items[start:start + BATCH_SIZE]
+
+    def write_pages(self, path):
+        """Fetch `path` through the URLconf, following `next` links; {path: file name}"""
+        base = urlsplit(self.base_url)
+        client = Client(HTTP_HOST=base.netloc)
+        files = {}
+        # Bypass the response cache: its entries may predate changes made without signals
+        no_cache = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+        with override_settings(ALLOWED_HOSTS=['*'], SECURE_SSL_REDIRECT=False, CACHES=no_cache):
+            while path:
+                response = client.get(path, secure=base.scheme == 'https')
+                if response.status_code != 200:
+                    raise SnapshotError(f"GET {path} returned {response.status_code}")
+                files[path] = self.write_file(path, response.content)
+                data = json.loads(response.content)
+                next_url = urlsplit(data['next']) if isinstance(data, dict) and data.get('next') else None
+                path = next_url and f'{next_url.path}?{next_url.query}'
+        return files
+
+    def write(self, path, data):
+        return self.write_file(path, self.renderer.render(data))
+
+    def write_file(self, path, content):
+        name = file_name(path, content)
+        target = os.path.join(self.root, name)
+        if not os.path.exists(target):  # same name, same bytes
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target + '.tmp', 'wb') as f:
+                f.write(content)
+            os.replace(target + '.tmp', target)
+        return name
+
+    def read_manifest(self):
+        try:
+            with open(os.path.join(self.root, MANIFEST)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def write_manifest(self, manifest):
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, MANIFEST)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(path + '.tmp', path)
+
+    def prune(self, keep):
+        """Remove snapshot files the manifest no longer references"""
+        removed = 0
+        for directory, _, names in os.walk(self.root, topdown=False):
+            for name in names:
+                relative = os.path.relpath(os.path.join(directory, name), self.root)
+                if HASHED_NAME.search(name) and relative not in keep:
+                    os.remove(os.path.join(directory, name))
+                    removed += 1
+            if directory != self.root and not os.listdir(directory):
+                os.rmdir(directory)
+        return removed
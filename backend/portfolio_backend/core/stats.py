@@ -0,0 +1,77 @@
+# backend/portfolio_backend/core/stats.py
+"""
+Keeps the PortfolioStats snapshot current without re-counting.
+
+Each Project remembers whether it counted as published/featured when it was
+loaded; on save or delete only the difference is applied with an atomic
+``F() + delta`` update. Technologies add or remove one. Bulk ``update()`` calls
+bypass signals, so ``manage.py rebuild_portfolio_stats`` recomputes from scratch.
+"""
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .models import PortfolioStats
+
+
+def get_snapshot():
+    """Single primary-key read; rebuilt on first use if the row is missing"""
+    stats = PortfolioStats.objects.filter(pk=PortfolioStats.SINGLETON_PK).first()
+    return stats or PortfolioStats.recompute()
+
+
+def apply_delta(**deltas):
+    deltas = {field: F(field) + n for field, n in deltas.items() if n}
+    if deltas:
+        PortfolioStats.objects.filter(pk=PortfolioStats.SINGLETON_PK).update(**deltas)
+
+
+def project_contribution(project):
+    published = bool(project.is_published)
+    return int(published), int(published and bool(project.is_featured))
+
+
+@receiver(post_init, sender='projects.Project')
+def remember_project_contribution(sender, instance, **kwargs):
+    if not instance.pk:
+        instance._stats_contribution = (0, 0)
+    elif {'is_published', 'is_featured'} <= instance.__dict__.keys():
+        instance._stats_contribution = project_contribution(instance)
+    else:
+        # Loaded with .only()/.defer(); don't trigger extra queries here
+        instance._stats_contribution = None
+
+
+@receiver(post_save, sender='projects.Project')
+def project_saved(sender, instance, created, **kwargs):
+    old = (0, 0) if created else getattr(instance, '_stats_contribution', None)
+    new = project_contribution(instance)
+    if old is None:
+        PortfolioStats.recompute()
+    else:
+        apply_delta(total_projects=new[0] - old[0], featured_projects=new[1] - old[1])
+    instance._stats_contribution = new
+
+
+@receiver(post_delete, sender='projects.Project')
+def project_deleted(sender, instance, **kwargs):
+    old = getattr(instance, '_stats_contribution', None) or project_contribution(instance)
+    apply_delta(total_projects=-old[0], featured_projects=-old[1])
+
+
+@receiver(post_save, sender='projects.Technology')
+def technology_saved(sender, instance, created, **kwargs):
+    if created:
+        apply_delta(technologies_count=1)
+
+
+@receiver(post_delete, sender='projects.Technology')
+def technology_deleted(sender, instance, **kwargs):
+    apply_delta(technologies_count=-1)
+
+
+@receiver(post_save, sender='projects.SiteConfiguration')
+def site_configuration_saved(sender, instance, **kwargs):
+    PortfolioStats.objects.filter(pk=PortfolioStats.SINGLETON_PK).update(
+        years_experience=instance.years_experience
+    )
@@ -0,0 +1,985 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+import cloudinary
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_backend.blog.models import BlogPost
+from portfolio_backend.db_backends import InstrumentedConnectionMixin, metrics as db_metrics
+from portfolio_backend.blog import async_views as blog_async_views, view_counter
+from projects import async_views as projects_async_views
+from projects.models import TechCategory, Technology, Project, ProjectDetail
+from projects.views import ProjectPagination
+from . import async_views, images, nplusone, outbox, renderers, response_cache, snapshot
+from .models import CareerHighlight, ContactSubmission, OutboxEmail, PortfolioStats, SiteConfiguration
+
+
+class ResponseCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        response_cache.reset_stats()
+        self.category = TechCategory.objects.create(name="Backend")
+        self.tech = Technology.objects.create(name="Django", category=self.category, proficiency=4)
+        self.project = Project.objects.create(title="Portfolio", tagline="Tagline")
+
+    def get(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.get('/projects/projects/')
+        # Only the ETag probe runs; the serializers are skipped
+        with self.assertNumQueries(1):
+            second = self.get('/projects/projects/')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.json(), second.json())
+
+    def test_query_string_is_part_of_the_key(self):
+        self.get('/projects/projects/')
+        self.assertEqual(self.get('/projects/projects/?featured=true')['X-Cache'], 'MISS')
+
+    def test_saving_a_model_invalidates_its_endpoints(self):
+        self.get('/projects/projects/')
+        self.project.title = "Renamed"
+        self.project.save()
+        response = self.get('/projects/projects/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['results'][0]['title'], "Renamed")
+
+    def test_m2m_changes_invalidate_project_endpoints(self):
+        self.get('/projects/projects/')
+        self.project.technologies.add(self.tech)
+        response = self.get('/projects/projects/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.json()['results'][0]['technologies']), 1)
+
+    def test_unrelated_changes_keep_entries(self):
+        self.get('/projects/projects/')
+        self.get('/core/highlights/')
+        BlogPost.objects.create(title="Post", excerpt="E", content="C", category='technical')
+        self.assertEqual(self.get('/projects/projects/')['X-Cache'], 'HIT')
+        CareerHighlight.objects.create(title="Engineer", organization="Org", date_range="2024", description="D")
+        self.assertEqual(self.get('/core/highlights/')['X-Cache'], 'MISS')
+        self.assertEqual(self.get('/projects/projects/')['X-Cache'], 'HIT')
+
+    def test_stats_count_hits_and_misses(self):
+        self.get('/projects/stats/')
+        self.get('/projects/stats/')
+        self.get('/core/stats/')
+        self.assertEqual(self.client.get('/core/cache-stats/').status_code, 403)
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        data = self.get('/core/cache-stats/').json()
+        self.assertEqual((data['hits'], data['misses']), (1, 2))
+        self.assertEqual(data['groups']['stats'], {'hits': 1, 'misses': 2})
+
+    def test_evicted_versions_do_not_repeat(self):
+        first, = response_cache.group_versions(['projects'])
+        response_cache.invalidate('projects')
+        second, = response_cache.group_versions(['projects'])
+        # Evicted (or lost in a restart): the version must not start over
+        cache.delete(response_cache._version_key('projects'))
+        third, = response_cache.group_versions(['projects'])
+        self.assertEqual(len({first, second, third}), 3)
+        self.assertEqual(response_cache.group_versions(['projects']), [third])
+
+
+class ConditionalGetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.project = Project.objects.create(title="Portfolio", tagline="Tagline")
+        self.post = BlogPost.objects.create(
+            title="Post", excerpt="E", content="C", category='technical', is_published=True,
+        )
+
+    def assert_revalidates(self, path, probe_queries=1):
+        first = self.client.get(path)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first['ETag'])
+        with self.assertNumQueries(probe_queries):
+            second = self.client.get(path, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+        return first
+
+    def test_content_endpoints_return_304(self):
+        for path in [
+            '/projects/projects/',
+            f'/projects/projects/{self.project.slug}/',
+            '/projects/tech-stack/',
+            '/projects/metadata/',
+            '/core/config/',
+            '/blog/posts/',
+            f'/blog/posts/{self.post.slug}/?exclude=views',
+        ]:
+            with self.subTest(path=path):
+                self.assert_revalidates(path)
+
+    def test_post_views_are_counted_and_never_stale(self):
+        path = f'/blog/posts/{self.post.slug}/'
+        with mock.patch.object(view_counter, '_buffer', view_counter.LocalViewBuffer()):
+            # Without `views` in the body, a revalidation is a 304 and still counts
+            first = self.client.get(path + '?exclude=views')
+            response = self.client.get(path + '?exclude=views', HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(view_counter.pending_views(self.post.pk), 2)
+            # With it, each view changes the body and so the ETag
+            first = self.client.get(path)
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['views'], first.json()['views'] + 1)
+            self.assertEqual(view_counter.pending_views(self.post.pk), 4)
+
+    def test_if_modified_since(self):
+        path = f'/blog/posts/{self.post.slug}/?exclude=views'
+        first = self.client.get(path)
+        response = self.client.get(path, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_no_last_modified_where_it_would_not_advance(self):
+        for path in ['/projects/projects/', f'/projects/projects/{self.project.slug}/',
+                     '/projects/tech-stack/', '/blog/posts/', f'/blog/posts/{self.post.slug}/']:
+            with self.subTest(path=path):
+                self.assertNotIn('Last-Modified', self.client.get(path))
+
+    def test_edits_through_another_worker_change_the_etag(self):
+        category = TechCategory.objects.create(name="Backend")
+        tech = Technology.objects.create(name="Django", category=category, proficiency=4)
+        first = self.client.get('/projects/tech-stack/')
+        # The other worker's local-memory cache: its group versions never change here
+        versions = cache.get_many([response_cache._version_key(group) for group in ('projects', 'tech')])
+        tech.name = "Flask"
+        tech.save()
+        cache.set_many(versions, timeout=None)
+        response = self.client.get('/projects/tech-stack/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['technologies'][0]['name'], "Flask")
+
+    def test_edit_changes_the_etag(self):
+        first = self.assert_revalidates('/projects/projects/')
+        self.project.tagline = "Changed"
+        self.project.save()
+        response = self.client.get('/projects/projects/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+
+    def test_unpublishing_changes_the_list_etag(self):
+        first = self.assert_revalidates('/blog/posts/')
+        BlogPost.objects.filter(pk=self.post.pk).update(is_published=False)
+        response = self.client.get('/blog/posts/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_objects_skip_validation(self):
+        self.assertEqual(self.client.get('/projects/projects/missing/').status_code, 404)
+
+
+class PortfolioStatsSnapshotTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        PortfolioStats.recompute()
+        self.category = TechCategory.objects.create(name="Backend")
+
+    def snapshot(self):
+        stats = PortfolioStats.objects.get()
+        return stats.total_projects, stats.featured_projects, stats.technologies_count
+
+    def test_stats_endpoint_is_a_single_read(self):
+        Project.objects.create(title="One", tagline="T", is_featured=True)
+        for path in ['/core/stats/', '/projects/stats/']:
+            cache.clear()
+            with self.assertNumQueries(1):
+                data = self.client.get(path).json()
+            self.assertEqual((data['total_projects'], data['featured_projects']), (1, 1))
+
+    def test_publishing_and_featuring_update_incrementally(self):
+        project = Project.objects.create(title="One", tagline="T", is_published=False)
+        self.assertEqual(self.snapshot(), (0, 0, 0))
+        project = Project.objects.get(pk=project.pk)
+        project.is_published = True
+        project.is_featured = True
+        project.save()
+        self.assertEqual(self.snapshot(), (1, 1, 0))
+        project.is_featured = False
+        project.save()
+        self.assertEqual(self.snapshot(), (1, 0, 0))
+        Project.objects.create(title="Two", tagline="T", is_featured=True)
+        self.assertEqual(self.snapshot(), (2, 1, 0))
+        Project.objects.all().delete()
+        self.assertEqual(self.snapshot(), (0, 0, 0))
+
+    def test_technologies_are_counted(self):
+        tech = Technology.objects.create(name="Django", category=self.category, proficiency=4)
+        Technology.objects.create(name="Redis", category=self.category, proficiency=3)
+        tech.save()
+        self.assertEqual(self.snapshot(), (0, 0, 2))
+        tech.delete()
+        self.assertEqual(self.snapshot(), (0, 0, 1))
+
+    def test_saving_a_deferred_instance_falls_back_to_recompute(self):
+        Project.objects.create(title="One", tagline="T")
+        project = Project.objects.only('title').get()
+        project.title = "Renamed"
+        project.save()
+        self.assertEqual(self.snapshot(), (1, 0, 0))
+
+    def test_rebuild_command_repairs_drift(self):
+        Project.objects.create(title="One", tagline="T")
+        Project.objects.update(is_featured=True)  # bypasses signals
+        self.assertEqual(self.snapshot(), (1, 0, 0))
+        call_command('rebuild_portfolio_stats', stdout=StringIO())
+        self.assertEqual(self.snapshot(), (1, 1, 0))
+
+
+class FakeProvider:
+    """Local stand-in for Resend: records batches and can fail the first N calls"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    def send_batch(self, emails):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("provider unavailable")
+        self.batches.append([email.subject for email in emails])
+        return [f"msg-{email.pk}" for email in emails]
+
+
+CONTACT = {'name': "Ada", 'email': "ada@example.com", 'subject': "Hello", 'message': "Line 1\nLine 2"}
+
+
+@override_settings(EMAIL_OUTBOX_PROVIDER='portfolio_backend.core.tests.FakeProvider')
+class OutboxTests(TestCase):
+
+    def test_contact_endpoints_only_enqueue(self):
+        for path in ['/core/contact/', '/projects/contact/']:
+            with mock.patch.object(FakeProvider, 'send_batch') as send:
+                response = self.client.post(path, CONTACT, content_type='application/json')
+            self.assertIn(response.status_code, (200, 201))
+            send.assert_not_called()
+        emails = OutboxEmail.objects.all()
+        self.assertEqual(len(emails), 2)
+        self.assertTrue(all(e.status == OutboxEmail.STATUS_PENDING for e in emails))
+        self.assertEqual(emails[0].reply_to, ["ada@example.com"])
+        self.assertIn("Line 1<br>Line 2", emails[0].html)
+
+    def test_submission_and_email_share_a_transaction(self):
+        with mock.patch.object(outbox.OutboxEmail.objects, 'create', side_effect=RuntimeError):
+            response = self.client.post('/core/contact/', CONTACT, content_type='application/json')
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(ContactSubmission.objects.exists())
+
+    def enqueue(self, count):
+        for i in range(count):
+            contact = ContactSubmission.objects.create(**dict(CONTACT, subject=f"Hello {i}"))
+            outbox.enqueue_contact_notification(contact)
+
+    def test_drain_sends_in_batches(self):
+        self.enqueue(5)
+        provider = FakeProvider()
+        self.assertEqual(outbox.drain(batch_size=2, provider=provider), (5, 0, 0))
+        self.assertEqual([len(batch) for batch in provider.batches], [2, 2, 1])
+        sent = OutboxEmail.objects.get(subject="Portfolio Contact: Hello 0")
+        self.assertEqual((sent.status, sent.attempts), (OutboxEmail.STATUS_SENT, 1))
+        self.assertEqual(sent.provider_message_id, f"msg-{sent.pk}")
+
+    def test_failures_back_off_exponentially_then_dead_letter(self):
+        self.enqueue(1)
+        provider = FakeProvider(failures=100)
+        delays = []
+        with self.settings(EMAIL_OUTBOX_MAX_ATTEMPTS=4):
+            for attempt in range(1, 5):
+                before = timezone.now()
+                result = outbox.drain(provider=provider)
+                email = OutboxEmail.objects.get()
+                if attempt < 4:
+                    self.assertEqual(result, (0, 1, 0))
+                    delays.append(round((email.next_attempt_at - before).total_seconds() / 30))
+                    # Make it due again without waiting
+                    OutboxEmail.objects.update(next_attempt_at=timezone.now())
+                else:
+                    self.assertEqual(result, (0, 0, 1))
+        self.assertEqual(delays, [1, 2, 4])
+        self.assertEqual((email.status, email.attempts), (OutboxEmail.STATUS_DEAD, 4))
+        self.assertIn("provider unavailable", email.last_error)
+        self.assertEqual(outbox.drain(provider=provider), (0, 0, 0))
+
+    def test_retry_succeeds_after_transient_failure(self):
+        self.enqueue(1)
+        provider = FakeProvider(failures=1)
+        outbox.drain(provider=provider)
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(outbox.drain(provider=provider), (1, 0, 0))
+        self.assertEqual(OutboxEmail.objects.get().attempts, 2)
+
+    def test_stale_claims_are_reclaimed(self):
+        self.enqueue(1)
+        OutboxEmail.objects.update(
+            status=OutboxEmail.STATUS_SENDING, claimed_at=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(outbox.drain(provider=FakeProvider()), (1, 0, 0))
+        # The send the dead worker was in the middle of counts as an attempt
+        self.assertEqual(OutboxEmail.objects.get().attempts, 2)
+
+    def test_rows_that_keep_killing_the_worker_are_dead_lettered(self):
+        self.enqueue(1)
+        provider = FakeProvider()
+        with self.settings(EMAIL_OUTBOX_MAX_ATTEMPTS=3):
+            for attempts in range(3):
+                OutboxEmail.objects.update(
+                    status=OutboxEmail.STATUS_SENDING, attempts=attempts,
+                    claimed_at=timezone.now() - timedelta(hours=1),
+                )
+                emails = outbox.claim_batch(10)
+            self.assertEqual(len(emails), 0)
+        email = OutboxEmail.objects.get()
+        self.assertEqual((email.status, email.attempts), (OutboxEmail.STATUS_DEAD, 3))
+        self.assertEqual(outbox.drain(provider=provider), (0, 0, 0))
+        self.assertEqual(provider.batches, [])
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+    def test_partial_batch_failure_retries_only_the_unsent(self):
+        from django.core import mail
+        from django.core.mail import EmailMessage
+
+        self.enqueue(3)
+        send = EmailMessage.send
+
+        def fail_second(message, *args, **kwargs):
+            if message.subject.endswith("Hello 1"):
+                raise ConnectionError("connection dropped")
+            return send(message, *args, **kwargs)
+
+        provider = outbox.DjangoMailProvider()
+        with mock.patch.object(EmailMessage, 'send', fail_second):
+            self.assertEqual(outbox.drain(provider=provider), (2, 1, 0))
+        statuses = dict(OutboxEmail.objects.values_list('subject', 'status'))
+        self.assertEqual(statuses, {
+            "Portfolio Contact: Hello 0": OutboxEmail.STATUS_SENT,
+            "Portfolio Contact: Hello 1": OutboxEmail.STATUS_PENDING,
+            "Portfolio Contact: Hello 2": OutboxEmail.STATUS_SENT,
+        })
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(outbox.drain(provider=provider), (1, 0, 0))
+        self.assertEqual(
+            sorted(message.subject for message in mail.outbox),
+            [f"Portfolio Contact: Hello {i}" for i in range(3)],
+        )
+
+    def test_worker_command_once(self):
+        self.enqueue(3)
+        out = StringIO()
+        call_command('send_outbox', '--once', stdout=out)
+        self.assertIn("3 sent", out.getvalue())
+
+
+class InstrumentedSQLiteWrapper(InstrumentedConnectionMixin, SQLiteDatabaseWrapper):
+    pass
+
+
+class ConnectionMetricsTests(TestCase):
+
+    def setUp(self):
+        db_metrics.reset()
+
+    def make_connection(self, **settings):
+        # A file, since SQLite never really closes in-memory connections
+        path = tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False).name
+        self.addCleanup(os.remove, path)
+        settings_dict = dict(connection.settings_dict, NAME=path, **settings)
+        wrapper = InstrumentedSQLiteWrapper(settings_dict, alias='metrics-test')
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def request(self, wrapper):
+        """One request's worth of use, with Django's start/end-of-request hooks"""
+        wrapper.close_if_unusable_or_obsolete()
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        self.assertEqual(db_metrics.snapshot()['in_use'], 1)
+        wrapper.close_if_unusable_or_obsolete()
+
+    def test_persistent_connections_are_reused(self):
+        wrapper = self.make_connection(CONN_MAX_AGE=60, CONN_HEALTH_CHECKS=True)
+        for _ in range(3):
+            self.request(wrapper)
+        stats = db_metrics.snapshot()
+        self.assertEqual((stats['checkouts'], stats['reused_checkouts']), (3, 2))
+        self.assertEqual((stats['connections_opened'], stats['open'], stats['in_use']), (1, 1, 0))
+        self.assertEqual(stats['health_check_failures'], 0)
+
+    def test_conn_max_age_zero_connects_every_request(self):
+        wrapper = self.make_connection(CONN_MAX_AGE=0)
+        for _ in range(3):
+            self.request(wrapper)
+        stats = db_metrics.snapshot()
+        self.assertEqual((stats['checkouts'], stats['reused_checkouts']), (3, 0))
+        self.assertEqual((stats['connections_opened'], stats['connections_closed']), (3, 3))
+
+    def test_failed_health_check_reconnects(self):
+        wrapper = self.make_connection(CONN_MAX_AGE=60, CONN_HEALTH_CHECKS=True)
+        self.request(wrapper)
+        with mock.patch.object(wrapper, 'is_usable', return_value=False):
+            self.request(wrapper)
+        stats = db_metrics.snapshot()
+        self.assertEqual((stats['health_check_failures'], stats['connections_opened']), (1, 2))
+
+    def test_db_stats_endpoint(self):
+        self.assertEqual(self.client.get('/core/db-stats/').status_code, 403)
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        data = self.client.get('/core/db-stats/').json()
+        self.assertIn('avg_wait_ms', data)
+        self.assertIn('reuse_ratio', data)
+
+
+class AsyncReadViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        category = TechCategory.objects.create(name="Backend")
+        techs = [
+            Technology.objects.create(name=name, category=category, proficiency=4)
+            for name in ["Django", "Postgres"]
+        ]
+        for i in range(25):
+            project = Project.objects.create(title=f"Project {i}", tagline="T", is_featured=i % 2 == 0)
+            project.technologies.set(techs)
+        self.project = project
+        self.post = BlogPost.objects.create(
+            title="Post", excerpt="E", content="C", category='technical', is_published=True,
+        )
+        CareerHighlight.objects.create(title="Engineer", organization="Org", date_range="2024", description="D")
+        self.factory = AsyncRequestFactory()
+
+    async def get(self, view, path, *args, **kwargs):
+        return await view(self.factory.get(path), *args, **kwargs)
+
+    async def test_async_views_match_sync_views(self):
+        cases = [
+            (projects_async_views.project_list, '/projects/projects/', {}),
+            (projects_async_views.project_list, '/projects/projects/?count=true', {}),
+            (projects_async_views.project_list, '/projects/projects/?tech=django', {}),
+            (projects_async_views.project_list, '/projects/projects/featured/', {'featured': 'true'}),
+            (projects_async_views.project_detail, f'/projects/projects/{self.project.slug}/',
+             {'slug': self.project.slug}),
+            (projects_async_views.tech_stack, '/projects/tech-stack/', {}),
+            (blog_async_views.blog_posts_list, '/blog/posts/?count=true', {}),
+            (blog_async_views.blog_posts_list, '/blog/posts/?search=post', {}),
+            (async_views.career_highlights, '/core/highlights/', {}),
+            (async_views.site_config, '/core/config/', {}),
+            (projects_async_views.project_list, '/projects/projects/?fields=title,technologies.name', {}),
+            (projects_async_views.project_detail, f'/projects/projects/{self.project.slug}/?exclude=details',
+             {'slug': self.project.slug}),
+            (projects_async_views.tech_stack, '/projects/tech-stack/?exclude=technologies', {}),
+            (blog_async_views.blog_posts_list, '/blog/posts/?fields=title,views', {}),
+        ]
+        groups = {group for groups in response_cache.MODEL_GROUPS.values() for group in groups}
+        version_keys = [response_cache._version_key(group) for group in groups]
+        for view, path, kwargs in cases:
+            with self.subTest(path=path):
+                await cache.aclear()
+                expected = await self.async_client.get(path)
+                # Drop the cached response but keep the group versions the ETags include
+                versions = await cache.aget_many(version_keys)
+                await cache.aclear()
+                await cache.aset_many(versions, timeout=None)
+                response = await self.get(view, path, **kwargs)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, expected.content)
+                self.assertEqual(response.get('ETag'), expected.get('ETag'))
+
+    async def test_detail_and_errors(self):
+        response = await self.get(blog_async_views.blog_post_detail, '/blog/posts/post/', slug=self.post.slug)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['views'], self.post.views + 1)
+        response = await self.get(projects_async_views.project_detail, '/projects/projects/x/', slug='missing')
+        self.assertEqual(response.status_code, 404)
+        response = await self.get(projects_async_views.project_list, '/projects/projects/?cursor=bogus')
+        self.assertEqual(response.status_code, 404)
+        response = await self.get(blog_async_views.blog_post_detail, '/blog/posts/post/?fields=title,body', slug=self.post.slug)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.content, (await self.async_client.get('/blog/posts/post/?fields=title,body')).content)
+
+    async def test_caching_and_revalidation(self):
+        first = await self.get(projects_async_views.tech_stack, '/projects/tech-stack/')
+        second = await self.get(projects_async_views.tech_stack, '/projects/tech-stack/')
+        self.assertEqual((first['X-Cache'], second['X-Cache']), ('MISS', 'HIT'))
+        request = self.factory.get('/projects/tech-stack/', headers={'If-None-Match': first['ETag']})
+        self.assertEqual((await projects_async_views.tech_stack(request)).status_code, 304)
+
+
+class HomeBundleTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        category = TechCategory.objects.create(name="Backend")
+        tech = Technology.objects.create(name="Django", category=category, proficiency=4)
+        for i in range(3):
+            project = Project.objects.create(title=f"Project {i}", tagline="T", is_featured=i != 1)
+            project.technologies.add(tech)
+        for i in range(4):
+            BlogPost.objects.create(title=f"Post {i}", excerpt="E", content="C", category='technical', is_published=True)
+        CareerHighlight.objects.create(title="Engineer", organization="Org", date_range="2024", description="D")
+        PortfolioStats.recompute()
+
+    def get(self):
+        response = self.client.get('/home/')
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_sections_match_their_endpoints(self):
+        data = self.get().json()
+        cache.clear()
+        self.assertEqual(data['config'], self.client.get('/core/config/').json())
+        self.assertEqual(data['stats'], self.client.get('/projects/stats/').json())
+        self.assertEqual(data['highlights'], self.client.get('/core/highlights/').json())
+        self.assertEqual(data['featured_projects'], self.client.get('/projects/projects/featured/').json()['results'])
+        self.assertEqual(data['recent_posts'], self.client.get('/blog/recent/').json())
+        self.assertEqual([p['title'] for p in data['featured_projects']], ["Project 2", "Project 0"])
+
+    def test_built_in_six_queries_and_cached_as_one_entry(self):
+        # The ETag probe, then config, stats, highlights, featured projects +
+        # their technologies, recent posts
+        with self.assertNumQueries(7):
+            self.assertEqual(self.get()['X-Cache'], 'MISS')
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get()['X-Cache'], 'HIT')
+
+    def test_revalidates_against_the_persisted_versions(self):
+        first = self.get()
+        with self.assertNumQueries(1):
+            response = self.client.get('/home/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        # A change saved by another worker: this worker's cache versions stay
+        # put, but neither its ETag nor its cached entry is served
+        response_cache.bump_content_versions(['blog'])
+        response = self.client.get('/home/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertNotEqual(response['ETag'], first['ETag'])
+
+    def test_changes_to_any_section_invalidate_it(self):
+        changes = [
+            lambda: SiteConfiguration.objects.create(),
+            lambda: CareerHighlight.objects.create(title="Lead", organization="Org", date_range="2025", description="D"),
+            lambda: Project.objects.create(title="New", tagline="T", is_featured=True),
+            lambda: Technology.objects.first().save(),
+            lambda: BlogPost.objects.create(title="New", excerpt="E", content="C", category='technical', is_published=True),
+        ]
+        self.get()
+        for change in changes:
+            with self.subTest(change=change):
+                change()
+                self.assertEqual(self.get()['X-Cache'], 'MISS')
+                self.assertEqual(self.get()['X-Cache'], 'HIT')
+
+    async def test_async_view_matches(self):
+        expected = await self.async_client.get('/home/')
+        await cache.aclear()
+        response = await async_views.home(AsyncRequestFactory().get('/home/'))
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response['ETag'], expected['ETag'])
+
+
+class BenchSerializersCommandTests(TestCase):
+
+    def test_compares_identical_rows_and_rolls_back(self):
+        out = StringIO()
+        call_command('bench_serializers', '--sizes', '5', '10', '--repeat', '1', '--techs', '4', stdout=out)
+        self.assertEqual(out.getvalue().count("speedup"), 4)
+        self.assertFalse(Project.objects.exists())
+        self.assertFalse(BlogPost.objects.exists())
+
+
+class BenchRenderersCommandTests(TestCase):
+
+    def test_compares_identical_bytes_and_rolls_back(self):
+        out = StringIO()
+        call_command('bench_renderers', '--sizes', '5', '--repeat', '1', '--techs', '4', stdout=out)
+        self.assertEqual(out.getvalue().count("render"), 2)
+        self.assertFalse(Project.objects.exists())
+
+
+class BenchApiCommandTests(TestCase):
+
+    def test_reports_every_route_and_rolls_back(self):
+        path = tempfile.NamedTemporaryFile(suffix='.json', delete=False).name
+        self.addCleanup(os.remove, path)
+        call_command(
+            'bench_api', '--projects', '3', '--posts', '3', '--techs', '3',
+            '--requests', '2', '--warmup', '0', '--json', path, stdout=StringIO(),
+        )
+        with open(path) as f:
+            endpoints = json.load(f)['endpoints']
+        self.assertIn('projects/projects/<slug:slug>/', endpoints)
+        self.assertEqual(endpoints['core/contact/']['method'], 'POST')
+        for route, result in endpoints.items():
+            with self.subTest(route=route):
+                self.assertLess(result['status'], 400)
+                self.assertGreater(result['bytes'], 0)
+        self.assertFalse(Project.objects.exists())
+
+
+class IndexAdvisorCommandTests(TestCase):
+
+    def test_explains_each_route_and_rolls_back(self):
+        out = StringIO()
+        call_command(
+            'index_advisor', '--projects', '5', '--posts', '5', '--techs', '3', '--min-rows', '100000', stdout=out,
+        )
+        output = out.getvalue()
+        self.assertIn("GET blog/posts/ (/blog/posts/): 200", output)
+        self.assertNotIn("core/contact/", output)
+        self.assertIn("No sequential scans of tables with 100000+ rows", output)
+        self.assertFalse(Project.objects.exists())
+
+    def test_strict_fails_on_flagged_scans(self):
+        with self.assertRaisesMessage(CommandError, "sequential scan(s)"):
+            call_command(
+                'index_advisor', '--projects', '5', '--posts', '5', '--techs', '3',
+                '--min-rows', '0', '--only', 'blog/posts/', '--strict', stdout=StringIO(),
+            )
+
+
+class SeedTests(TestCase):
+
+    def snapshot(self):
+        return (
+            list(Project.objects.order_by('slug').values_list('slug', 'title', 'priority', 'created_at')),
+            sorted(Project.technologies.through.objects.values_list('project__slug', 'technology__name')),
+            list(BlogPost.objects.order_by('slug').values_list('slug', 'category', 'published_date', 'reading_time')),
+        )
+
+    def test_seed_is_deterministic_and_bulk(self):
+        call_command('seed', '--projects', '30', '--posts', '50', '--techs', '10', stdout=StringIO())
+        first = self.snapshot()
+        self.assertEqual((len(first[0]), len(first[2])), (30, 50))
+        self.assertTrue(all(ProjectDetail.objects.filter(project__slug=slug).exists() for slug, *_ in first[0][:3]))
+        self.assertEqual(PortfolioStats.objects.get().total_projects, Project.objects.published().count())
+
+        call_command('seed', '--flush', '--projects', '30', '--posts', '50', '--techs', '10', stdout=StringIO())
+        self.assertEqual(self.snapshot(), first)
+
+    def test_existing_seed_requires_flush(self):
+        call_command('seed', '--projects', '2', '--posts', '2', '--techs', '2', stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('seed', '--projects', '2', '--posts', '2', '--techs', '2', stdout=StringIO())
+        call_command('seed', '--seed', '1', '--projects', '2', '--posts', '2', '--techs', '2', stdout=StringIO())
+        self.assertEqual(Project.objects.count(), 4)
+
+
+class NPlusOneDetectionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        category = TechCategory.objects.create(name="Backend")
+        tech = Technology.objects.create(name="Django", category=category, proficiency=4)
+        for i in range(8):
+            Project.objects.create(title=f"Project {i}", tagline="T").technologies.add(tech)
+
+    def test_runner_restores_the_setting(self):
+        from django.conf import settings
+        from django.test.runner import DiscoverRunner
+
+        before = settings.NPLUSONE_DETECTION
+        runner = nplusone.NPlusOneTestRunner()
+        with override_settings(NPLUSONE_DETECTION='log'), \
+                mock.patch.object(DiscoverRunner, 'setup_test_environment'), \
+                mock.patch.object(DiscoverRunner, 'teardown_test_environment'):
+            runner.setup_test_environment()
+            self.assertEqual(settings.NPLUSONE_DETECTION, 'raise')
+            runner.teardown_test_environment()
+            self.assertEqual(settings.NPLUSONE_DETECTION, 'log')
+        self.assertEqual(settings.NPLUSONE_DETECTION, before)
+
+    def test_fingerprint_collapses_in_lists(self):
+        self.assertEqual(
+            nplusone.fingerprint('SELECT *  FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            nplusone.fingerprint('SELECT * FROM "t" WHERE "id" IN (%s)'),
+        )
+
+    def test_block_reports_serializer_field_and_code(self):
+        from projects.serializers import ProjectListSerializer
+
+        with self.assertRaises(nplusone.NPlusOneError) as raised:
+            with nplusone.detect_nplusone():
+                ProjectListSerializer(Project.objects.all(), many=True).data
+        message = str(raised.exception)
+        self.assertIn("8x SELECT", message)
+        self.assertIn("ProjectListSerializer.technologies", message)
+        self.assertIn("portfolio_backend/core/tests.py", message)
+
+        with nplusone.detect_nplusone():
+            ProjectListSerializer(Project.objects.with_technologies(), many=True).data
+
+    def unprefetched_tech_stack(self):
+        for i in range(8):
+            TechCategory.objects.create(name=f"Category {i}", order=i + 1)
+        return mock.patch('projects.views.tech_categories', return_value=TechCategory.objects.all())
+
+    def test_middleware_raises_with_view_name(self):
+        with self.unprefetched_tech_stack():
+            with self.assertRaises(nplusone.NPlusOneError) as raised:
+                self.client.get('/projects/tech-stack/')
+        self.assertIn("projects.views.TechStackView (GET /projects/tech-stack/)", str(raised.exception))
+        self.assertEqual(self.client.get('/projects/tech-stack/').status_code, 200)
+
+    @override_settings(NPLUSONE_DETECTION='log')
+    def test_log_mode_warns_and_serves_the_response(self):
+        with self.unprefetched_tech_stack():
+            with self.assertLogs('portfolio_backend.nplusone', 'WARNING'):
+                response = self.client.get('/projects/tech-stack/')
+        self.assertEqual(response.status_code, 200)
+
+    # The manifest storage needs collectstatic, which the admin templates would hit
+    @override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+    def test_admin_changelists_count_in_one_query(self):
+        from django.contrib.auth.models import User
+
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        for path in ['/admin/projects/project/', '/admin/projects/techcategory/']:
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(path).status_code, 200)
+
+
+class ImageDescriptorTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(cloudinary.config(), 'cloud_name', 'demo')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_descriptor_holds_url_and_srcset(self):
+        project = Project.objects.create(title="P", tagline="T", thumbnail='image/upload/v1/pic.jpg')
+        descriptor = project.thumbnail_descriptor
+        self.assertEqual(descriptor['url'], 'https://res.cloudinary.com/demo/image/upload/v1/pic.jpg')
+        self.assertIn('https://res.cloudinary.com/demo/image/upload/c_limit,f_auto,q_auto,w_320/v1/pic.jpg 320w', descriptor['srcset'])
+        self.assertTrue(descriptor['srcset'].endswith(' 1920w'))
+        self.assertIsNone(project.hero_image_descriptor)
+
+    def test_descriptor_is_rebuilt_only_when_the_image_changes(self):
+        post = BlogPost.objects.create(
+            title="Post", excerpt="E", content="C", category='technical', featured_image='image/upload/v1/a.png',
+        )
+        with mock.patch.object(images, 'build_descriptor', wraps=images.build_descriptor) as build:
+            post = BlogPost.objects.get(pk=post.pk)
+            post.title = "Renamed"
+            post.save()
+            build.assert_not_called()
+            post.featured_image = 'image/upload/v2/b.png'
+            post.save()
+            build.assert_called_once()
+        self.assertIn('/v2/b.png', post.featured_image_descriptor['url'])
+        post.featured_image = ''
+        post.save()
+        self.assertIsNone(post.featured_image_descriptor)
+
+    def test_list_responses_do_not_call_the_sdk(self):
+        Project.objects.create(title="P", tagline="T", thumbnail='image/upload/v1/pic.jpg')
+        BlogPost.objects.create(
+            title="Post", excerpt="E", content="C", category='technical', is_published=True,
+            featured_image='image/upload/v1/a.png',
+        )
+        with mock.patch('cloudinary.CloudinaryResource.build_url', side_effect=AssertionError("SDK call")):
+            project = self.client.get('/projects/projects/').json()['results'][0]
+            post = self.client.get('/blog/posts/').json()['results'][0]
+        self.assertEqual(project['thumbnail'], 'https://res.cloudinary.com/demo/image/upload/v1/pic.jpg')
+        self.assertIn(' 640w', project['thumbnail_srcset'])
+        self.assertEqual(post['featured_image'], 'https://res.cloudinary.com/demo/image/upload/v1/a.png')
+        self.assertIn(' 640w', post['featured_image_srcset'])
+
+
+class ORJSONRendererTests(TestCase):
+
+    def payload(self):
+        from datetime import datetime, timezone as dt_timezone
+        from decimal import Decimal
+        from uuid import UUID
+        from zoneinfo import ZoneInfo
+
+        from django.utils.translation import gettext_lazy
+        from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+        moment = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=dt_timezone.utc)
+        return ReturnDict({
+            'results': ReturnList([{'id': 1, 'title': "Café — \u2028 \u2029 line"}], serializer=None),
+            'utc': moment,
+            'offset': moment.astimezone(ZoneInfo('Asia/Kolkata')),
+            'date': moment.date(),
+            'time': moment.time(),
+            'duration': timedelta(minutes=3),
+            'price': Decimal('12.50'),
+            'uuid': UUID(int=1),
+            'lazy': gettext_lazy("Not found."),
+            'nested': {1: [None, True, 1.5]},
+        }, serializer=None)
+
+    def test_matches_json_renderer_bytes(self):
+        from rest_framework.renderers import JSONRenderer
+
+        data = self.payload()
+        self.assertEqual(renderers.ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_falls_back_for_indent_and_unsupported_values(self):
+        from rest_framework.renderers import JSONRenderer
+
+        data = {'big': 2 ** 70, 'items': [1, 2]}
+        self.assertEqual(renderers.ORJSONRenderer().render(data), JSONRenderer().render(data))
+        indented = renderers.ORJSONRenderer().render(data, 'application/json; indent=2')
+        self.assertEqual(indented, JSONRenderer().render(data, 'application/json; indent=2'))
+        with self.assertRaises(TypeError):
+            renderers.ORJSONRenderer().render({'value': object()})
+
+    def test_parser(self):
+        from rest_framework.exceptions import ParseError
+
+        parser = renderers.ORJSONParser()
+        self.assertEqual(parser.parse(BytesIO('{"a": [1, "é"]}'.encode())), {'a': [1, "é"]})
+        with self.assertRaises(ParseError):
+            parser.parse(BytesIO(b'{"a": NaN}'))
+        latin1 = parser.parse(BytesIO('{"a": "é"}'.encode('latin-1')), parser_context={'encoding': 'latin-1'})
+        self.assertEqual(latin1, {'a': "é"})
+
+    def test_api_responses_are_identical_with_either_backend(self):
+        from rest_framework.parsers import JSONParser
+        from rest_framework.renderers import JSONRenderer
+
+        TechCategory.objects.create(name="Backend").technology_set.create(name="Django", proficiency=4)
+        for i in range(3):
+            Project.objects.create(title=f"Project {i}", tagline="Ünïcode tagline")
+        bodies = []
+        for renderer, parser in [(JSONRenderer, JSONParser), (renderers.ORJSONRenderer, renderers.ORJSONParser)]:
+            rest_framework = {
+                'DEFAULT_RENDERER_CLASSES': [renderer],
+                'DEFAULT_PARSER_CLASSES': [parser],
+                'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.AllowAny'],
+            }
+            with self.subTest(renderer=renderer.__name__), override_settings(REST_FRAMEWORK=rest_framework):
+                cache.clear()
+                bodies.append([self.client.get(path).content for path in ['/projects/projects/', '/projects/tech-stack/']])
+                response = self.client.post('/projects/contact/', {
+                    'name': "Ada", 'email': "ada@example.com", 'subject': "Hi", 'message': "Hello",
+                }, content_type='application/json')
+                self.assertEqual(response.status_code, 201)
+        self.assertEqual(bodies[0], bodies[1])
+
+
+class SnapshotExportTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(ProjectPagination, 'page_size', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        tech = TechCategory.objects.create(name="Backend").technology_set.create(name="Django", proficiency=4)
+        self.projects = []
+        for i in range(3):
+            project = Project.objects.create(title=f"Project {i}", tagline="T")
+            project.technologies.add(tech)
+            ProjectDetail.objects.create(project=project, problem_statement="# Problem", solution_approach="S",
+                                         technology_justification="J")
+            self.projects.append(project)
+        self.post = BlogPost.objects.create(title="Post", excerpt="E", content="C", category='technical', is_published=True)
+        CareerHighlight.objects.create(title="Engineer", organization="Org", date_range="2024", description="D")
+
+    def export(self, **kwargs):
+        return snapshot.Snapshot(self.root, 'https://api.example.com').export(**kwargs)
+
+    def manifest(self):
+        with open(os.path.join(self.root, snapshot.MANIFEST)) as f:
+            return json.load(f)
+
+    def read(self, path):
+        with open(os.path.join(self.root, self.manifest()['files'][path]), 'rb') as f:
+            return f.read()
+
+    def test_every_public_get_route_is_exported(self):
+        from django.urls import URLPattern, URLResolver, get_resolver
+
+        self.export()
+        files = self.manifest()['files']
+        paths = []
+        for entry in get_resolver().url_patterns:
+            if isinstance(entry, URLPattern) and str(entry.pattern):  # /home/; not the root banner
+                paths.append(f'/{entry.pattern}')
+            elif isinstance(entry, URLResolver) and str(entry.pattern) != 'admin/':
+                paths += [f'/{entry.pattern}{p.pattern}' for p in entry.url_patterns if isinstance(p, URLPattern)]
+        for path in paths:
+            with self.subTest(route=path):
+                if path in snapshot.EXCLUDED:
+                    continue
+                if '<slug:slug>' in path:
+                    path = path.replace('<slug:slug>', self.post.slug if path.startswith('/blog/') else self.projects[0].slug)
+                self.assertIn(path, files)
+
+    def test_files_hold_the_api_bytes_with_hashed_names(self):
+        self.export()
+        files = self.manifest()['files']
+        detail = f'/projects/projects/{self.projects[0].slug}/'
+        self.assertRegex(files[detail], rf'^projects/projects/{self.projects[0].slug}\.[0-9a-f]{{12}}\.json$')
+        self.assertEqual(self.read(detail), self.client.get(detail).content)
+        self.assertEqual(self.read('/blog/posts/?category=technical'), self.client.get('/blog/posts/?category=technical').content)
+
+        # Pages follow `next`, with links on the public origin
+        first = json.loads(self.read('/projects/projects/'))
+        self.assertTrue(first['next'].startswith('https://api.example.com/projects/projects/?cursor='))
+        second = json.loads(self.read(first['next'].removeprefix('https://api.example.com')))
+        self.assertEqual(len(first['results']) + len(second['results']), 3)
+
+    def test_only_changed_units_are_rendered_again(self):
+        first = self.export()
+        self.assertEqual(first['unchanged'], 0)
+        before = self.manifest()['files']
+        self.assertEqual(self.export(), {'rendered': 0, 'unchanged': first['rendered'], 'removed': 0})
+
+        self.post.title = "Renamed"
+        self.post.save()
+        Project.objects.filter(pk=self.projects[2].pk).update(is_published=False)
+        result = self.export()
+        after = self.manifest()['files']
+
+        # The post, every post list, the project lists and the stats rows behind them
+        changed = {path for path in after if before.get(path) != after[path]}
+        self.assertIn(f'/blog/posts/{self.post.slug}/', changed)
+        self.assertIn('/blog/recent/', changed)
+        self.assertIn('/projects/projects/', changed)
+        self.assertNotIn(f'/projects/projects/{self.projects[0].slug}/', changed)
+        self.assertNotIn('/core/highlights/', changed)
+        self.assertNotIn(f'/projects/projects/{self.projects[2].slug}/', after)
+        self.assertGreater(result['removed'], 0)
+        self.assertEqual(
+            sorted(name for _, _, names in os.walk(self.root) for name in names if name != snapshot.MANIFEST),
+            sorted(os.path.basename(name) for name in after.values()),
+        )
+
+    def test_missing_files_are_rewritten(self):
+        self.export()
+        os.remove(os.path.join(self.root, self.manifest()['files']['/core/highlights/']))
+        self.assertEqual(self.export()['rendered'], 1)
+
+    def test_command(self):
+        out = StringIO()
+        call_command('export_snapshot', '--output', self.root, stdout=out)
+        self.assertIn("0 unchanged", out.getvalue())
+        call_command('export_snapshot', '--output', self.root, '--full', stdout=out)
+        self.assertIn("0 unchanged", out.getvalue())
@@ -1,6 +1,9 @@
 # portfolio_backend/core/urls.py
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+read_views = async_views if settings.ASYNC_READ_VIEWS else views
 
 """urlpatterns = [
     # example route
@@ -9,8 +12,10 @@ from . import views
 
 
 urlpatterns = [
-    path('highlights/', views.career_highlights, name='career-highlights'),
-    path('config/', views.site_config, name='site-config'),
+    path('highlights/', read_views.career_highlights, name='career-highlights'),
+    path('config/', read_views.site_config, name='site-config'),
     path('stats/', views.portfolio_stats, name='portfolio-stats'),
     path('contact/', views.send_contact_email, name='contact'),
+    path('cache-stats/', views.cache_stats, name='cache-stats'),
+    path('db-stats/', views.db_stats, name='db-stats'),
 ]
@@ -1,98 +1,114 @@
 # backend/portfolio_backend/core/views.py (COMPLETE VERSION)
 from rest_framework import generics
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 from django.views.decorators.csrf import csrf_exempt
 from .models import CareerHighlight, SiteConfiguration, ContactSubmission
-import resend
+from . import response_cache
+from .response_cache import cache_response
+from .conditional import conditional
+from .stats import get_snapshot
+from .outbox import enqueue_contact_notification
+from portfolio_backend.db_backends import metrics as db_metrics
 import json
-import os
-from django.conf import settings
+from django.db import transaction
 
-# Configure Resend API key from environment/settings (no hardcoded default)
-resend.api_key = getattr(settings, "RESEND_API_KEY", None) or os.getenv("RESEND_API_KEY", "")
+# Response keys for a CareerHighlight, in order; rows come straight from values()
+HIGHLIGHT_FIELDS = ['id', 'title', 'organization', 'date_range', 'description', 'metrics', 'is_current', 'order']
 
+@cache_response('highlights')
 @api_view(['GET'])
 def career_highlights(request):
     """Get all career highlights"""
-    highlights = CareerHighlight.objects.all()
-    data = []
-    for highlight in highlights:
-        data.append({
-            'id': highlight.id,
-            'title': highlight.title,
-            'organization': highlight.organization,
-            'date_range': highlight.date_range,
-            'description': highlight.description,
-            'metrics': highlight.metrics,
-            'is_current': highlight.is_current,
-            'order': highlight.order
-        })
-    return Response(data)
+    return Response(list(CareerHighlight.objects.values(*HIGHLIGHT_FIELDS)))
+
+# Returned when no SiteConfiguration row exists yet
+DEFAULT_SITE_CONFIG = {
+    'site_name': 'Nikhil Dodda',
+    'tagline': 'Applied AI Engineer',
+    'bio': 'Applied AI Engineer specializing in production LLM systems and scalable cloud infrastructure.',
+    'email': 'hello@nikhildodda.dev',
+    'github_url': 'https://github.com/iamdevnd',
+    'bluesky_handle': '@devdn.bsky.social',
+    'cal_com_username': 'dnpro',
+    'linkedin_url': '',  # Empty since you don't want LinkedIn
+    'twitter_url': '',   # Empty since you prefer Bluesky
+    'profile_image': None,
+    'resume_file': None,
+    'meta_description': 'Applied AI Engineer specializing in production LLM systems, RAG architectures, and scalable ML infrastructure.',
+    'meta_keywords': 'AI Engineer, Machine Learning, LLM, RAG Systems, Python, AWS, MLOps'
+}
+
+def site_config_data(config):
+    """Response body for the site configuration (shared with async_views)"""
+    if not config:
+        return DEFAULT_SITE_CONFIG
+    # The model has no bluesky/cal.com/profile image fields; those keep their defaults
+    profile_image = getattr(config, 'profile_image', None)
+    return {
+        'site_name': config.name,
+        'tagline': config.tagline,
+        'bio': config.bio,
+        'email': config.email,
+        'github_url': config.github_url,
+        'bluesky_handle': getattr(config, 'bluesky_handle', DEFAULT_SITE_CONFIG['bluesky_handle']),
+        'cal_com_username': getattr(config, 'cal_com_username', DEFAULT_SITE_CONFIG['cal_com_username']),
+        'linkedin_url': config.linkedin_url if hasattr(config, 'linkedin_url') else '',
+        'twitter_url': config.twitter_url if hasattr(config, 'twitter_url') else '',
+        'profile_image': profile_image.url if profile_image else None,
+        'resume_file': config.resume_url or None,
+        'meta_description': config.meta_description,
+        'meta_keywords': config.meta_keywords,
+    }
+
+def site_config_validators(request):
+    updated_at = SiteConfiguration.objects.values_list('updated_at', flat=True).first()
+    return updated_at and updated_at.isoformat(), updated_at
 
-@api_view(['GET'])  
+@conditional(site_config_validators)
+@cache_response('site_config')
+@api_view(['GET'])
 def site_config(request):
     """Get site configuration"""
     try:
         config = SiteConfiguration.objects.first()
-        if not config:
-            # Return default values if no config exists
-            return Response({
-                'site_name': 'Nikhil Dodda',
-                'tagline': 'Applied AI Engineer',
-                'bio': 'Applied AI Engineer specializing in production LLM systems and scalable cloud infrastructure.',
-                'email': 'hello@nikhildodda.dev',
-                'github_url': 'https://github.com/iamdevnd',
-                'bluesky_handle': '@devdn.bsky.social',
-                'cal_com_username': 'dnpro',
-                'linkedin_url': '',  # Empty since you don't want LinkedIn
-                'twitter_url': '',   # Empty since you prefer Bluesky
-                'profile_image': None,
-                'resume_file': None,
-                'meta_description': 'Applied AI Engineer specializing in production LLM systems, RAG architectures, and scalable ML infrastructure.',
-                'meta_keywords': 'AI Engineer, Machine Learning, LLM, RAG Systems, Python, AWS, MLOps'
-            })
-        
-        data = {
-            'site_name': config.site_name,
-            'tagline': config.tagline,
-            'bio': config.bio,
-            'email': config.email,
-            'github_url': config.github_url,
-            'bluesky_handle': getattr(config, 'bluesky_handle', '@devdn.bsky.social'),
-            'cal_com_username': config.cal_com_username,
-            'linkedin_url': config.linkedin_url if hasattr(config, 'linkedin_url') else '',
-            'twitter_url': config.twitter_url if hasattr(config, 'twitter_url') else '',
-            'profile_image': config.profile_image.url if config.profile_image else None,
-            'resume_file': config.resume_file.url if config.resume_file and config.resume_file else None,
-            'meta_description': config.meta_description,
-            'meta_keywords': config.meta_keywords,
-        }
+        data = site_config_data(config)
         return Response(data)
     except Exception as e:
         return Response({'error': str(e)}, status=500)
 
+@cache_response('stats')
 @api_view(['GET'])
 def portfolio_stats(request):
-    """Get portfolio statistics for dashboard"""
-    from projects.models import Project, Technology
-    
-    total_projects = Project.objects.filter(is_published=True).count()
-    featured_projects = Project.objects.filter(is_published=True, is_featured=True).count()
-    technologies_count = Technology.objects.count()
+    """Get portfolio statistics for dashboard (served by /core/stats/ and /projects/stats/)"""
+    return Response(portfolio_stats_data())
+
+def portfolio_stats_data():
+    """Response body for the stats endpoints (shared with the /home/ bundle)"""
+    snapshot = get_snapshot()
     
-    # Your reported metrics from VS SOFT
-    stats = {
-        'total_projects': total_projects,
-        'featured_projects': featured_projects,
-        'technologies_mastered': technologies_count,
-        'years_experience': 2,  # Adjust based on your timeline
+    return {
+        'total_projects': snapshot.total_projects,
+        'featured_projects': snapshot.featured_projects,
+        'technologies_mastered': snapshot.technologies_count,
+        'years_experience': snapshot.years_experience,
         'uptime_percentage': '99.9',  # Your reported uptime
         'performance_improvement': '40'  # Your latency improvement
     }
-    
-    return Response(stats)
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    """Response cache hit/miss counters for this process"""
+    return Response(response_cache.stats())
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def db_stats(request):
+    """Database connection reuse counters for this process"""
+    return Response(db_metrics.snapshot())
 
 @api_view(['POST'])
 @csrf_exempt
@@ -117,68 +133,23 @@ def send_contact_email(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Save to database
-        contact_submission = ContactSubmission.objects.create(
-            name=name,
-            email=email,
-            company=company,
-            subject=subject,
-            message=message
-        )
-        
-        # Send email using Resend
-        params = {
-            "from": "Portfolio Contact <onboarding@resend.dev>",
-            "to": ["doddanikhil@gmail.com"],
-            "subject": f"Portfolio Contact: {subject}",
-            "html": f"""
-            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                <h2 style="color: #2563eb; border-bottom: 2px solid #e5e7eb; padding-bottom: 10px;">
-                    New Portfolio Contact Form Submission
-                </h2>
-                
-                <div style="background: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <p style="margin: 10px 0;"><strong>Name:</strong> {name}</p>
-                    <p style="margin: 10px 0;"><strong>Email:</strong> {email}</p>
-                    {f'<p style="margin: 10px 0;"><strong>Company:</strong> {company}</p>' if company else ''}
-                    <p style="margin: 10px 0;"><strong>Subject:</strong> {subject}</p>
-                </div>
-                
-                <div style="background: #ffffff; border: 1px solid #e5e7eb; padding: 20px; border-radius: 8px;">
-                    <h3 style="color: #374151; margin-top: 0;">Message:</h3>
-                    <div style="background: #f5f5f5; padding: 15px; border-radius: 5px; line-height: 1.6;">
-                        {message.replace(chr(10), '<br>')}
-                    </div>
-                </div>
-                
-                <div style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 14px;">
-                    <p>Sent from your portfolio contact form at iamdevnd.dev</p>
-                    <p>Time: {contact_submission.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-                </div>
-            </div>
-            """,
-            "reply_to": [email]
-        }
+        # Save the submission and queue the notification in one transaction;
+        # the send_outbox worker delivers it, so no provider call happens here
+        with transaction.atomic():
+            contact_submission = ContactSubmission.objects.create(
+                name=name,
+                email=email,
+                company=company,
+                subject=subject,
+                message=message
+            )
+            enqueue_contact_notification(contact_submission)
         
-        try:
-            email_response = resend.Emails.send(params)
-            print(f"Email sent successfully: {email_response}")
-            
-            return Response({
-                'success': True, 
-                'message': 'Thank you for your message! I\'ll get back to you soon.',
-                'id': contact_submission.id
-            })
-            
-        except Exception as email_error:
-            print(f"Email sending failed: {email_error}")
-            # Still return success since we saved to database
-            return Response({
-                'success': True,
-                'message': 'Your message has been received. I\'ll get back to you soon!',
-                'id': contact_submission.id,
-                'note': 'Email delivery pending'
-            })
+        return Response({
+            'success': True, 
+            'message': 'Thank you for your message! I\'ll get back to you soon.',
+            'id': contact_submission.id
+        })
         
     except Exception as e:
         print(f"Contact form error: {e}")
@@ -0,0 +1,48 @@
+# backend/portfolio_backend/db_backends/__init__.py
+import time
+
+from . import metrics
+
+
+class InstrumentedConnectionMixin:
+    """
+    Adds checkout / connect-time / health-check counters (see metrics.py) to a
+    Django DatabaseWrapper. Reuse itself comes from CONN_MAX_AGE and
+    CONN_HEALTH_CHECKS, which Django handles.
+    """
+    _checked_out = False
+
+    def get_new_connection(self, conn_params):
+        start = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        metrics.record_connect(time.perf_counter() - start)
+        return connection
+
+    def _cursor(self, name=None):
+        if not self._checked_out:
+            self._checked_out = True
+            metrics.record_checkout(reused=self.connection is not None)
+        return super()._cursor(name)
+
+    def close_if_health_check_failed(self):
+        was_open = self.connection is not None
+        super().close_if_health_check_failed()
+        if was_open and self.connection is None:
+            metrics.record_health_check_failure()
+
+    def _release(self):
+        if self._checked_out:
+            self._checked_out = False
+            metrics.record_release()
+
+    def close_if_unusable_or_obsolete(self):
+        # Called by Django at the start and end of every request
+        self._release()
+        super().close_if_unusable_or_obsolete()
+
+    def close(self):
+        was_open = self.connection is not None
+        self._release()
+        super().close()
+        if was_open and self.connection is None:
+            metrics.record_close()
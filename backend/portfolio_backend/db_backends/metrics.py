@@ -0,0 +1,76 @@
+# backend/portfolio_backend/db_backends/metrics.py
+"""
+Connection usage counters for this process, fed by InstrumentedConnectionMixin.
+
+A "checkout" is a request (or management command step) starting to use a
+connection; it ends when Django closes or recycles connections at the request
+boundary. The wait is the time spent opening a new connection (TCP + TLS +
+auth) when no persistent one could be reused.
+"""
+import threading
+
+_lock = threading.Lock()
+_counters = {}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _counters.update({
+            'checkouts': 0,
+            'reused_checkouts': 0,
+            'in_use': 0,
+            'peak_in_use': 0,
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'health_check_failures': 0,
+            'connect_seconds_total': 0.0,
+            'connect_seconds_max': 0.0,
+        })
+
+
+reset()
+
+
+def record_checkout(reused):
+    with _lock:
+        _counters['checkouts'] += 1
+        _counters['reused_checkouts'] += int(reused)
+        _counters['in_use'] += 1
+        _counters['peak_in_use'] = max(_counters['peak_in_use'], _counters['in_use'])
+
+
+def record_release():
+    with _lock:
+        _counters['in_use'] -= 1
+
+
+def record_connect(seconds):
+    with _lock:
+        _counters['connections_opened'] += 1
+        _counters['connect_seconds_total'] += seconds
+        _counters['connect_seconds_max'] = max(_counters['connect_seconds_max'], seconds)
+
+
+def record_close():
+    with _lock:
+        _counters['connections_closed'] += 1
+
+
+def record_health_check_failure():
+    with _lock:
+        _counters['health_check_failures'] += 1
+
+
+def snapshot():
+    with _lock:
+        data = dict(_counters)
+    data['open'] = data['connections_opened'] - data['connections_closed']
+    data['utilisation'] = round(data['in_use'] / data['open'], 4) if data['open'] else 0.0
+    data['reuse_ratio'] = round(data['reused_checkouts'] / data['checkouts'], 4) if data['checkouts'] else None
+    data['avg_wait_ms'] = (
+        round(data['connect_seconds_total'] * 1000 / data['checkouts'], 3) if data['checkouts'] else 0.0
+    )
+    data['max_connect_ms'] = round(data.pop('connect_seconds_max') * 1000, 3)
+    data['total_connect_ms'] = round(data.pop('connect_seconds_total') * 1000, 3)
+    return data
@@ -0,0 +1,8 @@
+# backend/portfolio_backend/db_backends/postgresql/base.py
+from django.db.backends.postgresql import base
+
+from portfolio_backend.db_backends import InstrumentedConnectionMixin
+
+
+class DatabaseWrapper(InstrumentedConnectionMixin, base.DatabaseWrapper):
+    """PostgreSQL backend with connection reuse metrics"""
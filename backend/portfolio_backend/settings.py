@@ -51,8 +51,15 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'portfolio_backend.core.nplusone.NPlusOneMiddleware',
 ]
 
+# N+1 query detection (see core/nplusone.py): 'off', 'log' or 'raise'. The test
+# runner switches it to 'raise' so regressions fail the suite.
+NPLUSONE_DETECTION = os.getenv("NPLUSONE_DETECTION", "log" if DEBUG else "off")
+NPLUSONE_THRESHOLD = int(os.getenv("NPLUSONE_THRESHOLD", "5"))  # allowed repeats of one query shape
+TEST_RUNNER = 'portfolio_backend.core.nplusone.NPlusOneTestRunner'
+
 ROOT_URLCONF = 'portfolio_backend.urls'
 
 TEMPLATES = [
@@ -73,10 +80,19 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'portfolio_backend.wsgi.application'
 
+# Serve the read endpoints with async views; run under ASGI with uvicorn
+# workers when this is on (see README "Deployment")
+ASYNC_READ_VIEWS = os.getenv("ASYNC_READ_VIEWS", "False").lower() == "true"
+
 # Database
+# Under ASGI every request runs its ORM calls in a fresh thread, so persistent
+# connections are never reused; leave pooling to PgBouncer in that mode.
+DB_CONN_MAX_AGE = os.getenv("DB_CONN_MAX_AGE", "0" if ASYNC_READ_VIEWS else "60")
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        # Stock postgresql backend plus connection reuse metrics (GET /core/db-stats/)
+        "ENGINE": "portfolio_backend.db_backends.postgresql",
         "NAME": os.getenv("DB_NAME"),
         "USER": os.getenv("DB_USER"),
         "PASSWORD": os.getenv("DB_PASSWORD"),
@@ -85,9 +101,34 @@ DATABASES = {
         "OPTIONS": {
             "sslmode": os.getenv("DB_SSLMODE", "prefer")  # Changed from "require" for local dev
         },
+        # Keep connections open between requests instead of paying TCP + TLS +
+        # auth every time; "none" means no limit, 0 restores per-request connects.
+        "CONN_MAX_AGE": None if DB_CONN_MAX_AGE.lower() == "none" else int(DB_CONN_MAX_AGE),
+        # Ping a reused connection before the first query of a request so a
+        # server-side disconnect doesn't surface as a 500.
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True").lower() == "true",
     }
 }
 
+# Cache: use Redis when available so response-cache invalidation and the
+# shared view counter reach every worker; local memory otherwise.
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300"))  # seconds
+BLOG_CATEGORY_COUNTS_TIMEOUT = int(os.getenv("BLOG_CATEGORY_COUNTS_TIMEOUT", "60"))  # seconds
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -97,11 +138,24 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 # DRF settings
+# JSON encoding/decoding: "orjson" (same bytes, several times faster) or "stdlib"
+API_JSON_BACKEND = os.getenv("API_JSON_BACKEND", "orjson")
+JSON_CLASSES = {
+    "orjson": ("portfolio_backend.core.renderers.ORJSONRenderer", "portfolio_backend.core.renderers.ORJSONParser"),
+    "stdlib": ("rest_framework.renderers.JSONRenderer", "rest_framework.parsers.JSONParser"),
+}
+JSON_RENDERER, JSON_PARSER = JSON_CLASSES[API_JSON_BACKEND]
+
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        JSON_RENDERER,
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        JSON_PARSER,
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",  # Public API
@@ -135,6 +189,21 @@ else:
 # Email configuration (Resend)
 RESEND_API_KEY = os.getenv("RESEND_API_KEY")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "hello@nikhildodda.dev")
+CONTACT_FROM_EMAIL = os.getenv("CONTACT_FROM_EMAIL", "Portfolio Contact <onboarding@resend.dev>")
+CONTACT_NOTIFICATION_EMAIL = os.getenv("CONTACT_NOTIFICATION_EMAIL", "doddanikhil@gmail.com")
+
+# Email outbox, drained by `python manage.py send_outbox`
+EMAIL_OUTBOX_PROVIDER = os.getenv("EMAIL_OUTBOX_PROVIDER", "portfolio_backend.core.outbox.ResendProvider")
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))  # Resend batch limit is 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "8"))
+EMAIL_OUTBOX_BACKOFF_SECONDS = 30
+EMAIL_OUTBOX_BACKOFF_MAX_SECONDS = 6 * 60 * 60
+EMAIL_OUTBOX_CLAIM_TIMEOUT = 10 * 60  # reclaim rows from a worker that died mid-send
+
+# Blog view counter: "local" buffers per process, "cache" uses the shared Django cache
+# (the default with Redis; flush_view_counts only works with it)
+BLOG_VIEW_COUNTER_BACKEND = os.getenv("BLOG_VIEW_COUNTER_BACKEND", "cache" if REDIS_URL else "local")
+BLOG_VIEW_COUNTER_FLUSH_INTERVAL = int(os.getenv("BLOG_VIEW_COUNTER_FLUSH_INTERVAL", "30"))  # seconds, 0 disables the timer
 
 # Cloudinary configuration
 CLOUDINARY_STORAGE = {
@@ -148,6 +217,12 @@ DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Hashed names, from collectstatic or export_snapshot, are cached forever
+WHITENOISE_IMMUTABLE_FILE_TEST = r'^.+\.[0-9a-f]{12}\..+$'
+
+# Static JSON copy of the public API (manage.py export_snapshot), served by WhiteNoise under /static/snapshot/
+SNAPSHOT_ROOT = os.getenv("SNAPSHOT_ROOT", os.path.join(STATIC_ROOT, 'snapshot'))
+SNAPSHOT_BASE_URL = os.getenv("SNAPSHOT_BASE_URL", "http://localhost:8000")  # origin used in pagination links
 
 # Media files
 MEDIA_URL = '/media/'
@@ -1,6 +1,8 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from django.http import HttpResponse
+from portfolio_backend.core import async_views, home as home_views
 
 def home(request):
     return HttpResponse("🚀 Django backend is live on Render!")
@@ -8,6 +10,8 @@ def home(request):
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", home),  # Root URL
+    # Homepage bundle: config, stats, highlights, featured projects, recent posts
+    path("home/", async_views.home if settings.ASYNC_READ_VIEWS else home_views.home, name="home-bundle"),
     path("projects/", include("projects.urls")),
     path("blog/", include("portfolio_backend.blog.urls")),
     path("core/", include("portfolio_backend.core.urls")),
@@ -2,6 +2,7 @@
 # Remove SiteConfiguration and CareerHighlight from this file since they're in core app
 
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 from django.urls import reverse
 from .models import TechCategory, Technology, Project, ProjectDetail
@@ -11,9 +12,14 @@ class TechCategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'tech_count']
     ordering = ['name']
     
+    def get_queryset(self, request):
+        # Counted in the changelist query instead of one query per row
+        return super().get_queryset(request).annotate(tech_total=Count('technology'))
+    
     def tech_count(self, obj):
-        return obj.technology_set.count()
+        return obj.tech_total
     tech_count.short_description = 'Technologies'
+    tech_count.admin_order_field = 'tech_total'
 
 @admin.register(Technology)
 class TechnologyAdmin(admin.ModelAdmin):
@@ -68,9 +74,13 @@ class ProjectAdmin(admin.ModelAdmin):
     has_demo.boolean = True
     has_demo.short_description = 'Demo'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(tech_total=Count('technologies', distinct=True))
+    
     def tech_count(self, obj):
-        return obj.technologies.count()
+        return obj.tech_total
     tech_count.short_description = 'Technologies'
+    tech_count.admin_order_field = 'tech_total'
 
 # Custom admin styling
 admin.site.site_header = "Nikhil Dodda - Portfolio Admin"
@@ -0,0 +1,58 @@
+# backend/projects/async_views.py
+from functools import partial
+
+from asgiref.sync import sync_to_async
+
+from portfolio_backend.core.async_views import json_response, not_found, paginate, sparse_fields
+from portfolio_backend.core.conditional import conditional
+from portfolio_backend.core.response_cache import cache_response
+from .models import Project
+from .serializers import ProjectDetailViewSerializer, TechCategorySerializer
+from .views import (
+    PROJECT_DETAIL_FIELDS,
+    PROJECT_LIST_FIELDS,
+    TECH_CATEGORY_FIELDS,
+    ProjectPagination,
+    project_detail_queryset,
+    project_detail_validators,
+    project_list_queryset,
+    project_list_rows,
+    project_list_validators,
+    tech_categories,
+    tech_stack_validators,
+)
+
+
+@conditional(project_list_validators)
+@cache_response('projects')
+@sparse_fields(PROJECT_LIST_FIELDS)
+async def project_list(request, featured=None, selection=None):
+    """List all published projects with optional filtering"""
+    queryset = project_list_queryset(request.GET, featured, selection)
+    # Technologies are one more query
+    rows = sync_to_async(partial(project_list_rows, selection=selection))
+    data = await paginate(request, queryset, rows, ProjectPagination)
+    if data is None:
+        return not_found(ProjectPagination.invalid_cursor_message)
+    return json_response(data)
+
+
+@conditional(project_detail_validators)
+@sparse_fields(PROJECT_DETAIL_FIELDS)
+async def project_detail(request, slug, selection=None):
+    """Get detailed view of a single project"""
+    try:
+        project = await project_detail_queryset(selection).aget(slug=slug)
+    except Project.DoesNotExist:
+        return not_found()
+    return json_response(ProjectDetailViewSerializer(project, context={'request': request}, selection=selection).data)
+
+
+@conditional(tech_stack_validators)
+@cache_response('tech')
+@sparse_fields(TECH_CATEGORY_FIELDS)
+async def tech_stack(request, selection=None):
+    """Get technologies grouped by category (two queries total)"""
+    categories = [category async for category in tech_categories(selection)]
+    serializer = TechCategorySerializer(categories, many=True, context={'request': request}, selection=selection)
+    return json_response(serializer.data)
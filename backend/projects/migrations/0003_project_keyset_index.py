@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_siteconfiguration_alter_techcategory_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-priority', '-created_at', 'id'], name='project_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.0 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+MARKDOWN_FIELDS = [
+    'problem_statement', 'solution_approach', 'technology_justification', 'challenges_solved', 'lessons_learned',
+]
+
+
+def render_existing_details(apps, schema_editor):
+    from portfolio_backend.core import markup
+
+    ProjectDetail = apps.get_model('projects', 'ProjectDetail')
+    details = []
+    for detail in ProjectDetail.objects.iterator(chunk_size=500):
+        rendered, detail.toc = markup.render_sections(
+            (field, ProjectDetail._meta.get_field(field).verbose_name.capitalize(), getattr(detail, field))
+            for field in MARKDOWN_FIELDS
+        )
+        for field, html in rendered.items():
+            setattr(detail, f'{field}_html', html)
+        detail.code_snippets_html = markup.highlight_snippets(detail.code_snippets)
+        detail.content_hash = markup.content_hash(
+            *(getattr(detail, field) for field in MARKDOWN_FIELDS), detail.code_snippets,
+        )
+        details.append(detail)
+    ProjectDetail.objects.bulk_update(
+        details,
+        [f'{field}_html' for field in MARKDOWN_FIELDS] + ['code_snippets_html', 'toc', 'content_hash'],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectdetail',
+            name='problem_statement_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='solution_approach_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='technology_justification_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='challenges_solved_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='lessons_learned_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='code_snippets_html',
+            field=models.JSONField(default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='toc',
+            field=models.JSONField(default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='projectdetail',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(render_existing_details, migrations.RunPython.noop),
+    ]
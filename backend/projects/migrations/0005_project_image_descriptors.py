@@ -0,0 +1,39 @@
+# Generated by Django 5.0 on 2026-10-18 17:30
+
+from django.db import migrations, models
+
+IMAGE_DESCRIPTORS = {'thumbnail': 'thumbnail_descriptor', 'hero_image': 'hero_image_descriptor'}
+
+
+def build_descriptors(apps, schema_editor):
+    from portfolio_backend.core.images import build_descriptor
+
+    Project = apps.get_model('projects', 'Project')
+    projects = []
+    for project in Project.objects.all():
+        for image, descriptor in IMAGE_DESCRIPTORS.items():
+            resource = getattr(project, image)
+            setattr(project, descriptor, build_descriptor(resource) if resource else None)
+        projects.append(project)
+    Project.objects.bulk_update(projects, list(IMAGE_DESCRIPTORS.values()), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_projectdetail_rendered_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='thumbnail_descriptor',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='hero_image_descriptor',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(build_descriptors, migrations.RunPython.noop),
+    ]
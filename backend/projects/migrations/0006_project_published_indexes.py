@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_image_descriptors'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='project_keyset_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-priority', '-created_at', 'id'], name='project_published_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_featured', True), ('is_published', True)), fields=['-priority', '-created_at', 'id'], name='project_featured_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['updated_at'], name='project_published_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0 on 2026-10-18 21:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def fill_slugs(apps, schema_editor):
+    from projects.models import technology_slug
+
+    Technology = apps.get_model('projects', 'Technology')
+    technologies = list(Technology.objects.only('name'))
+    for technology in technologies:
+        technology.slug = technology_slug(technology.name)
+    Technology.objects.bulk_update(technologies, ['slug'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_published_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='technology',
+            name='slug',
+            field=models.SlugField(default='', editable=False, max_length=60),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_slugs, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='technology',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['slug'], name='technology_slug_trgm', opclasses=['gin_trgm_ops'],
+            ),
+        ),
+    ]
@@ -1,7 +1,9 @@
 # backend/projects/models.py
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.text import slugify
 from cloudinary.models import CloudinaryField
+from portfolio_backend.core import images, markup
 import cloudinary.uploader
 
 
@@ -17,6 +19,11 @@ class TechCategory(models.Model):
         return self.name
 
 
+def technology_slug(name):
+    """Normalized technology name, with + and # spelled out so C, C++ and C# stay apart"""
+    return slugify(name.replace('+', 'plus').replace('#', 'sharp'))
+
+
 class Technology(models.Model):
     PROFICIENCY_CHOICES = [
         (1, 'Beginner'),
@@ -27,6 +34,8 @@ class Technology(models.Model):
     ]
     
     name = models.CharField(max_length=50)
+    # Normalized name for ?tech= on the project list, set in save()
+    slug = models.SlugField(max_length=60, editable=False)
     category = models.ForeignKey(TechCategory, on_delete=models.CASCADE)
     proficiency = models.IntegerField(choices=PROFICIENCY_CHOICES)
     icon_url = models.URLField(blank=True)
@@ -36,17 +45,44 @@ class Technology(models.Model):
     class Meta:
         verbose_name_plural = "Technologies"
         ordering = ['category__order', 'name']
+        indexes = [
+            # Substring matches on slug (the ?tech= fallback) on PostgreSQL; needs pg_trgm
+            GinIndex(fields=['slug'], name='technology_slug_trgm', opclasses=['gin_trgm_ops']),
+        ]
+    
+    def save(self, *args, **kwargs):
+        self.slug = technology_slug(self.name)
+        if kwargs.get('update_fields') is not None and 'name' in kwargs['update_fields']:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'slug'}
+        super().save(*args, **kwargs)
     
     def __str__(self):
         return f"{self.name} ({self.get_proficiency_display()})"
 
 
+class ProjectQuerySet(models.QuerySet):
+    def published(self):
+        return self.filter(is_published=True)
+
+    def with_technologies(self):
+        """Prefetch technologies and their categories in one extra query"""
+        return self.prefetch_related(
+            models.Prefetch(
+                'technologies',
+                queryset=Technology.objects.select_related('category'),
+            )
+        )
+
+
 class Project(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=250, unique=True, blank=True)
     tagline = models.CharField(max_length=300, help_text="One-line description")
     thumbnail = CloudinaryField('image', null=True, blank=True)
     hero_image = CloudinaryField('image', null=True, blank=True)
+    # URL + srcset for the images above, rebuilt in save() when they change (core.images)
+    thumbnail_descriptor = models.JSONField(null=True, blank=True, editable=False)
+    hero_image_descriptor = models.JSONField(null=True, blank=True, editable=False)
     technologies = models.ManyToManyField(Technology)
     github_url = models.URLField(blank=True)
     live_demo_url = models.URLField(blank=True)
@@ -56,12 +92,30 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProjectQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-priority', '-created_at']
+        indexes = [
+            # Partial indexes over published projects, for the public queries:
+            # keyset pagination order (ProjectPagination), all and featured ...
+            models.Index(fields=['-priority', '-created_at', 'id'], name='project_published_keyset_idx',
+                         condition=models.Q(is_published=True)),
+            models.Index(fields=['-priority', '-created_at', 'id'], name='project_featured_keyset_idx',
+                         condition=models.Q(is_published=True, is_featured=True)),
+            # ... and the list ETag probe, Max(updated_at)
+            models.Index(fields=['updated_at'], name='project_published_updated_idx',
+                         condition=models.Q(is_published=True)),
+        ]
+    
+    IMAGE_DESCRIPTORS = {'thumbnail': 'thumbnail_descriptor', 'hero_image': 'hero_image_descriptor'}
     
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        changed = images.refresh_descriptors(self, self.IMAGE_DESCRIPTORS)
+        if changed and kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *changed}
         super().save(*args, **kwargs)
     
     def __str__(self):
@@ -81,6 +135,42 @@ class ProjectDetail(models.Model):
     code_snippets = models.JSONField(default=list, help_text='[{"title": "Core Algorithm", "language": "python", "code": "..."}]')
     demo_video_url = models.URLField(blank=True)
     
+    # Rendered from the markdown fields and code_snippets in save(), see core.markup
+    problem_statement_html = models.TextField(blank=True, editable=False)
+    solution_approach_html = models.TextField(blank=True, editable=False)
+    technology_justification_html = models.TextField(blank=True, editable=False)
+    challenges_solved_html = models.TextField(blank=True, editable=False)
+    lessons_learned_html = models.TextField(blank=True, editable=False)
+    code_snippets_html = models.JSONField(default=list, editable=False)
+    toc = models.JSONField(default=list, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    
+    MARKDOWN_FIELDS = [
+        'problem_statement', 'solution_approach', 'technology_justification', 'challenges_solved', 'lessons_learned',
+    ]
+    RENDERED_FIELDS = {f'{field}_html' for field in MARKDOWN_FIELDS} | {'code_snippets_html', 'toc', 'content_hash'}
+    
+    def save(self, *args, **kwargs):
+        if self.render_content() and kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *self.RENDERED_FIELDS}
+        super().save(*args, **kwargs)
+    
+    def render_content(self):
+        """Render every markdown field and snippet unless none changed since the last render"""
+        digest = markup.content_hash(*(getattr(self, field) for field in self.MARKDOWN_FIELDS), self.code_snippets)
+        if digest == self.content_hash:
+            return False
+        
+        rendered, self.toc = markup.render_sections(
+            (field, self._meta.get_field(field).verbose_name.capitalize(), getattr(self, field))
+            for field in self.MARKDOWN_FIELDS
+        )
+        for field, html in rendered.items():
+            setattr(self, f'{field}_html', html)
+        self.code_snippets_html = markup.highlight_snippets(self.code_snippets)
+        self.content_hash = digest
+        return True
+    
     def __str__(self):
         return f"Details for {self.project.title}"
 
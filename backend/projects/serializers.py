@@ -1,15 +1,17 @@
 # backend/projects/serializers.py
 from rest_framework import serializers
+from portfolio_backend.core.fieldsets import SparseFieldsMixin
+from portfolio_backend.core.images import DescriptorField
 from .models import TechCategory, Technology, Project, ProjectDetail
 
-class TechnologySerializer(serializers.ModelSerializer):
+class TechnologySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     
     class Meta:
         model = Technology
-        fields = ['id', 'name', 'category_name', 'proficiency', 'icon_url', 'description']
+        fields = ['id', 'name', 'slug', 'category_name', 'proficiency', 'icon_url', 'description']
 
-class TechCategorySerializer(serializers.ModelSerializer):
+class TechCategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     technologies = TechnologySerializer(source='technology_set', many=True, read_only=True)
     
     class Meta:
@@ -27,28 +29,44 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             'key_features',
             'performance_metrics',
             'challenges_solved',
-            'demo_video_url'
+            'demo_video_url',
+            # Sanitized HTML rendered at save time
+            'problem_statement_html',
+            'solution_approach_html',
+            'technology_justification_html',
+            'challenges_solved_html',
+            'lessons_learned_html',
+            'code_snippets_html',
+            'toc',
         ]
 
 class ProjectListSerializer(serializers.ModelSerializer):
     technologies = TechnologySerializer(many=True, read_only=True)
+    # Precomputed in Project.save (core.images) instead of built per row
+    thumbnail = DescriptorField(source='thumbnail_descriptor')
+    thumbnail_srcset = DescriptorField('srcset', source='thumbnail_descriptor')
     
     class Meta:
         model = Project
         fields = [
-            'id', 'title', 'slug', 'tagline', 'thumbnail', 
+            'id', 'title', 'slug', 'tagline', 'thumbnail', 'thumbnail_srcset',
             'technologies', 'github_url', 'live_demo_url',
             'is_featured', 'created_at'
         ]
 
-class ProjectDetailViewSerializer(serializers.ModelSerializer):
+class ProjectDetailViewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     technologies = TechnologySerializer(many=True, read_only=True)
     details = ProjectDetailSerializer(read_only=True)
+    thumbnail = DescriptorField(source='thumbnail_descriptor')
+    thumbnail_srcset = DescriptorField('srcset', source='thumbnail_descriptor')
+    hero_image = DescriptorField(source='hero_image_descriptor')
+    hero_image_srcset = DescriptorField('srcset', source='hero_image_descriptor')
     
     class Meta:
         model = Project
         fields = [
-            'id', 'title', 'slug', 'tagline', 'thumbnail',
+            'id', 'title', 'slug', 'tagline', 'thumbnail', 'thumbnail_srcset',
+            'hero_image', 'hero_image_srcset',
             'technologies', 'github_url', 'live_demo_url',
             'is_featured', 'created_at', 'updated_at', 'details'
         ]
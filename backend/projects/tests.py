@@ -1,3 +1,300 @@
+import json
+from datetime import timedelta
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import TechCategory, Technology, Project, ProjectDetail
+
+
+def create_projects(count, techs_per_project=3):
+    """Create `count` published projects, each with its own technologies and category"""
+    start = Project.objects.count()
+    for i in range(start, start + count):
+        category = TechCategory.objects.create(name=f"Category {i}", order=i)
+        project = Project.objects.create(
+            title=f"Project {i}",
+            tagline="Tagline",
+            is_featured=i % 2 == 0,
+        )
+        project.technologies.add(*[
+            Technology.objects.create(name=f"Tech {i}-{j}", category=category, proficiency=3)
+            for j in range(techs_per_project)
+        ])
+
+
+class ProjectListQueryBudgetTests(TestCase):
+    """The project list must run a fixed number of queries, regardless of size"""
+
+    # ETag probe, the project page, technologies + categories
+    QUERY_BUDGET = 3
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def assert_constant_queries(self, url):
+        create_projects(2)
+        small = self.count_queries(url)
+        create_projects(8)
+        large = self.count_queries(url)
+        self.assertEqual(small, large, f"{url} query count grew with N ({small} -> {large})")
+        self.assertLessEqual(large, self.QUERY_BUDGET)
+
+    def test_project_list(self):
+        self.assert_constant_queries(reverse('project-list'))
+
+    def test_featured_query_param(self):
+        self.assert_constant_queries(reverse('project-list') + '?featured=true')
+
+    def test_featured_route(self):
+        self.assert_constant_queries(reverse('featured-projects'))
+
+    def test_tech_filter(self):
+        self.assert_constant_queries(reverse('project-list') + '?tech=tech')
+
+    def test_featured_route_only_returns_featured(self):
+        create_projects(4)
+        response = self.client.get(reverse('featured-projects') + '?count=true')
+        self.assertTrue(all(p['is_featured'] for p in response.json()['results']))
+        self.assertEqual(response.json()['count'], 2)
+
+    def test_technologies_include_category_name(self):
+        create_projects(1, techs_per_project=1)
+        response = self.client.get(reverse('project-list'))
+        tech = response.json()['results'][0]['technologies'][0]
+        self.assertEqual(tech['category_name'], "Category 0")
+
+
+class TechFilterTests(TestCase):
+
+    def setUp(self):
+        category = TechCategory.objects.create(name="Stack", order=0)
+        techs = {
+            name: Technology.objects.create(name=name, category=category, proficiency=3)
+            for name in ["Django", "React", "React Native", "Next.js", "C", "C++"]
+        }
+        for title, names in [
+            ("Web", ["Django", "React"]),
+            ("API", ["Django"]),
+            ("Mobile", ["React Native"]),
+            ("Site", ["Next.js", "React"]),
+            ("Engine", ["C++"]),
+        ]:
+            Project.objects.create(title=title, tagline="T").technologies.add(*[techs[name] for name in names])
+
+    def titles(self, query):
+        response = self.client.get(reverse('project-list') + query)
+        self.assertEqual(response.status_code, 200)
+        return sorted(project['title'] for project in response.json()['results'])
+
+    def test_slugs_match_any_by_default(self):
+        self.assertEqual(self.titles('?tech=django,nextjs'), ["API", "Site", "Web"])
+        self.assertEqual(self.titles('?tech=django&tech=nextjs'), ["API", "Site", "Web"])
+
+    def test_match_all(self):
+        self.assertEqual(self.titles('?tech=django,react&tech_match=all'), ["Web"])
+        self.assertEqual(self.titles('?tech=django,nextjs&tech_match=all'), [])
+
+    def test_exact_slug_is_not_a_substring_match(self):
+        self.assertEqual(self.titles('?tech=react'), ["Site", "Web"])
+        self.assertEqual(self.titles('?tech=c'), [])
+        self.assertEqual(self.titles('?tech=cplusplus'), ["Engine"])
+
+    def test_names_are_normalized(self):
+        self.assertEqual(self.titles('?tech=Next.js'), ["Site"])
+        self.assertEqual(self.titles('?tech=React%20Native'), ["Mobile"])
+
+    def test_unknown_slug_falls_back_to_substring(self):
+        self.assertEqual(self.titles('?tech=reac'), ["Mobile", "Site", "Web"])
+        self.assertEqual(self.titles('?tech=native,django&tech_match=all'), [])
+        self.assertEqual(self.titles('?tech=haskell'), [])
+
+    def test_filter_uses_exists_without_distinct(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.titles('?tech=django,react&tech_match=all')
+        page = next(q['sql'] for q in ctx.captured_queries if 'ORDER BY' in q['sql'] and 'projects_project' in q['sql'])
+        self.assertEqual(page.count('EXISTS'), 2 + 2)  # per term, plus its no-exact-match check
+        self.assertNotIn('DISTINCT', page)
+
+    def test_slug_is_kept_in_sync_and_returned(self):
+        tech = Technology.objects.get(name="C++")
+        tech.name = "C#"
+        tech.save(update_fields=['name'])
+        tech.refresh_from_db()
+        self.assertEqual(tech.slug, "csharp")
+        response = self.client.get(reverse('project-list') + '?tech=csharp')
+        self.assertEqual(response.json()['results'][0]['technologies'][0]['slug'], "csharp")
+
+
+class SparseFieldsetTests(TestCase):
+
+    def setUp(self):
+        create_projects(2)
+        self.project = Project.objects.order_by('id').last()
+        ProjectDetail.objects.create(
+            project=self.project, problem_statement="P", solution_approach="S", technology_justification="T",
+        )
+
+    def get(self, url, queries):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), queries)
+        return response.json(), [query['sql'] for query in ctx.captured_queries]
+
+    def test_list_without_technologies_skips_their_query(self):
+        data, queries = self.get(reverse('project-list') + '?fields=title,slug', 2)  # ETag probe, the page
+        self.assertEqual(data['results'][0], {'title': self.project.title, 'slug': self.project.slug})
+        self.assertNotIn('tagline', queries[-1])
+
+    def test_nested_technology_fields(self):
+        data, queries = self.get(reverse('project-list') + '?fields=slug,technologies.name', 3)
+        self.assertEqual(data['results'][0]['technologies'][0], {'name': "Tech 1-0"})
+        self.assertNotIn('projects_techcategory', queries[-1].split('ORDER BY')[0].split('FROM')[0])
+        data, _ = self.get(reverse('project-list') + '?exclude=technologies.description', 3)
+        self.assertNotIn('description', data['results'][0]['technologies'][0])
+        self.assertIn('category_name', data['results'][0]['technologies'][0])
+
+    def test_detail_skips_unselected_relations(self):
+        url = reverse('project-detail', args=[self.project.slug])
+        data, queries = self.get(url + '?exclude=details,technologies', 2)  # ETag probe, the project
+        self.assertNotIn('details', data)
+        self.assertNotIn('JOIN', queries[-1])
+        data, queries = self.get(url + '?fields=title,details.problem_statement_html', 2)
+        self.assertEqual(data, {'title': self.project.title, 'details': {'problem_statement_html': '<p>P</p>'}})
+        self.assertNotIn('solution_approach', queries[-1])
+
+    def test_technology_endpoints(self):
+        data, queries = self.get(reverse('technology-list') + '?fields=name,slug', 1)
+        self.assertEqual(data[0], {'name': "Tech 0-0", 'slug': "tech-0-0"})
+        self.assertNotIn('"projects_techcategory"."name"', queries[0])  # joined for the ordering only
+        data, _ = self.get(reverse('tech-stack') + '?fields=name', 2)  # ETag probe, categories
+        self.assertEqual(data[0], {'name': "Category 0"})
+        data, _ = self.get(reverse('tech-stack') + '?fields=name,technologies.name', 3)
+        self.assertEqual(data[0], {'name': "Category 0", 'technologies': [{'name': "Tech 0-0"}, {'name': "Tech 0-1"}, {'name': "Tech 0-2"}]})
+
+    def test_unknown_fields_are_a_400(self):
+        for query in ['?fields=titel', '?exclude=technologies.colour', '?fields=title.x']:
+            with self.subTest(query=query):
+                response = self.client.get(reverse('project-list') + query)
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'detail': "Field title has no nested fields"})
+
+
+class ProjectPaginationTests(TestCase):
+
+    def test_pages_follow_priority_then_created_at_then_id(self):
+        create_projects(25, techs_per_project=1)
+        now = timezone.now()
+        for i, project in enumerate(Project.objects.order_by('id')):
+            Project.objects.filter(pk=project.pk).update(priority=i % 3, created_at=now - timedelta(days=i // 6))
+        expected = list(Project.objects.order_by('-priority', '-created_at', 'id').values_list('slug', flat=True))
+
+        slugs, url = [], reverse('project-list')
+        while url:
+            data = self.client.get(url).json()
+            slugs += [project['slug'] for project in data['results']]
+            url = data['next']
+        self.assertEqual(slugs, expected)
+
+    def test_deep_page_seeks_the_index_from_the_cursor(self):
+        Project.objects.bulk_create([
+            Project(title=f"Project {i}", slug=f"project-{i}", tagline="T", priority=i % 3) for i in range(45)
+        ])
+        first = self.client.get(reverse('project-list')).json()
+        second = self.client.get(first['next']).json()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(second['next'])
+        page = next(q['sql'] for q in ctx.captured_queries if 'ORDER BY' in q['sql'])
+        with connection.cursor() as cursor:
+            # An index range that starts at the cursor's priority, not a scan from the top
+            if connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')  # 45 rows; look at what the index allows
+                cursor.execute('EXPLAIN (FORMAT JSON) ' + page)
+                self.assertRegex(json.dumps(cursor.fetchone()[0]), r'"Index Cond": "\(priority <=')
+            else:
+                cursor.execute('EXPLAIN QUERY PLAN ' + page)
+                plan = ' '.join(row[-1] for row in cursor.fetchall())
+                self.assertIn('USING INDEX project_published_keyset_idx (priority<?)', plan)
+
+
+class ProjectListRowsTests(TestCase):
+
+    def test_values_rows_match_the_serializer(self):
+        from .serializers import ProjectListSerializer
+        from .views import PROJECT_LIST_COLUMNS, project_list_rows
+
+        create_projects(4)
+        project = Project.objects.create(title="No technologies", tagline="T")
+        Project.objects.filter(pk=project.pk).update(thumbnail_descriptor={
+            'source': 'image/upload/v1/a.jpg', 'url': 'https://x/a.jpg', 'srcset': 'https://x/a.jpg 320w',
+        })
+        projects = Project.objects.with_technologies().order_by('id')
+        rows = Project.objects.order_by('id').values(*PROJECT_LIST_COLUMNS)
+        # Rows, then every technology in one query
+        with self.assertNumQueries(2):
+            data = project_list_rows(list(rows))
+        self.assertEqual(data, ProjectListSerializer(projects, many=True).data)
+        self.assertEqual(data[-1]['technologies'], [])
+        self.assertEqual(data[-1]['thumbnail_srcset'], 'https://x/a.jpg 320w')
+
+
+class RenderedDetailTests(TestCase):
+
+    def test_details_ship_rendered_html_toc_and_highlighted_snippets(self):
+        project = Project.objects.create(title="Portfolio", tagline="T")
+        ProjectDetail.objects.create(
+            project=project,
+            problem_statement="## Scale\n\nToo *slow*",
+            solution_approach="[Docs](javascript:alert(1))",
+            technology_justification="",
+            code_snippets=[{'title': "Main", 'language': 'python', 'code': "def main(): pass"}],
+        )
+        details = self.client.get(reverse('project-detail', args=[project.slug])).json()['details']
+
+        self.assertEqual(
+            details['problem_statement_html'],
+            '<h2 id="problem-statement-scale">Scale</h2>\n<p>Too <em>slow</em></p>',
+        )
+        self.assertNotIn('javascript', details['solution_approach_html'])
+        self.assertEqual(details['technology_justification_html'], '')
+        self.assertEqual([section['id'] for section in details['toc']], ['problem-statement', 'solution-approach'])
+        self.assertEqual(details['toc'][0]['children'][0]['id'], 'problem-statement-scale')
+        self.assertIn('<span class="k">def</span>', details['code_snippets_html'][0]['html'])
+
+
+class ProjectDetailQueryBudgetTests(TestCase):
+
+    def test_detail_queries_do_not_grow_with_technologies(self):
+        create_projects(1, techs_per_project=10)
+        project = Project.objects.get()
+        # ETag probe, project + details, technologies + categories
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('project-detail', args=[project.slug]))
+        self.assertEqual(len(response.json()['technologies']), 10)
+
+
+class TechStackQueryBudgetTests(TestCase):
+
+    def test_tech_stack_loads_data_in_two_queries(self):
+        create_projects(6)
+        # ETag probe, categories, technologies
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('tech-stack'))
+        data = response.json()
+        self.assertEqual([c['name'] for c in data], [f"Category {i}" for i in range(6)])
+        self.assertEqual(len(data[0]['technologies']), 3)
+        self.assertEqual(data[0]['technologies'][0]['category_name'], "Category 0")
 
-# Create your tests here.
+    def test_technology_list_runs_one_query(self):
+        create_projects(6)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('technology-list'))
+        self.assertEqual(len(response.json()), 18)
+        self.assertEqual(response.json()[0]['category_name'], "Category 0")
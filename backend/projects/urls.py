@@ -1,5 +1,7 @@
 # backend/projects/urls.py
+from django.conf import settings
 from django.urls import path
+from . import async_views
 from .views import (
     ProjectListView,
     ProjectDetailView, 
@@ -12,18 +14,27 @@ from .views import (
     api_health
 )
 
+if settings.ASYNC_READ_VIEWS:
+    project_list = async_views.project_list
+    project_detail = async_views.project_detail
+    tech_stack = async_views.tech_stack
+else:
+    project_list = ProjectListView.as_view()
+    project_detail = ProjectDetailView.as_view()
+    tech_stack = TechStackView.as_view()
+
 urlpatterns = [
     # Health check
     path('test/', api_health, name='api-health'),
     
     # Projects
-    path('projects/', ProjectListView.as_view(), name='project-list'),
-    path('projects/featured/', ProjectListView.as_view(), {'featured': 'true'}, name='featured-projects'),
-    path('projects/<slug:slug>/', ProjectDetailView.as_view(), name='project-detail'),
+    path('projects/', project_list, name='project-list'),
+    path('projects/featured/', project_list, {'featured': 'true'}, name='featured-projects'),
+    path('projects/<slug:slug>/', project_detail, name='project-detail'),
     
     # Technologies
     path('technologies/', TechnologyListView.as_view(), name='technology-list'),
-    path('tech-stack/', TechStackView.as_view(), name='tech-stack'),
+    path('tech-stack/', tech_stack, name='tech-stack'),
     
     # Site data
     path('stats/', portfolio_stats, name='portfolio-stats'),
@@ -1,93 +1,327 @@
 # backend/projects/views.py
-from rest_framework import generics, status
+import operator
+from functools import reduce
+
+from rest_framework import generics, serializers, status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from django.core.mail import send_mail
-from django.conf import settings
-from .models import Project, Technology, TechCategory, SiteConfiguration
+from django.db.models import Count, Exists, Max, OuterRef, Prefetch, Q
+from django.utils.decorators import method_decorator
+from django.db import transaction
+from .models import Project, Technology, TechCategory, SiteConfiguration, technology_slug
 from portfolio_backend.core.models import CareerHighlight, ContactSubmission
+from portfolio_backend.core.outbox import enqueue_contact_notification
+from portfolio_backend.core import response_cache
+from portfolio_backend.core.conditional import conditional
+from portfolio_backend.core.fieldsets import Fieldset, SparseFieldsViewMixin, inner, wants
+from portfolio_backend.core.pagination import KeysetPagination
+from portfolio_backend.core.response_cache import cache_response
+from portfolio_backend.core.views import portfolio_stats  # noqa: F401 (routed in urls.py)
 from .serializers import (
     ProjectListSerializer, 
+    ProjectDetailSerializer,
     ProjectDetailViewSerializer,
     TechnologySerializer,
     TechCategorySerializer
 )
 
 
-class ProjectListView(generics.ListAPIView):
+def project_list_validators(request, *args, **kwargs):
+    """
+    Newest published edit + count (catch bulk updates and deletes) + the
+    persisted 'projects' version (catches technology, detail and M2M edits).
+    No Last-Modified: none of these is a time that advances on every change.
+    """
+    # Max() only lets the version subquery into the single aggregate query
+    probe = Project.objects.published().aggregate(
+        last=Max('updated_at'), count=Count('id'), version=Max(response_cache.content_version('projects')),
+    )
+    return (probe['last'] and probe['last'].isoformat(), probe['count'], probe['version']), None
+
+
+def project_detail_validators(request, slug, *args, **kwargs):
+    probe = (
+        Project.objects.published().filter(slug=slug)
+        .annotate(version=response_cache.content_version('projects'))
+        .values_list('updated_at', 'version').first()
+    )
+    if probe is None:
+        return None
+    updated_at, version = probe
+    return (updated_at.isoformat(), version), None
+
+
+def tech_stack_validators(request, *args, **kwargs):
+    # Technologies carry no timestamps; count + max id catch adds/removes and
+    # the persisted 'tech' version catches edits.
+    probe = Technology.objects.aggregate(
+        count=Count('id'), last_id=Max('id'), version=Max(response_cache.content_version('tech')),
+    )
+    return (probe['count'], probe['last_id'], probe['version']), None
+
+
+def site_metadata_validators(request, *args, **kwargs):
+    probe = (
+        SiteConfiguration.objects.annotate(version=response_cache.content_version('site_config'))
+        .values_list('pk', 'version').first()
+    )
+    return probe, None
+
+
+def published_projects(params, featured=None):
+    """Queryset behind the project list (shared with async_views)"""
+    queryset = Project.objects.published().with_technologies()
+    
+    # Filter by featured projects (query param or the featured/ route kwarg)
+    featured = featured or params.get('featured', None)
+    if featured == 'true':
+        queryset = queryset.filter(is_featured=True)
+    
+    # Filter by technology slugs: ?tech=django,react (or repeated ?tech=),
+    # any of them by default, all of them with ?tech_match=all
+    terms = tech_terms(params)
+    if terms:
+        if params.get('tech_match') == 'all':
+            for term in terms:
+                queryset = queryset.filter(uses_technologies(technology_match(term)))
+        else:
+            queryset = queryset.filter(uses_technologies(reduce(operator.or_, map(technology_match, terms))))
+    
+    return queryset
+
+
+MAX_TECH_TERMS = 10
+
+
+def tech_terms(params):
+    """Distinct normalized ?tech= values, at most MAX_TECH_TERMS"""
+    values = params.getlist('tech') if hasattr(params, 'getlist') else [params.get('tech') or '']
+    terms = {technology_slug(term): None for value in values for term in value.split(',')}
+    terms.pop('', None)
+    return list(terms)[:MAX_TECH_TERMS]
+
+
+def technology_match(term):
+    """
+    Technologies a ?tech= term selects: the exact slug (indexed) or, when no
+    technology has that slug, every slug containing it (trigram-indexed on
+    PostgreSQL). The NOT EXISTS is uncorrelated, so it is evaluated once.
+    """
+    return Q(slug=term) | Q(~Exists(Technology.objects.filter(slug=term)), slug__contains=term)
+
+
+def uses_technologies(match):
+    # EXISTS instead of joining technologies: one row per project, no DISTINCT,
+    # so the keyset index still gives the order
+    return Exists(Project.technologies.through.objects.filter(
+        project_id=OuterRef('pk'),
+        technology_id__in=Technology.objects.filter(match).values('pk'),
+    ))
+
+
+# Response keys -> columns (see core.fieldsets); relation lookups are joined only when selected
+TECHNOLOGY_FIELDS = Fieldset({
+    'id': ['id'], 'name': ['name'], 'slug': ['slug'], 'category_name': ['category__name'],
+    'proficiency': ['proficiency'], 'icon_url': ['icon_url'], 'description': ['description'],
+})
+TECH_CATEGORY_FIELDS = Fieldset(
+    {'id': ['id'], 'name': ['name'], 'order': ['order'], 'technologies': []},
+    nested={'technologies': TECHNOLOGY_FIELDS},
+)
+# Columns behind a list row; priority, created_at and id are also the keyset
+PROJECT_LIST_FIELDS = Fieldset(
+    {
+        'id': ['id'], 'title': ['title'], 'slug': ['slug'], 'tagline': ['tagline'],
+        'thumbnail': ['thumbnail_descriptor'], 'thumbnail_srcset': ['thumbnail_descriptor'],
+        'technologies': [], 'github_url': ['github_url'], 'live_demo_url': ['live_demo_url'],
+        'is_featured': ['is_featured'], 'created_at': ['created_at'],
+    },
+    nested={'technologies': TECHNOLOGY_FIELDS},
+    required=['id', 'priority', 'created_at'],
+)
+PROJECT_LIST_COLUMNS = PROJECT_LIST_FIELDS.columns(None)
+PROJECT_DETAIL_FIELDS = Fieldset(
+    {
+        'id': ['id'], 'title': ['title'], 'slug': ['slug'], 'tagline': ['tagline'],
+        'thumbnail': ['thumbnail_descriptor'], 'thumbnail_srcset': ['thumbnail_descriptor'],
+        'hero_image': ['hero_image_descriptor'], 'hero_image_srcset': ['hero_image_descriptor'],
+        'technologies': [], 'github_url': ['github_url'], 'live_demo_url': ['live_demo_url'],
+        'is_featured': ['is_featured'], 'created_at': ['created_at'], 'updated_at': ['updated_at'],
+        'details': [],
+    },
+    nested={
+        'technologies': TECHNOLOGY_FIELDS,
+        'details': Fieldset({name: [f'details__{name}'] for name in ProjectDetailSerializer.Meta.fields}),
+    },
+    required=['id'],
+)
+format_datetime = serializers.DateTimeField().to_representation
+
+
+def technologies_prefetch(selection=None, lookup='technologies', grouped=False):
+    """
+    Prefetch of the selected technology columns. Grouped under their category
+    (tech-stack), the category comes from the prefetch itself instead of a join.
+    """
+    queryset = Technology.objects.all()
+    columns = TECHNOLOGY_FIELDS.columns(selection)
+    if grouped:
+        queryset = queryset.order_by('name')
+        columns = [column for column in columns if '__' not in column] + ['category']
+    elif wants(selection, 'category_name'):
+        queryset = queryset.select_related('category')
+    if selection is not None:
+        queryset = queryset.only(*columns)
+    return Prefetch(lookup, queryset=queryset)
+
+
+def tech_categories(selection=None):
+    # Categories come back in TechCategory.order; the prefetch loads every
+    # technology at once and groups them per category in memory, also
+    # filling each technology's category cache so category_name is free.
+    queryset = TechCategory.objects.all()
+    if selection is not None:
+        queryset = queryset.only(*TECH_CATEGORY_FIELDS.columns(selection))
+    if wants(selection, 'technologies'):
+        queryset = queryset.prefetch_related(
+            technologies_prefetch(inner(selection, 'technologies'), 'technology_set', grouped=True)
+        )
+    return queryset
+
+
+def technologies_queryset(selection=None):
+    """Technology list rows, joining categories only for category_name"""
+    queryset = Technology.objects.all()
+    if wants(selection, 'category_name'):
+        queryset = queryset.select_related('category')
+    if selection is not None:
+        queryset = queryset.only(*TECHNOLOGY_FIELDS.columns(selection))
+    return queryset
+
+
+def technologies_by_project(project_ids, selection=None):
+    """{project id: [TechnologySerializer-shaped dicts]} from one query over the M2M table"""
+    keys = TECHNOLOGY_FIELDS.keys(selection)
+    rows = (
+        Project.technologies.through.objects
+        .filter(project_id__in=project_ids)
+        .order_by('technology__category__order', 'technology__name')
+        .values_list('project_id', *[f'technology__{TECHNOLOGY_FIELDS.sources[key][0]}' for key in keys])
+    )
+    grouped = {}
+    for project_id, *technology in rows:
+        grouped.setdefault(project_id, []).append(dict(zip(keys, technology)))
+    return grouped
+
+
+def project_list_rows(rows, selection=None):
+    """
+    ProjectListSerializer output for project_list_queryset rows, built
+    directly (shared with async_views)
+    """
+    if wants(selection, 'technologies'):
+        technologies = technologies_by_project([row['id'] for row in rows], inner(selection, 'technologies'))
+    else:
+        technologies = {}
+    data = []
+    for row in rows:
+        if selection is not None:
+            row = PROJECT_LIST_FIELDS.pad(row)
+        thumbnail = row['thumbnail_descriptor'] or {}
+        data.append(PROJECT_LIST_FIELDS.trim({
+            'id': row['id'],
+            'title': row['title'],
+            'slug': row['slug'],
+            'tagline': row['tagline'],
+            'thumbnail': thumbnail.get('url'),
+            'thumbnail_srcset': thumbnail.get('srcset'),
+            'technologies': technologies.get(row['id'], []),
+            'github_url': row['github_url'],
+            'live_demo_url': row['live_demo_url'],
+            'is_featured': row['is_featured'],
+            'created_at': format_datetime(row['created_at']),
+        }, selection))
+    return data
+
+
+def project_list_queryset(params, featured=None, selection=None):
+    """published_projects as values() rows, technologies left to project_list_rows"""
+    return published_projects(params, featured).prefetch_related(None).values(*PROJECT_LIST_FIELDS.columns(selection))
+
+
+def project_detail_queryset(selection=None):
+    """Published projects with the selected columns; details and technologies only when selected"""
+    queryset = Project.objects.published()
+    columns = PROJECT_DETAIL_FIELDS.columns(selection)
+    if wants(selection, 'details'):
+        queryset = queryset.select_related('details')
+        columns += PROJECT_DETAIL_FIELDS.nested['details'].columns(inner(selection, 'details'))
+    if wants(selection, 'technologies'):
+        queryset = queryset.prefetch_related(technologies_prefetch(inner(selection, 'technologies')))
+    if selection is not None:
+        queryset = queryset.only(*columns)
+    return queryset
+
+
+class ProjectPagination(KeysetPagination):
+    """Model ordering plus id, by the (priority DESC, created_at DESC, id) index"""
+    ordering = ('-priority', '-created_at', 'id')
+    count_groups = ('projects',)
+
+
+@method_decorator(conditional(project_list_validators), name='dispatch')
+@method_decorator(cache_response('projects'), name='dispatch')
+class ProjectListView(SparseFieldsViewMixin, generics.ListAPIView):
     """List all published projects with optional filtering"""
-    serializer_class = ProjectListSerializer
+    serializer_class = ProjectListSerializer  # Documents the row shape; list() builds rows directly
+    pagination_class = ProjectPagination
+    fieldset = PROJECT_LIST_FIELDS
     
     def get_queryset(self):
-        queryset = Project.objects.filter(is_published=True)
-        
-        # Filter by featured projects
-        featured = self.request.query_params.get('featured', None)
-        if featured == 'true':
-            queryset = queryset.filter(is_featured=True)
-        
-        # Filter by technology
-        tech = self.request.query_params.get('tech', None)
-        if tech:
-            queryset = queryset.filter(technologies__name__icontains=tech)
-        
-        return queryset.distinct()
+        return project_list_queryset(self.request.query_params, self.kwargs.get('featured'), self.selection)
+    
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        return self.get_paginated_response(project_list_rows(page, self.selection))
 
 
-class ProjectDetailView(generics.RetrieveAPIView):
+@method_decorator(conditional(project_detail_validators), name='dispatch')
+class ProjectDetailView(SparseFieldsViewMixin, generics.RetrieveAPIView):
     """Get detailed view of a single project"""
     serializer_class = ProjectDetailViewSerializer
     lookup_field = 'slug'
+    fieldset = PROJECT_DETAIL_FIELDS
     
     def get_queryset(self):
-        return Project.objects.filter(is_published=True)
+        return project_detail_queryset(self.selection)
 
 
-class TechnologyListView(generics.ListAPIView):
-    """List all technologies"""
-    queryset = Technology.objects.all()
+@method_decorator(cache_response('tech'), name='dispatch')
+class TechnologyListView(SparseFieldsViewMixin, generics.ListAPIView):
+    """List all technologies in a single joined query"""
     serializer_class = TechnologySerializer
+    pagination_class = None  # Frontend expects a flat Technology[]
+    fieldset = TECHNOLOGY_FIELDS
+    
+    def get_queryset(self):
+        return technologies_queryset(self.selection)
 
 
-class TechStackView(generics.ListAPIView):
-    """Get technologies grouped by category"""
-    queryset = TechCategory.objects.all()
+@method_decorator(conditional(tech_stack_validators), name='dispatch')
+@method_decorator(cache_response('tech'), name='dispatch')
+class TechStackView(SparseFieldsViewMixin, generics.ListAPIView):
+    """Get technologies grouped by category (two queries total)"""
     serializer_class = TechCategorySerializer
+    pagination_class = None  # Frontend expects a flat TechCategory[]
+    fieldset = TECH_CATEGORY_FIELDS
+    
+    def get_queryset(self):
+        return tech_categories(self.selection)
 
 
-@api_view(['GET'])
-def portfolio_stats(request):
-    """Portfolio statistics for homepage"""
-    try:
-        config = SiteConfiguration.objects.first()
-        
-        # Calculate dynamic stats
-        total_projects = Project.objects.filter(is_published=True).count()
-        featured_projects = Project.objects.filter(is_published=True, is_featured=True).count()
-        technologies_count = Technology.objects.count()
-        
-        stats = {
-            'total_projects': total_projects,
-            'featured_projects': featured_projects,
-            'technologies_mastered': technologies_count,
-            'years_experience': config.years_experience if config else 2,
-            'uptime_percentage': '99.9',  # Your reported uptime
-            'performance_improvement': '40'  # Your latency improvement
-        }
-        
-        return Response(stats)
-    except Exception as e:
-        return Response({
-            'total_projects': 0,
-            'featured_projects': 0,
-            'technologies_mastered': 0,
-            'years_experience': 2,
-            'uptime_percentage': '99.9',
-            'performance_improvement': '40'
-        })
-
-
+@conditional(site_metadata_validators)
+@cache_response('site_config')
 @api_view(['GET'])
 def site_metadata(request):
     """Get site configuration and metadata"""
@@ -135,25 +369,15 @@ def site_metadata(request):
         return Response({'error': 'Failed to fetch metadata'}, status=500)
 
 
+@cache_response('highlights')
 @api_view(['GET'])
 def career_highlights(request):
     """Get career highlights"""
     try:
-        highlights = CareerHighlight.objects.all()
-        data = []
-        
-        for highlight in highlights:
-            data.append({
-                'id': highlight.id,
-                'title': highlight.title,
-                'organization': highlight.organization,
-                'date_range': highlight.date_range,
-                'description': highlight.description,
-                'metrics': highlight.metrics,
-                'is_current': highlight.is_current
-            })
-        
-        return Response(data)
+        data = CareerHighlight.objects.values(
+            'id', 'title', 'organization', 'date_range', 'description', 'metrics', 'is_current'
+        )
+        return Response(list(data))
     except Exception as e:
         return Response([])
 
@@ -173,27 +397,17 @@ def contact_submit(request):
                     status=status.HTTP_400_BAD_REQUEST
                 )
         
-        # Create contact submission
-        contact = ContactSubmission.objects.create(
-            name=data['name'],
-            email=data['email'],
-            company=data.get('company', ''),
-            subject=data['subject'],
-            message=data['message']
-        )
-        
-        # Send email notification (optional)
-        if settings.RESEND_API_KEY:
-            try:
-                send_mail(
-                    subject=f"Portfolio Contact: {contact.subject}",
-                    message=f"From: {contact.name} <{contact.email}>\nCompany: {contact.company}\n\nMessage:\n{contact.message}",
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[settings.DEFAULT_FROM_EMAIL],
-                    fail_silently=True,
-                )
-            except Exception as email_error:
-                pass  # Don't fail the API call if email fails
+        # Save the submission and queue the notification together; the
+        # send_outbox worker delivers it outside the request
+        with transaction.atomic():
+            contact = ContactSubmission.objects.create(
+                name=data['name'],
+                email=data['email'],
+                company=data.get('company', ''),
+                subject=data['subject'],
+                message=data['message']
+            )
+            enqueue_contact_notification(contact)
         
         return Response(
             {'message': 'Contact form submitted successfully'}, 
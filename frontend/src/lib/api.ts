@@ -19,13 +19,22 @@ export interface TechCategory {
   technologies: Technology[];
 }
 
+export interface TocEntry {
+  id: string;
+  name: string;
+  level: number;
+  children: TocEntry[];
+}
+
 export interface Project {
   id: number;
   title: string;
   slug: string;
   tagline: string;
   thumbnail: string;
+  thumbnail_srcset?: string;
   hero_image?: string;
+  hero_image_srcset?: string;
   technologies: Technology[];
   github_url: string;
   live_demo_url: string;
@@ -46,6 +55,14 @@ export interface ProjectDetail extends Project {
     lessons_learned: string;
     code_snippets: Array<{title: string; language: string; code: string}>;
     demo_video_url: string;
+    // Sanitized HTML rendered by the backend when the project is saved
+    problem_statement_html: string;
+    solution_approach_html: string;
+    technology_justification_html: string;
+    challenges_solved_html: string;
+    lessons_learned_html: string;
+    code_snippets_html: Array<{title: string; language: string; html: string}>;
+    toc: TocEntry[];
   };
 }
 
@@ -55,14 +72,32 @@ export interface BlogPost {
   slug: string;
   excerpt: string;
   content?: string;
+  content_html?: string;
+  toc?: TocEntry[];
   category: string;
   featured_image: string;
+  featured_image_srcset?: string;
   reading_time: number;
   published_date: string;
   updated_date?: string;
   views: number;
 }
 
+export interface BlogCategory {
+  key: string;
+  name: string;
+  count: number;
+}
+
+// Keyset-paginated list (/blog/posts/, /projects/projects/): `next` and
+// `previous` are absolute URLs carrying an opaque cursor; `count` only with ?count=true
+export interface Page<T> {
+  next: string | null;
+  previous: string | null;
+  count?: number;
+  results: T[];
+}
+
 export interface CareerHighlight {
   id: number;
   title: string;
@@ -119,8 +154,10 @@ class APIClient {
   }
 
   private async request<T>(endpoint: string, options?: RequestInit): Promise<T> {
-    const url = `${this.baseURL}/api/v1${endpoint}`;
-    
+    return this.fetchJSON(`${this.baseURL}/api/v1${endpoint}`, options);
+  }
+
+  private async fetchJSON<T>(url: string, options?: RequestInit): Promise<T> {
     const response = await fetch(url, {
       headers: {
         'Content-Type': 'application/json',
@@ -136,6 +173,17 @@ class APIClient {
     return response.json();
   }
 
+  // Every item of a keyset-paginated list, following `next` to the last page
+  private async requestAll<T>(endpoint: string): Promise<T[]> {
+    let page = await this.request<Page<T>>(endpoint);
+    const items = [...page.results];
+    while (page.next) {
+      page = await this.fetchJSON<Page<T>>(page.next);
+      items.push(...page.results);
+    }
+    return items;
+  }
+
   // Health check
   async healthCheck(): Promise<{status: string; message: string}> {
     return this.request('/test/');
@@ -143,11 +191,11 @@ class APIClient {
 
   // Projects
   async getProjects(): Promise<Project[]> {
-    return this.request('/projects/');
+    return this.requestAll('/projects/');
   }
 
   async getFeaturedProjects(): Promise<Project[]> {
-    return this.request('/projects/?featured=true');
+    return this.requestAll('/projects/?featured=true');
   }
 
   async getProject(slug: string): Promise<ProjectDetail> {
@@ -178,10 +226,23 @@ class APIClient {
 
   // Blog
   async getBlogPosts(category?: string): Promise<BlogPost[]> {
+    const params = category ? `?category=${encodeURIComponent(category)}` : '';
+    return this.requestAll(`/blog/posts/${params}`);
+  }
+
+  // One page; pass the previous page's `next` (or `previous`) URL to move on
+  async getBlogPostsPage(category?: string, pageUrl?: string): Promise<Page<BlogPost>> {
+    if (pageUrl) {
+      return this.fetchJSON(pageUrl);
+    }
     const params = category ? `?category=${encodeURIComponent(category)}` : '';
     return this.request(`/blog/posts/${params}`);
   }
 
+  async getBlogCategories(): Promise<BlogCategory[]> {
+    return this.request('/blog/categories/');
+  }
+
   async getBlogPost(slug: string): Promise<BlogPost> {
     return this.request(`/blog/posts/${slug}/`);
   }
@@ -202,6 +263,10 @@ class APIClient {
 // Export singleton instance
 export const api = new APIClient(API_BASE_URL);
 
+// Named helpers for pages that import them directly
+export const getBlogPosts = (category?: string) => api.getBlogPosts(category);
+export const getBlogCategories = () => api.getBlogCategories();
+
 // Export for SWR
 export const fetcher = (url: string) => api.request(url);
 